@@ -4,12 +4,26 @@ from .base import (
     AsyncSoundDeviceStreamerBase, SoundDeviceStreamerBase
 )
 from .audiosources import (
-    FileAudioSource, AsyncFileAudioSource
+    FileAudioSource, AsyncFileAudioSource,
+    URLAudioSource, AsyncURLAudioSource,
+    SliceAudioSource, ConcatAudioSource, LoopAudioSource, ResampledAudioSource, ConvertedAudioSource,
+    TimeStretchedAudioSource,
+    negotiate_source, negotiate_dtype,
+    Mixer, MixerInput, MixerStream,
+    CrossfadeAudioSource, PlaylistAudioSource
 )
 from .streamers import (
     ThreadSoundDeviceStreamer, AsyncThreadSoundDeviceStreamer,
     CallbackSoundDeviceStreamer, AsyncCallbackSoundDeviceStreamer, CallbackSettingsFlag
 )
+from .processors import Resampler, Converter, TimeStretcher, EventScheduler, SpectrumTap, SpectrumFrame
+from .analysis import (
+    WaveformPeaks, extract_peaks, get_peaks,
+    LoudnessInfo, NormalizedAudioSource, analyze_loudness, get_loudness,
+    Fingerprint, FingerprintIndex, get_fingerprint,
+    CueInfo, CuedAudioSource, analyze_cues, get_cues
+)
+from .library import TrackInfo, LibraryScanner, LibraryIndex, TrackCatalog, ProbeInfo, CoverStore, scan_library, probe, probe_many
 from ._types import AudioSamplerate, AudioChannels, AudioDType, AudioFormat, AudioSubType, AudioEndians
 
 
@@ -20,5 +34,17 @@ __all__ = [
     'ThreadSoundDeviceStreamer', 'AsyncThreadSoundDeviceStreamer',
     'CallbackSoundDeviceStreamer', 'AsyncCallbackSoundDeviceStreamer', 'CallbackSettingsFlag',
     'FileAudioSource', 'AsyncFileAudioSource',
+    'URLAudioSource', 'AsyncURLAudioSource',
+    'SliceAudioSource', 'ConcatAudioSource', 'LoopAudioSource', 'ResampledAudioSource', 'ConvertedAudioSource',
+    'TimeStretchedAudioSource',
+    'negotiate_source', 'negotiate_dtype',
+    'Mixer', 'MixerInput', 'MixerStream',
+    'CrossfadeAudioSource', 'PlaylistAudioSource',
+    'Resampler', 'Converter', 'TimeStretcher', 'EventScheduler', 'SpectrumTap', 'SpectrumFrame',
+    'WaveformPeaks', 'extract_peaks', 'get_peaks',
+    'LoudnessInfo', 'NormalizedAudioSource', 'analyze_loudness', 'get_loudness',
+    'Fingerprint', 'FingerprintIndex', 'get_fingerprint',
+    'CueInfo', 'CuedAudioSource', 'analyze_cues', 'get_cues',
+    'TrackInfo', 'LibraryScanner', 'LibraryIndex', 'TrackCatalog', 'ProbeInfo', 'CoverStore', 'scan_library', 'probe', 'probe_many',
     'AudioSamplerate', 'AudioChannels', 'AudioDType', 'AudioFormat', 'AudioSubType', 'AudioEndians'
 ]
\ No newline at end of file
@@ -0,0 +1,22 @@
+from .cache import CACHE_DIRPATH, get_file_key, get_cache_filepath
+from .peaks import WaveformPeaks, PEAKS_BIN_SIZE, extract_peaks, get_peaks, get_peaks_many
+from .loudness import (
+    LoudnessInfo, LoudnessMeter, KWeighting, NormalizedAudioSource, LOUDNESS_TARGET,
+    get_k_weighting_coefficients, analyze_loudness, load_loudness, get_loudness, get_loudness_many
+)
+from .fingerprint import (
+    Fingerprint, FingerprintIndex, DUPLICATE_THRESHOLD, extract_fingerprint, get_fingerprint, get_fingerprints_many
+)
+from .cues import (
+    CueInfo, CuedAudioSource, CUE_THRESHOLD, CUE_SEGUE_THRESHOLD, analyze_cues, load_cues, get_cues, get_cues_many
+)
+
+
+__all__ = [
+    'CACHE_DIRPATH', 'get_file_key', 'get_cache_filepath',
+    'WaveformPeaks', 'PEAKS_BIN_SIZE', 'extract_peaks', 'get_peaks', 'get_peaks_many',
+    'LoudnessInfo', 'LoudnessMeter', 'KWeighting', 'NormalizedAudioSource', 'LOUDNESS_TARGET',
+    'get_k_weighting_coefficients', 'analyze_loudness', 'load_loudness', 'get_loudness', 'get_loudness_many',
+    'Fingerprint', 'FingerprintIndex', 'DUPLICATE_THRESHOLD', 'extract_fingerprint', 'get_fingerprint', 'get_fingerprints_many',
+    'CueInfo', 'CuedAudioSource', 'CUE_THRESHOLD', 'CUE_SEGUE_THRESHOLD', 'analyze_cues', 'load_cues', 'get_cues', 'get_cues_many'
+]
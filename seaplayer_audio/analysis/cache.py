@@ -0,0 +1,29 @@
+import os
+import hashlib
+import threading
+from pathlib import Path
+# > Typing
+from typing_extensions import Optional, Union
+
+# ! Constants
+
+CACHE_DIRPATH = os.environ.get('SEAPLAYER_AUDIO_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'seaplayer-audio'))
+
+# ! Functions
+
+def get_file_key(filepath: Union[str, Path]) -> str:
+    """The key of the file contents: changes when the file is replaced, resized or modified."""
+    stat = os.stat(filepath)
+    return hashlib.sha1(f"{os.path.abspath(filepath)}\0{stat.st_size}\0{stat.st_mtime_ns}".encode('utf-8')).hexdigest()
+
+def get_cache_filepath(filepath: Union[str, Path], kind: str, suffix: str, cache_dirpath: Optional[Union[str, Path]]=None) -> str:
+    """The path of the cached `kind` data of the file (`<cache>/<kind>/<key><suffix>`)."""
+    return os.path.join(cache_dirpath or CACHE_DIRPATH, kind, get_file_key(filepath) + suffix)
+
+def write_atomic(filepath: Union[str, Path], data: bytes) -> None:
+    """Write the file through a temporary one, so the readers never see it half-written."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temp = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, 'wb') as file:
+        file.write(data)
+    os.replace(temp, filepath)
@@ -0,0 +1,193 @@
+import os
+import json
+import numpy as np
+from numpy import ndarray
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+# > Typing
+from typing_extensions import Dict, Iterable, Optional, Union
+# > Local Imports
+from .._types import AudioSamplerate
+from ..base import AudioSourceBase
+from ..audiosources import FileAudioSource, SliceAudioSource
+from ..audiosources.virtualaudiosource import read_into
+from .cache import get_cache_filepath, write_atomic
+
+# ! Constants
+
+# * The RMS levels (dBFS) of the windows: below `CUE_THRESHOLD` is silence, the track segues
+# * into the next one after its last window above `CUE_SEGUE_THRESHOLD`.
+CUE_THRESHOLD = -50.0
+CUE_SEGUE_THRESHOLD = -30.0
+CUE_WINDOW = 0.01
+CUE_BLOCK_WINDOWS = 200
+
+# ! Cue Info Class
+@dataclass(frozen=True)
+class CueInfo:
+    """The cue points of a track in frames.
+    
+    The sound is between `cue_in` and `cue_out`, the next track may start at `segue`.
+    A silent track has `cue_in == cue_out`.
+    """
+    cue_in: int
+    cue_out: int
+    segue: int
+    samplerate: AudioSamplerate
+    frames: int
+    threshold: float=CUE_THRESHOLD
+    segue_threshold: float=CUE_SEGUE_THRESHOLD
+    
+    @property
+    def duration(self) -> float:
+        """The duration between the cue points in seconds."""
+        return (self.cue_out - self.cue_in) / self.samplerate
+
+# ! Cued Audio Source Class
+class CuedAudioSource(SliceAudioSource):
+    """The source played from its `cue_in` (and to its `cue_out` with `trim_end`) with its stored cue points (see `get_cues`).
+    
+    The source is seeked to the cue point, so nothing before it is decoded. Without stored cue points,
+    the file is analyzed at the opening (with `analyze`) or played as it is. The `segue` is in the frames of this source.
+    """
+    
+    def __init__(
+        self,
+        source: AudioSourceBase,
+        trim_end: bool=True,
+        analyze: bool=True,
+        cache_dirpath: Optional[Union[str, Path]]=None,
+        threshold: float=CUE_THRESHOLD,
+        segue_threshold: float=CUE_SEGUE_THRESHOLD,
+        closefd: bool=False
+    ) -> None:
+        self.info: Optional[CueInfo] = None
+        name = getattr(source, 'name', None)
+        if isinstance(name, str) and os.path.isfile(name):
+            if analyze:
+                self.info = get_cues(name, cache_dirpath, threshold, segue_threshold)
+            else:
+                self.info = load_cues(name, cache_dirpath, threshold, segue_threshold)
+        if self.info is not None:
+            super().__init__(source, self.info.cue_in, self.info.cue_out if trim_end else None, closefd)
+            self.segue = min(self.info.segue, self.stop) - self.start
+        else:
+            super().__init__(source, 0, None, closefd)
+            self.segue = self.frames
+
+# ! Functions
+
+def get_window_levels(data: ndarray, window: int) -> ndarray:
+    """The RMS levels (dBFS) of the windows of `window` frames of the `frames x channels` block (the last one may be shorter)."""
+    full = len(data) // window
+    squares = np.empty(full + (len(data) > full * window), np.float64)
+    windows = data[:full * window].reshape(full, window * data.shape[1])
+    np.einsum('ij,ij->i', windows, windows, out=squares[:full], dtype=np.float64)
+    squares[:full] /= window * data.shape[1]
+    if len(squares) > full:
+        squares[full] = np.square(data[full * window:], dtype=np.float64).mean()
+    return 10 * np.log10(np.maximum(squares, 1e-20))
+
+def analyze_cues(
+    source: Union[AudioSourceBase, str, Path],
+    threshold: float=CUE_THRESHOLD,
+    segue_threshold: float=CUE_SEGUE_THRESHOLD,
+    block_windows: int=CUE_BLOCK_WINDOWS
+) -> CueInfo:
+    """Find the cue points of the (seekable) source, decoding only its ends. A path is opened and closed after.
+    
+    The source is read by blocks of `block_windows` windows of `CUE_WINDOW` seconds: forwards from the start
+    until a window is above the `threshold`, then backwards from the end (seeking to every block)
+    until a window is above the `segue_threshold`, so the memory is one block whatever the length.
+    """
+    if not isinstance(source, AudioSourceBase):
+        with FileAudioSource(source) as file:
+            return analyze_cues(file, threshold, segue_threshold, block_windows)
+    frames, channels = source.frames, source.channels
+    window = max(int(round(source.samplerate * CUE_WINDOW)), 1)
+    block = np.empty((window * block_windows, channels), np.float32)
+    cue_in, position = None, 0
+    source.seek(0)
+    while (cue_in is None) and (position < frames):
+        if (count := read_into(source, block)) == 0:
+            break
+        above = np.flatnonzero(get_window_levels(block[:count], window) > threshold)
+        if len(above) > 0:
+            cue_in = position + int(above[0]) * window
+        position += count
+    if cue_in is None:
+        return CueInfo(0, 0, 0, source.samplerate, frames, threshold, segue_threshold)
+    cue_out, segue, end = None, None, frames
+    while (segue is None) and (end > cue_in):
+        start = max(end - len(block), cue_in)
+        source.seek(start)
+        count = read_into(source, block[:end - start])
+        # * The windows are counted from the end of the block, which is where the search goes from.
+        levels = get_window_levels(block[:count][::-1], window)
+        if (cue_out is None) and (len(above := np.flatnonzero(levels > threshold)) > 0):
+            cue_out = start + count - int(above[0]) * window
+        if len(above := np.flatnonzero(levels > segue_threshold)) > 0:
+            segue = start + count - int(above[0]) * window
+        end = start
+    cue_out = frames if (cue_out is None) else cue_out
+    return CueInfo(cue_in, cue_out, cue_out if (segue is None) else segue, source.samplerate, frames, threshold, segue_threshold)
+
+def load_cues(
+    filepath: Union[str, Path],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    threshold: float=CUE_THRESHOLD,
+    segue_threshold: float=CUE_SEGUE_THRESHOLD
+) -> Optional[CueInfo]:
+    """The stored cue points of the file for the thresholds, if the file has not changed since."""
+    try:
+        with open(get_cache_filepath(filepath, 'cues', '.json', cache_dirpath), 'r', encoding='utf-8') as file:
+            info = CueInfo(**json.load(file))
+    except (OSError, ValueError, TypeError):
+        return None
+    if (info.threshold != threshold) or (info.segue_threshold != segue_threshold):
+        return None
+    return info
+
+def get_cues(
+    filepath: Union[str, Path],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    threshold: float=CUE_THRESHOLD,
+    segue_threshold: float=CUE_SEGUE_THRESHOLD
+) -> CueInfo:
+    """The cue points of the file, from the cache or found and stored."""
+    if (info := load_cues(filepath, cache_dirpath, threshold, segue_threshold)) is not None:
+        return info
+    info = analyze_cues(filepath, threshold, segue_threshold)
+    write_atomic(get_cache_filepath(filepath, 'cues', '.json', cache_dirpath), json.dumps(asdict(info)).encode('utf-8'))
+    return info
+
+def get_cues_many(
+    filepaths: Iterable[Union[str, Path]],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    threshold: float=CUE_THRESHOLD,
+    segue_threshold: float=CUE_SEGUE_THRESHOLD,
+    workers: Optional[int]=None
+) -> Dict[str, Union[CueInfo, Exception]]:
+    """The cue points of the files, the missing ones are found in parallel processes.
+    
+    Returns:
+        Dict[str, Union[CueInfo, Exception]]: The cue points or the error of every file.
+    """
+    filepaths = [str(filepath) for filepath in filepaths]
+    results: Dict[str, Union[CueInfo, Exception]] = {}
+    missing = []
+    for filepath in filepaths:
+        if (info := load_cues(filepath, cache_dirpath, threshold, segue_threshold)) is not None:
+            results[filepath] = info
+        else:
+            missing.append(filepath)
+    if len(missing) > 0:
+        with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(missing))) as executor:
+            futures = [executor.submit(get_cues, filepath, cache_dirpath, threshold, segue_threshold) for filepath in missing]
+            for filepath, future in zip(missing, futures):
+                try:
+                    results[filepath] = future.result()
+                except Exception as e:
+                    results[filepath] = e
+    return {filepath: results[filepath] for filepath in filepaths}
@@ -0,0 +1,242 @@
+import os
+import numpy as np
+from numpy import ndarray
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from numpy.lib.stride_tricks import sliding_window_view
+# > Typing
+from typing_extensions import Dict, Hashable, Iterable, List, Optional, Self, Tuple, Union
+# > Local Imports
+from ..base import AudioSourceBase
+from ..audiosources import FileAudioSource, ConvertedAudioSource, ResampledAudioSource, SliceAudioSource
+from ..audiosources.virtualaudiosource import read_into
+from .cache import get_cache_filepath, write_atomic
+
+# ! Constants
+
+FINGERPRINT_SAMPLERATE = 11025
+FINGERPRINT_FRAME_SIZE = 4096
+FINGERPRINT_HOP_SIZE = 256
+FINGERPRINT_DURATION = 120.0
+FINGERPRINT_CHUNK_FRAMES = 512
+# * 33 bands between 300 and 2000 Hz give the 32 bits of a sub-fingerprint (Haitsma & Kalker).
+FINGERPRINT_BANDS = np.geomspace(300.0, 2000.0, 34)
+# * Only the hashes with the top bits of their mix equal to zero are indexed, the choice depends
+# * on the hash only, so it is the same for all the copies of a recording whatever their alignment.
+INDEX_SAMPLING_BITS = 4
+INDEX_MIX = np.uint32(0x9E3779B1)
+DUPLICATE_THRESHOLD = 0.05
+
+# ! Fingerprint Class
+@dataclass(frozen=True)
+class Fingerprint:
+    """The sub-fingerprints of a recording: 32 bits of band energy changes every `FINGERPRINT_HOP_SIZE` frames.
+    
+    The copies of a recording in other formats and bitrates differ in a few bits of every hash,
+    see `similarity`, and share many hashes exactly, which is what the `FingerprintIndex` looks up.
+    """
+    hashes: ndarray
+    duration: float
+    
+    # ^ Class Methods
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        duration = float(np.frombuffer(data, '<f8', 1)[0])
+        return cls(np.frombuffer(data, '<u4', offset=8).astype(np.uint32), duration)
+    
+    # ^ Methods
+    
+    def to_bytes(self) -> bytes:
+        return np.array([self.duration], '<f8').tobytes() + self.hashes.astype('<u4').tobytes()
+    
+    def similarity(self, other: 'Fingerprint', max_offset: int=64) -> float:
+        """The share of the equal bits of the hashes at the best alignment (about 0.5 for unrelated noise)."""
+        best = 0.0
+        for offset in range(-max_offset, max_offset + 1):
+            a = self.hashes[max(offset, 0):]
+            b = other.hashes[max(-offset, 0):]
+            size = min(len(a), len(b))
+            if size < 16:
+                continue
+            errors = np.bitwise_count(np.bitwise_xor(a[:size], b[:size])).sum()
+            best = max(best, 1.0 - errors / (size * 32))
+        return best
+
+# ! Fingerprint Index Class
+class FingerprintIndex:
+    """Finds the recordings sharing hashes at a consistent alignment with a fingerprint.
+    
+    The sampled hashes of all the fingerprints are kept in sorted arrays of `(hash, key, position)`,
+    so a query is a binary search per hash (`O(h log n)`) and a vote of the matches by the key
+    and the offset between the positions, instead of a comparison with every fingerprint.
+    """
+    
+    def __init__(self) -> None:
+        self.keys: List[Hashable] = []
+        self.lengths: List[int] = []
+        self.__parts: List[Tuple[ndarray, ndarray, ndarray]] = []
+        self.__hashes = np.empty(0, np.uint32)
+        self.__ids = np.empty(0, np.int32)
+        self.__positions = np.empty(0, np.int32)
+    
+    # ^ Magic Methods
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    # ^ Hidden Methods
+    
+    def __build(self) -> None:
+        if len(self.__parts) > 0:
+            hashes, ids, positions = zip(*self.__parts)
+            hashes = np.concatenate((self.__hashes,) + hashes)
+            order = np.argsort(hashes, kind='stable')
+            self.__hashes = hashes[order]
+            self.__ids = np.concatenate((self.__ids,) + ids)[order]
+            self.__positions = np.concatenate((self.__positions,) + positions)[order]
+            self.__parts.clear()
+    
+    # ^ Methods
+    
+    def add(self, key: Hashable, fingerprint: Fingerprint) -> None:
+        positions = get_sampled_positions(fingerprint.hashes)
+        self.__parts.append((fingerprint.hashes[positions], np.full(len(positions), len(self.keys), np.int32), positions.astype(np.int32)))
+        self.keys.append(key)
+        self.lengths.append(len(positions))
+    
+    def query(self, fingerprint: Fingerprint, threshold: float=DUPLICATE_THRESHOLD, exclude: Optional[Hashable]=None) -> List[Tuple[Hashable, float]]:
+        """The keys of the recordings matching the fingerprint with their scores, from the best one.
+        
+        The score is the share of the sampled hashes matching at the best offset.
+        """
+        self.__build()
+        positions = get_sampled_positions(fingerprint.hashes)
+        hashes = fingerprint.hashes[positions]
+        starts = np.searchsorted(self.__hashes, hashes, 'left')
+        ends = np.searchsorted(self.__hashes, hashes, 'right')
+        counts = ends - starts
+        if counts.sum() == 0:
+            return []
+        matched = np.repeat(np.arange(len(hashes)), counts)
+        indices = np.repeat(ends - counts.cumsum(), counts) + np.arange(counts.sum())
+        ids = self.__ids[indices].astype(np.int64)
+        offsets = self.__positions[indices].astype(np.int64) - positions[matched]
+        pairs, votes = np.unique((ids << 32) + (offsets + (1 << 31)), return_counts=True)
+        best: Dict[int, int] = {}
+        for pair, vote in zip((pairs >> 32).tolist(), votes.tolist()):
+            best[pair] = max(best.get(pair, 0), vote)
+        results = []
+        for index, vote in best.items():
+            score = vote / max(min(len(hashes), self.lengths[index]), 1)
+            if (score >= threshold) and (self.keys[index] != exclude):
+                results.append((self.keys[index], score))
+        return sorted(results, key=lambda item: -item[1])
+    
+    def find_duplicates(self, fingerprints: Dict[Hashable, Fingerprint], threshold: float=DUPLICATE_THRESHOLD) -> List[List[Hashable]]:
+        """The groups of the keys of the same recordings among the indexed `fingerprints`."""
+        parents: Dict[Hashable, Hashable] = {}
+        
+        def find(key: Hashable) -> Hashable:
+            while parents.get(key, key) != key:
+                parents[key] = parents.get(parents[key], parents[key])
+                key = parents[key]
+            return key
+        
+        for key, fingerprint in fingerprints.items():
+            for other, _ in self.query(fingerprint, threshold, key):
+                parents[find(other)] = find(key)
+        groups: Dict[Hashable, List[Hashable]] = {}
+        for key in fingerprints:
+            groups.setdefault(find(key), []).append(key)
+        return [group for group in groups.values() if (len(group) > 1)]
+
+# ! Functions
+
+def get_sampled_positions(hashes: ndarray) -> ndarray:
+    """The positions of the hashes kept by the index."""
+    mixed = np.multiply(hashes, INDEX_MIX, dtype=np.uint32)
+    return np.flatnonzero((mixed >> np.uint32(32 - INDEX_SAMPLING_BITS)) == 0)
+
+def get_band_bits(energies: ndarray) -> ndarray:
+    """The hashes of the `frames x 33` band energies: the signs of the changes of the band differences in time."""
+    differences = energies[:, :-1] - energies[:, 1:]
+    bits = (differences[1:] - differences[:-1]) > 0
+    return (bits.astype(np.uint32) << np.arange(32, dtype=np.uint32)).sum(axis=1, dtype=np.uint32)
+
+def extract_fingerprint(source: Union[AudioSourceBase, str, Path], duration: float=FINGERPRINT_DURATION) -> Fingerprint:
+    """The fingerprint of the first `duration` seconds of the source (from its position), in one decoding pass.
+    
+    The source is mixed down to mono and resampled to `FINGERPRINT_SAMPLERATE`, the frames
+    are transformed by chunks of `FINGERPRINT_CHUNK_FRAMES` at once. A path is opened and closed after.
+    """
+    if not isinstance(source, AudioSourceBase):
+        with FileAudioSource(source) as file:
+            return extract_fingerprint(file, duration)
+    if (duration > 0) and (source.frames > 0):
+        source = SliceAudioSource(source, source.tell(), min(source.frames, source.tell() + int(duration * source.samplerate)))
+    if source.channels != 1:
+        source = ConvertedAudioSource(source, 1)
+    if source.samplerate != FINGERPRINT_SAMPLERATE:
+        source = ResampledAudioSource(source, FINGERPRINT_SAMPLERATE, 'fast')
+    window = np.hanning(FINGERPRINT_FRAME_SIZE).astype(np.float32)
+    frequencies = np.fft.rfftfreq(FINGERPRINT_FRAME_SIZE, 1 / FINGERPRINT_SAMPLERATE)
+    edges = np.searchsorted(frequencies, FINGERPRINT_BANDS)
+    step = FINGERPRINT_CHUNK_FRAMES * FINGERPRINT_HOP_SIZE
+    buffer = np.zeros((FINGERPRINT_FRAME_SIZE - FINGERPRINT_HOP_SIZE + step, 1), np.float32)
+    filled, total = 0, 0
+    energies: List[ndarray] = []
+    while True:
+        count = read_into(source, buffer[filled:])
+        filled += count
+        total += count
+        if filled >= FINGERPRINT_FRAME_SIZE:
+            frames = sliding_window_view(buffer[:filled, 0], FINGERPRINT_FRAME_SIZE)[::FINGERPRINT_HOP_SIZE]
+            power = np.square(np.abs(np.fft.rfft(frames * window, axis=1)))
+            energies.append(np.add.reduceat(power, edges[:-1], axis=1)[:, :len(edges) - 1])
+            used = len(frames) * FINGERPRINT_HOP_SIZE
+            buffer[:filled - used] = buffer[used:filled]
+            filled -= used
+        if count == 0:
+            break
+    if len(energies) == 0:
+        return Fingerprint(np.empty(0, np.uint32), total / FINGERPRINT_SAMPLERATE)
+    return Fingerprint(get_band_bits(np.concatenate(energies)), total / FINGERPRINT_SAMPLERATE)
+
+def get_fingerprint(filepath: Union[str, Path], cache_dirpath: Optional[Union[str, Path]]=None) -> Fingerprint:
+    """The fingerprint of the file, from the cache or extracted and stored."""
+    cache_filepath = get_cache_filepath(filepath, 'fingerprints', '.fp', cache_dirpath)
+    if os.path.exists(cache_filepath):
+        try:
+            with open(cache_filepath, 'rb') as file:
+                return Fingerprint.from_bytes(file.read())
+        except (OSError, ValueError):
+            pass
+    fingerprint = extract_fingerprint(filepath)
+    write_atomic(cache_filepath, fingerprint.to_bytes())
+    return fingerprint
+
+def _get_fingerprint_safe(filepath: str, cache_dirpath: Optional[Union[str, Path]]) -> Union[Fingerprint, Exception]:
+    try:
+        return get_fingerprint(filepath, cache_dirpath)
+    except Exception as e:
+        return e
+
+def get_fingerprints_many(
+    filepaths: Iterable[Union[str, Path]],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    workers: Optional[int]=None,
+    chunksize: int=16
+) -> Dict[str, Union[Fingerprint, Exception]]:
+    """The fingerprints of the files extracted in parallel processes (the files are sent by `chunksize`).
+    
+    Returns:
+        Dict[str, Union[Fingerprint, Exception]]: The fingerprint or the error of every file.
+    """
+    filepaths = [str(filepath) for filepath in filepaths]
+    if len(filepaths) == 0:
+        return {}
+    with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(filepaths))) as executor:
+        results = executor.map(_get_fingerprint_safe, filepaths, [cache_dirpath] * len(filepaths), chunksize=chunksize)
+        return dict(zip(filepaths, results))
@@ -0,0 +1,264 @@
+import os
+import json
+import math
+import numpy as np
+from numpy import ndarray
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+# > Typing
+from typing_extensions import Dict, Iterable, List, Optional, Tuple, Union
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+from ..base import AudioSourceBase
+from ..audiosources import FileAudioSource, VirtualAudioSource
+from ..audiosources.virtualaudiosource import read_into
+from ..processors import BiquadEQ, BiquadCascade, EQBand, Resampler, CHANNEL_LAYOUTS, convert_samples
+from .cache import get_cache_filepath, write_atomic
+
+# ! Constants
+
+# * The ReplayGain 2.0 reference level, the EBU R128 one is -23.0 LUFS.
+LOUDNESS_TARGET = -18.0
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+# * The gating blocks of 400 ms overlapping by 75 %, measured by the steps of 100 ms.
+GATE_STEPS = 4
+LOUDNESS_BLOCK_SIZE = 8192
+# * The K-weighting of ITU-R BS.1770: the head shelving filter and the RLB high-pass.
+K_WEIGHTING = (
+    EQBand('highshelf', 1681.974450955533, 3.999843853973347, 0.7071752369554196),
+    EQBand('highpass', 38.13547087602444, 0.0, 0.5003270373238773),
+)
+# * The weights of the surround channels, the LFE is not measured.
+CHANNEL_WEIGHTS = {'Ls': 1.41, 'Rs': 1.41, 'Lb': 1.41, 'Rb': 1.41, 'LFE': 0.0}
+NORMALIZE_BLOCK_SIZE = 8192
+
+# ! K-Weighting Class
+class KWeighting(BiquadEQ):
+    """The K-weighting filter of ITU-R BS.1770, run by the block filtering of the `BiquadEQ`."""
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels) -> None:
+        super().__init__(samplerate, channels, K_WEIGHTING)
+    
+    def prepare(self, params: Tuple[EQBand, ...]) -> BiquadCascade:
+        return BiquadCascade(get_k_weighting_coefficients(self.samplerate))
+
+# ! Loudness Info Class
+@dataclass(frozen=True)
+class LoudnessInfo:
+    """The loudness of a track (ITU-R BS.1770-4 / EBU R128)."""
+    integrated: float
+    true_peak: float
+    sample_peak: float
+    samplerate: AudioSamplerate
+    frames: int
+    
+    @property
+    def true_peak_db(self) -> float:
+        return 20 * math.log10(max(self.true_peak, 1e-9))
+    
+    def get_gain_db(self, target: float=LOUDNESS_TARGET, prevent_clipping: bool=True) -> float:
+        """The gain (in dB) bringing the track to the `target` loudness (like the ReplayGain track gain)."""
+        if not math.isfinite(self.integrated):
+            return 0.0
+        gain = target - self.integrated
+        if prevent_clipping and (self.true_peak > 0):
+            gain = min(gain, -self.true_peak_db)
+        return gain
+    
+    def get_gain(self, target: float=LOUDNESS_TARGET, prevent_clipping: bool=True) -> float:
+        return 10 ** (self.get_gain_db(target, prevent_clipping) / 20)
+
+# ! Loudness Meter Class
+class LoudnessMeter:
+    """A streaming meter of the integrated loudness and the true peak, fed with `frames x channels` float blocks.
+    
+    The blocks are K-weighted by the `KWeighting` biquad cascade and reduced to the mean squares
+    of the steps of 100 ms at once; the gated 400 ms blocks are built from the steps at the end.
+    The true peak is the peak of the signal oversampled by the `Resampler` (4x below 96 kHz).
+    """
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.step = int(round(samplerate / 10))
+        layout = CHANNEL_LAYOUTS.get(channels, ())
+        self.weights = np.array([CHANNEL_WEIGHTS.get(speaker, 1.0) for speaker in layout] if (len(layout) == channels) else [1.0] * channels)
+        self.filter = KWeighting(samplerate, channels)
+        self.oversampling = 4 if (samplerate < 96000) else (2 if (samplerate < 192000) else 1)
+        self.resampler = Resampler(samplerate, samplerate * self.oversampling, channels, 'fast') if (self.oversampling > 1) else None
+        self.frames = 0
+        self.sample_peak = 0.0
+        self.true_peak = 0.0
+        self.__steps: List[ndarray] = []
+        self.__pending = np.empty((0, channels), np.float64)
+    
+    # ^ Hidden Methods
+    
+    def __peak(self, data: ndarray) -> None:
+        if len(data) > 0:
+            self.true_peak = max(self.true_peak, float(np.abs(data).max()))
+    
+    # ^ Methods
+    
+    def process(self, block: ndarray) -> None:
+        block = block.reshape(len(block), self.channels)
+        if len(block) == 0:
+            return
+        self.frames += len(block)
+        self.sample_peak = max(self.sample_peak, float(np.abs(block).max()))
+        self.__peak(block if (self.resampler is None) else self.resampler.process(block))
+        weighted = self.filter.process(block.astype(np.float64))
+        if len(self.__pending) > 0:
+            weighted = np.concatenate([self.__pending, weighted])
+        count = len(weighted) // self.step
+        squares = np.square(weighted[:count * self.step]).reshape(count, self.step, self.channels)
+        self.__steps.append(squares.mean(axis=1))
+        self.__pending = weighted[count * self.step:]
+    
+    def get_info(self) -> LoudnessInfo:
+        """The loudness of everything processed so far."""
+        if self.resampler is not None:
+            self.__peak(self.resampler.flush())
+            self.resampler.reset()
+        self.true_peak = max(self.true_peak, self.sample_peak)
+        steps = np.concatenate(self.__steps) if (len(self.__steps) > 0) else np.empty((0, self.channels))
+        if len(steps) >= GATE_STEPS:
+            window = np.lib.stride_tricks.sliding_window_view(steps, GATE_STEPS, axis=0)
+            energies = window.mean(axis=2) @ self.weights
+        else:
+            energies = np.empty(0)
+        loudness = -0.691 + 10 * np.log10(np.maximum(energies, 1e-20))
+        gated = energies[loudness > ABSOLUTE_GATE]
+        integrated = -math.inf
+        if len(gated) > 0:
+            threshold = -0.691 + 10 * math.log10(gated.mean()) + RELATIVE_GATE
+            gated = energies[(loudness > ABSOLUTE_GATE) & (loudness > threshold)]
+            integrated = -0.691 + 10 * math.log10(gated.mean())
+        return LoudnessInfo(integrated, self.true_peak, self.sample_peak, self.samplerate, self.frames)
+
+# ! Normalized Audio Source Class
+class NormalizedAudioSource(VirtualAudioSource):
+    """The source played at the `target` loudness with the gain of its stored analysis (see `get_loudness`).
+    
+    Without a stored analysis, the file is analyzed at the opening (with `analyze`) or played as it is.
+    """
+    
+    def __init__(
+        self,
+        source: AudioSourceBase,
+        target: float=LOUDNESS_TARGET,
+        prevent_clipping: bool=True,
+        analyze: bool=True,
+        cache_dirpath: Optional[Union[str, Path]]=None,
+        block_size: int=NORMALIZE_BLOCK_SIZE,
+        closefd: bool=False
+    ) -> None:
+        super().__init__(source, closefd)
+        self.info: Optional[LoudnessInfo] = None
+        if isinstance(self.name, str) and os.path.isfile(self.name):
+            if analyze:
+                self.info = get_loudness(self.name, cache_dirpath)
+            else:
+                self.info = load_loudness(self.name, cache_dirpath)
+        self.gain = self.info.get_gain(target, prevent_clipping) if (self.info is not None) else 1.0
+        self.__block = np.empty((block_size, source.channels), np.float32)
+    
+    def _readinto(self, out: ndarray) -> int:
+        if self.source.tell() != self._pos:
+            self.source.seek(self._pos)
+        done = 0
+        while done < len(out):
+            block = self.__block[:len(out) - done]
+            count = read_into(self.source, block)
+            np.multiply(block[:count], self.gain, out=block[:count])
+            convert_samples(block[:count], out[done:done + count])
+            done += count
+            if count < len(block):
+                break
+        self._pos += done
+        return done
+    
+    @property
+    def frames(self) -> int:
+        return self.source.frames
+
+# ! Functions
+
+def get_k_weighting_coefficients(samplerate: AudioSamplerate) -> ndarray:
+    """The `(b0, b1, b2, a1, a2)` of the K-weighting sections at the samplerate (the formulas of libebur128).
+    
+    They match the coefficients of BS.1770 at 48 kHz exactly, unlike the cookbook shelf of the same parameters.
+    """
+    shelf, highpass = K_WEIGHTING
+    k = math.tan(math.pi * shelf.frequency / samplerate)
+    vh = 10 ** (shelf.gain / 20)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / shelf.q + k * k
+    first = ((vh + vb * k / shelf.q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / shelf.q + k * k) / a0, 2 * (k * k - 1) / a0, (1 - k / shelf.q + k * k) / a0)
+    k = math.tan(math.pi * highpass.frequency / samplerate)
+    a0 = 1 + k / highpass.q + k * k
+    second = (1.0, -2.0, 1.0, 2 * (k * k - 1) / a0, (1 - k / highpass.q + k * k) / a0)
+    return np.array([first, second], np.float64)
+
+def analyze_loudness(source: Union[AudioSourceBase, str, Path], block_size: int=LOUDNESS_BLOCK_SIZE) -> LoudnessInfo:
+    """Measure the source (from its position) in one decoding pass. A path is opened and closed after."""
+    if not isinstance(source, AudioSourceBase):
+        with FileAudioSource(source) as file:
+            return analyze_loudness(file, block_size)
+    meter = LoudnessMeter(source.samplerate, source.channels)
+    block = np.empty((block_size, source.channels), np.float32)
+    while (count := read_into(source, block)) > 0:
+        meter.process(block[:count])
+        if count < len(block):
+            break
+    return meter.get_info()
+
+def load_loudness(filepath: Union[str, Path], cache_dirpath: Optional[Union[str, Path]]=None) -> Optional[LoudnessInfo]:
+    """The stored analysis of the file, if the file has not changed since it."""
+    try:
+        with open(get_cache_filepath(filepath, 'loudness', '.json', cache_dirpath), 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        data['integrated'] = -math.inf if (data['integrated'] is None) else data['integrated']
+        return LoudnessInfo(**data)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+def get_loudness(filepath: Union[str, Path], cache_dirpath: Optional[Union[str, Path]]=None) -> LoudnessInfo:
+    """The analysis of the file, from the cache or measured and stored."""
+    if (info := load_loudness(filepath, cache_dirpath)) is not None:
+        return info
+    info = analyze_loudness(filepath)
+    # * The silence is stored with `null` instead of `-Infinity`, which is not a valid JSON.
+    data = {key: (value if ((not isinstance(value, float)) or math.isfinite(value)) else None) for key, value in asdict(info).items()}
+    write_atomic(get_cache_filepath(filepath, 'loudness', '.json', cache_dirpath), json.dumps(data).encode('utf-8'))
+    return info
+
+def get_loudness_many(
+    filepaths: Iterable[Union[str, Path]],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    workers: Optional[int]=None
+) -> Dict[str, Union[LoudnessInfo, Exception]]:
+    """The analyses of the files, the missing ones are measured in parallel processes.
+    
+    Returns:
+        Dict[str, Union[LoudnessInfo, Exception]]: The analysis or the error of every file.
+    """
+    filepaths = [str(filepath) for filepath in filepaths]
+    results: Dict[str, Union[LoudnessInfo, Exception]] = {}
+    missing = []
+    for filepath in filepaths:
+        if (info := load_loudness(filepath, cache_dirpath)) is not None:
+            results[filepath] = info
+        else:
+            missing.append(filepath)
+    if len(missing) > 0:
+        with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(missing))) as executor:
+            futures = [executor.submit(get_loudness, filepath, cache_dirpath) for filepath in missing]
+            for filepath, future in zip(missing, futures):
+                try:
+                    results[filepath] = future.result()
+                except Exception as e:
+                    results[filepath] = e
+    return {filepath: results[filepath] for filepath in filepaths}
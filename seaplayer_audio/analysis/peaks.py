@@ -0,0 +1,198 @@
+import os
+import struct
+import numpy as np
+from numpy import ndarray
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+# > Typing
+from typing_extensions import Dict, Iterable, List, Optional, Self, Union
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+from ..base import AudioSourceBase
+from ..audiosources import FileAudioSource
+from ..audiosources.virtualaudiosource import read_into
+from .cache import get_cache_filepath, write_atomic
+
+# ! Constants
+
+PEAKS_MAGIC = b'SPPK'
+PEAKS_VERSION = 1
+# * The magic, version, channels, samplerate, bin size, frames and the number of levels.
+PEAKS_HEADER = struct.Struct('<4sHHIIqH')
+PEAKS_BIN_SIZE = 256
+PEAKS_BLOCK_BINS = 256
+PEAKS_SCALE = 32767
+
+# ! Waveform Peaks Class
+class WaveformPeaks:
+    """The min/max/RMS overview of a track, in a pyramid of levels (like mipmaps).
+    
+    The level `0` keeps the values of every `bin_size` frames, every next level merges
+    the pairs of bins of the previous one. A view of any zoom is built from the coarsest level
+    with bins not wider than a pixel, so it reads less than two bins per pixel whatever the track length.
+    The values are kept as int16 (the full scale is `PEAKS_SCALE`), a level is `bins x channels x 3` (min, max, RMS).
+    """
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels, frames: int, bin_size: int, levels: List[ndarray]) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.frames = frames
+        self.bin_size = bin_size
+        self.levels = levels
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(samplerate={self.samplerate}, channels={self.channels}, frames={self.frames}, levels={len(self.levels)})"
+    
+    # ^ Class Methods
+    
+    @classmethod
+    def from_bins(cls, samplerate: AudioSamplerate, channels: AudioChannels, frames: int, bin_size: int, bins: ndarray) -> Self:
+        """Build the pyramid from the float `bins x channels x 3` (min, max, mean square) values of the level `0`."""
+        levels, level = [], bins
+        while True:
+            quantized = np.empty(level.shape, np.int16)
+            np.rint(np.clip(level[:, :, :2], -1.0, 1.0) * PEAKS_SCALE, out=quantized[:, :, :2], casting='unsafe')
+            np.rint(np.sqrt(np.clip(level[:, :, 2], 0.0, 1.0)) * PEAKS_SCALE, out=quantized[:, :, 2], casting='unsafe')
+            levels.append(quantized)
+            if len(level) <= 1:
+                break
+            if len(level) % 2 == 1:
+                level = np.concatenate([level, level[-1:]])
+            pairs = level.reshape(-1, 2, channels, 3)
+            level = np.empty((len(pairs), channels, 3), np.float32)
+            np.minimum(pairs[:, 0, :, 0], pairs[:, 1, :, 0], out=level[:, :, 0])
+            np.maximum(pairs[:, 0, :, 1], pairs[:, 1, :, 1], out=level[:, :, 1])
+            np.add(pairs[:, 0, :, 2], pairs[:, 1, :, 2], out=level[:, :, 2])
+            level[:, :, 2] /= 2
+        return cls(samplerate, channels, frames, bin_size, levels)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        magic, version, channels, samplerate, bin_size, frames, count = PEAKS_HEADER.unpack_from(data)
+        if (magic != PEAKS_MAGIC) or (version != PEAKS_VERSION):
+            raise ValueError(f"Not a peaks file of the version {PEAKS_VERSION}")
+        levels, offset, bins = [], PEAKS_HEADER.size, -(-frames // bin_size)
+        for _ in range(count):
+            size = max(bins, 1) * channels * 3
+            levels.append(np.frombuffer(data, np.int16, size, offset).reshape(-1, channels, 3))
+            offset += size * 2
+            bins = -(-bins // 2)
+        return cls(samplerate, channels, frames, bin_size, levels)
+    
+    @classmethod
+    def load(cls, filepath: Union[str, Path]) -> Self:
+        with open(filepath, 'rb') as file:
+            return cls.from_bytes(file.read())
+    
+    # ^ Methods
+    
+    def to_bytes(self) -> bytes:
+        header = PEAKS_HEADER.pack(PEAKS_MAGIC, PEAKS_VERSION, self.channels, self.samplerate, self.bin_size, self.frames, len(self.levels))
+        return header + b''.join(level.astype('<i2', copy=False).tobytes() for level in self.levels)
+    
+    def save(self, filepath: Union[str, Path]) -> None:
+        write_atomic(filepath, self.to_bytes())
+    
+    def get_level(self, frames_per_pixel: float) -> int:
+        """The coarsest level with bins not wider than `frames_per_pixel` frames."""
+        level = 0
+        while (level + 1 < len(self.levels)) and ((self.bin_size << (level + 1)) <= frames_per_pixel):
+            level += 1
+        return level
+    
+    def get(self, pixels: int, start: int=0, end: Optional[int]=None) -> ndarray:
+        """The overview of the frames from `start` to `end` in `pixels` columns.
+        
+        Returns:
+            ndarray: The float32 `pixels x channels x 3` (min, max, RMS) values in the range from `-1.0` to `1.0`.
+        """
+        end = self.frames if (end is None) else end
+        index = self.get_level((end - start) / pixels)
+        level, size = self.levels[index], self.bin_size << index
+        edges = start + np.arange(pixels + 1, dtype=np.float64) * ((end - start) / pixels)
+        bins = np.clip((edges[:-1] // size).astype(np.int64), 0, len(level) - 1)
+        first, last = int(bins[0]), min(max(-(-end // size), int(bins[-1]) + 1), len(level))
+        view = level[first:last].astype(np.float32)
+        starts = bins - first
+        counts = np.maximum(np.diff(np.append(starts, last - first)), 1).astype(np.float32)
+        result = np.empty((pixels, self.channels, 3), np.float32)
+        result[:, :, 0] = np.minimum.reduceat(view[:, :, 0], starts)
+        result[:, :, 1] = np.maximum.reduceat(view[:, :, 1], starts)
+        result[:, :, 2] = np.sqrt(np.add.reduceat(np.square(view[:, :, 2]), starts) / counts[:, None])
+        result /= PEAKS_SCALE
+        return result
+
+# ! Functions
+
+def extract_peaks(
+    source: Union[AudioSourceBase, str, Path],
+    bin_size: int=PEAKS_BIN_SIZE,
+    block_bins: int=PEAKS_BLOCK_BINS
+) -> WaveformPeaks:
+    """Build the overview of the source (from its position) in one decoding pass.
+    
+    The source is read by blocks of `block_bins` bins, so only the bins themselves grow with the length.
+    A path is opened as a `FileAudioSource` and closed after.
+    """
+    if not isinstance(source, AudioSourceBase):
+        with FileAudioSource(source) as file:
+            return extract_peaks(file, bin_size, block_bins)
+    channels = source.channels
+    block = np.empty((bin_size * block_bins, channels), np.float32)
+    parts: List[ndarray] = []
+    frames = 0
+    while (count := read_into(source, block)) > 0:
+        full, rest = divmod(count, bin_size)
+        part = np.empty((full + (rest > 0), channels, 3), np.float32)
+        data = block[:full * bin_size].reshape(full, bin_size, channels)
+        np.min(data, axis=1, out=part[:full, :, 0])
+        np.max(data, axis=1, out=part[:full, :, 1])
+        np.einsum('ijk,ijk->ik', data, data, out=part[:full, :, 2])
+        part[:full, :, 2] /= bin_size
+        if rest > 0:
+            tail = block[full * bin_size:count]
+            part[full, :, 0], part[full, :, 1] = tail.min(axis=0), tail.max(axis=0)
+            part[full, :, 2] = np.square(tail).mean(axis=0)
+        parts.append(part)
+        frames += count
+        if count < len(block):
+            break
+    bins = np.concatenate(parts) if (len(parts) > 0) else np.zeros((1, channels, 3), np.float32)
+    return WaveformPeaks.from_bins(source.samplerate, channels, frames, bin_size, bins)
+
+def get_peaks(
+    filepath: Union[str, Path],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    bin_size: int=PEAKS_BIN_SIZE
+) -> WaveformPeaks:
+    """The overview of the file, from the cache if the file has not changed since it was built."""
+    cache_filepath = get_cache_filepath(filepath, 'peaks', f".{bin_size}.peaks", cache_dirpath)
+    if os.path.exists(cache_filepath):
+        try:
+            return WaveformPeaks.load(cache_filepath)
+        except (OSError, ValueError, struct.error):
+            pass
+    peaks = extract_peaks(filepath, bin_size)
+    peaks.save(cache_filepath)
+    return peaks
+
+def get_peaks_many(
+    filepaths: Iterable[Union[str, Path]],
+    cache_dirpath: Optional[Union[str, Path]]=None,
+    bin_size: int=PEAKS_BIN_SIZE,
+    workers: Optional[int]=None
+) -> Dict[str, Union[WaveformPeaks, Exception]]:
+    """The overviews of the files built in parallel threads (the decoding releases the GIL).
+    
+    Returns:
+        Dict[str, Union[WaveformPeaks, Exception]]: The overview or the error of every file.
+    """
+    def build(filepath: Union[str, Path]) -> Union[WaveformPeaks, Exception]:
+        try:
+            return get_peaks(filepath, cache_dirpath, bin_size)
+        except Exception as e:
+            return e
+    
+    filepaths = [str(filepath) for filepath in filepaths]
+    with ThreadPoolExecutor(workers or os.cpu_count(), thread_name_prefix='peaks') as executor:
+        return dict(zip(filepaths, executor.map(build, filepaths)))
@@ -1,8 +1,27 @@
 from .fileaudiosource import FileAudioSource, AsyncFileAudioSource
 from .urlio import URLIO
+from .asyncurlio import AsyncURLIO
+from .liveurlio import LiveURLIO, ICYMetadata
+from .urlaudiosource import URLAudioSource, AsyncURLAudioSource
+from .virtualaudiosource import (
+    VirtualAudioSource, SliceAudioSource, ConcatAudioSource, LoopAudioSource,
+    ResampledAudioSource, ConvertedAudioSource, TimeStretchedAudioSource,
+    negotiate_source, negotiate_dtype
+)
+from .mixer import Mixer, MixerInput, MixerStream
+from .crossfade import CrossfadeAudioSource, CrossfadeCurve, Prefetcher, get_crossfade_curves
+from .playlist import PlaylistAudioSource, PlaylistItem, PlaylistTrack
 
 
 __all__ = [
     'FileAudioSource', 'AsyncFileAudioSource',
-    'URLIO'
+    'URLAudioSource', 'AsyncURLAudioSource',
+    'VirtualAudioSource', 'SliceAudioSource', 'ConcatAudioSource', 'LoopAudioSource',
+    'ResampledAudioSource', 'ConvertedAudioSource', 'TimeStretchedAudioSource',
+    'negotiate_source', 'negotiate_dtype',
+    'Mixer', 'MixerInput', 'MixerStream',
+    'CrossfadeAudioSource', 'CrossfadeCurve', 'Prefetcher', 'get_crossfade_curves',
+    'PlaylistAudioSource', 'PlaylistItem', 'PlaylistTrack',
+    'URLIO', 'AsyncURLIO',
+    'LiveURLIO', 'ICYMetadata'
 ]
\ No newline at end of file
@@ -0,0 +1,475 @@
+import ssl
+import asyncio
+from threading import Lock
+from tempfile import TemporaryFile
+from urllib.parse import urlsplit, urljoin
+from io import BufferedRandom, BufferedReader, BytesIO, DEFAULT_BUFFER_SIZE
+from typing_extensions import (
+    Dict, Iterable, Tuple,
+    Self,
+    Literal, Optional,
+    NoReturn, deprecated
+)
+
+# ! Constants
+
+MAX_REDIRECTS = 8
+TAIL_SIZE = 16 * 1024
+
+# ! Async URL IO Class
+class AsyncURLIO(BufferedReader):
+    """A buffered reader by direct/indirect reference whose network I/O runs on the event loop.
+    
+    The connection is driven by `asyncio` streams (non-blocking sockets), the downloaded bytes are
+    stored in the buffer. The synchronous IO methods only work with the buffer, so they can be
+    safely called from the executor thread (for example, by `SoundFile`) after `fetch` was awaited.
+    On the event loop thread, they raise `RuntimeError` if the data they need is not downloaded yet.
+    """
+    # ^ Hidden init methods
+    
+    def __open_buffer(self, buffer_type: Literal['temp', 'mem']) -> BufferedRandom:
+        if buffer_type == 'mem':
+            return BytesIO()
+        elif buffer_type == 'temp':
+            return TemporaryFile('wb+')
+        raise ValueError(buffer_type)
+    
+    def __write(self, data: bytes) -> None:
+        with self.__lock:
+            self.__buffer.seek(self.__size)
+            self.__buffer.write(data)
+            self.__size += len(data)
+    
+    # ^ Hidden HTTP methods
+    
+    async def __connect(self, url: str, headers: Dict[str, str]) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+        port = parts.port or (443 if (parts.scheme == 'https') else 80)
+        sslctx = ssl.create_default_context() if (parts.scheme == 'https') else None
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, port, ssl=sslctx),
+            self.__timeout
+        )
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        host = parts.hostname if (parts.port is None) else f"{parts.hostname}:{parts.port}"
+        request = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            "User-Agent: seaplayer-audio\r\n"
+            "Accept: */*\r\n"
+            "Accept-Encoding: identity\r\n"
+            "Connection: close\r\n"
+            + ''.join(f"{key}: {value}\r\n" for key, value in headers.items())
+            + "\r\n"
+        )
+        writer.write(request.encode('latin-1'))
+        await writer.drain()
+        return reader, writer
+    
+    async def __read_head(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+        status_line = (await asyncio.wait_for(reader.readline(), self.__timeout)).decode('latin-1')
+        try:
+            status = int(status_line.split(' ', 2)[1])
+        except (IndexError, ValueError):
+            raise ConnectionError(f"Invalid HTTP status line: {status_line!r}")
+        headers: Dict[str, str] = {}
+        while len(line := (await reader.readline()).decode('latin-1').strip()) > 0:
+            key, _, value = line.partition(':')
+            headers[key.strip().lower()] = value.strip()
+        return status, headers
+    
+    async def __request(
+        self,
+        headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], asyncio.StreamReader, asyncio.StreamWriter]:
+        url = self.__url
+        for _ in range(MAX_REDIRECTS):
+            reader, writer = await self.__connect(url, headers)
+            status, rheaders = await self.__read_head(reader)
+            if (status in (301, 302, 303, 307, 308)) and ('location' in rheaders):
+                writer.close()
+                url = urljoin(url, rheaders['location'])
+                continue
+            if not (200 <= status < 300):
+                writer.close()
+                raise ConnectionError(f"HTTP Error {status}: {url}")
+            return status, rheaders, reader, writer
+        raise ConnectionError(f"Too many redirects: {self.__url}")
+    
+    async def __read_body(self, size: int) -> bytes:
+        if self.__eof:
+            return b''
+        if self.__chunked:
+            if self.__chunk_left == 0:
+                line = await self.__reader.readline()
+                try:
+                    self.__chunk_left = int(line.split(b';', 1)[0].strip() or b'0', 16)
+                except ValueError:
+                    raise ConnectionError(f"Invalid chunk size line: {line!r}")
+                if self.__chunk_left == 0:
+                    while len((await self.__reader.readline()).strip()) > 0:
+                        pass
+                    self.__eof = True
+                    return b''
+            data = await self.__reader.read(min(size, self.__chunk_left))
+            if len(data) == 0:
+                self.__eof = True
+                return b''
+            self.__chunk_left -= len(data)
+            if self.__chunk_left == 0:
+                await self.__reader.readline()
+            return data
+        if self.__remaining is not None:
+            size = min(size, self.__remaining)
+            if size == 0:
+                self.__eof = True
+                return b''
+        data = await self.__reader.read(size)
+        if len(data) == 0:
+            self.__eof = True
+        elif self.__remaining is not None:
+            self.__remaining -= len(data)
+        return data
+    
+    async def __finish(self) -> None:
+        self.__full = True
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+    
+    # ^ Init Method
+    
+    def __init__(
+        self,
+        url: str,
+        buffer_type: Literal['temp', 'mem']='temp',
+        closefd: bool=True,
+        loop: Optional[asyncio.AbstractEventLoop]=None,
+        timeout: Optional[float]=30.0,
+        tail_size: int=TAIL_SIZE
+    ) -> None:
+        self.__url = url
+        self.__buffer_type = buffer_type
+        self.__closefd = closefd
+        self.__timeout = timeout
+        self.__tail_size = tail_size
+        if loop is not None:
+            self.loop = loop
+        else:
+            self.loop = asyncio.get_running_loop()
+        # * Async URL IO Attrs
+        self.__lock = Lock()
+        self.__fetch_lock = asyncio.Lock()
+        self.__buffer = self.__open_buffer(self.__buffer_type)
+        self.__size = 0
+        self.__pos = 0
+        self.__reader: Optional[asyncio.StreamReader] = None
+        self.__writer: Optional[asyncio.StreamWriter] = None
+        self.__headers: Dict[str, str] = {}
+        self.__length: Optional[int] = None
+        self.__remaining: Optional[int] = None
+        self.__chunked = False
+        self.__chunk_left = 0
+        self.__tail: Optional[bytes] = None
+        self.__tail_fetched = False
+        self.__eof = False
+        self.__full = False
+        self.__opened = False
+    
+    # ^ Magic Methods
+    
+    def __del__(self) -> None:
+        if self.closefd and (not self.closed):
+            self.close()
+    
+    def __iter__(self) -> NoReturn:
+        raise NotImplementedError
+    
+    def __next__(self) -> NoReturn:
+        raise NotImplementedError
+    
+    def __enter__(self) -> NoReturn:
+        raise NotImplementedError
+    
+    def __exit__(self, *args: object) -> NoReturn:
+        raise NotImplementedError
+    
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+    
+    async def __aexit__(self, *args: object) -> None:
+        if self.closefd and (not self.closed):
+            self.close()
+    
+    # ^ Main Propertyes
+    
+    @property
+    def name(self) -> Optional[str]:
+        return None
+    
+    @property
+    def mode(self) -> str:
+        return 'r'
+    
+    @property
+    def closed(self) -> bool:
+        return self.__buffer.closed
+    
+    @property
+    def closefd(self) -> bool:
+        return self.__closefd
+    
+    # ^ URL Open Propertyes
+    
+    @property
+    def length(self) -> Optional[int]:
+        return self.__length
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self.__headers
+    
+    # ^ URL IO Propertyes
+    
+    @property
+    def url(self) -> str:
+        return self.__url
+    
+    @property
+    def downloaded(self) -> int:
+        return self.__size
+    
+    @property
+    def buffer_type(self) -> Literal['temp', 'mem']:
+        return self.__buffer_type
+    
+    @property
+    def full(self) -> bool:
+        return self.__full
+    
+    @property
+    def opened(self) -> bool:
+        return self.__opened
+    
+    @property
+    def tail_size(self) -> int:
+        return self.__tail_size
+    
+    # ^ Async URL IO Methods
+    
+    async def open(self) -> None:
+        """Connect to the server and read the response headers (redirects are followed)."""
+        if self.__opened:
+            return
+        _, headers, self.__reader, self.__writer = await self.__request({})
+        self.__headers = headers
+        self.__chunked = 'chunked' in headers.get('transfer-encoding', '').lower()
+        if (not self.__chunked) and headers.get('content-length', '').isdigit():
+            self.__length = int(headers['content-length'])
+            self.__remaining = self.__length
+        self.__opened = True
+    
+    async def fill(self, size: int) -> int:
+        """Download data until the buffer holds at least `size` bytes (or the stream ends).
+        
+        Args:
+            size (int): The required size of the buffer in bytes. If `size < 0`, the whole stream is downloaded.
+        
+        Returns:
+            int: The size of the buffer in bytes.
+        """
+        await self.open()
+        async with self.__fetch_lock:
+            downloaded = self.__size
+            while (not self.__full) and ((size < 0) or (downloaded < size)):
+                want = DEFAULT_BUFFER_SIZE * 8 if (size < 0) else max(size - downloaded, DEFAULT_BUFFER_SIZE)
+                data = await asyncio.wait_for(self.__read_body(want), self.__timeout)
+                if len(data) == 0:
+                    await self.__finish()
+                    break
+                self.__write(data)
+                downloaded += len(data)
+            return downloaded
+    
+    async def fetch(self, size: int=-1) -> int:
+        """Download data until at least `size` bytes after the current position are buffered.
+        
+        Args:
+            size (int, optional): The number of bytes after the current position. If `size < 0`, the whole stream is downloaded. Defaults to `-1`.
+        
+        Returns:
+            int: The size of the buffer in bytes.
+        """
+        if size < 0:
+            return await self.fill(-1)
+        return await self.fill(self.__pos + size)
+    
+    async def fulling(self) -> None:
+        await self.fill(-1)
+    
+    async def head(self, size: int) -> bytes:
+        """Return the first `size` bytes of the stream (downloading them if needed). The position is not changed."""
+        await self.fill(size)
+        with self.__lock:
+            self.__buffer.seek(0)
+            return self.__buffer.read(size)
+    
+    async def tail(self) -> Optional[bytes]:
+        """Return the last `tail_size` bytes of the stream.
+        
+        If they are not downloaded yet, they are fetched once by a single range request
+        and cached. Returns `None` if the length is unknown or the server does not support ranges.
+        """
+        await self.open()
+        if self.__full:
+            with self.__lock:
+                start = max(self.__size - self.__tail_size, 0)
+                self.__buffer.seek(start)
+                return self.__buffer.read(self.__size - start)
+        if not self.__tail_fetched:
+            self.__tail_fetched = True
+            if (self.__length is not None) and (self.__length > 0):
+                start = max(self.__length - self.__tail_size, 0)
+                try:
+                    status, headers, reader, writer = await self.__request({'Range': f"bytes={start}-{self.__length - 1}"})
+                    try:
+                        if status == 206:
+                            self.__tail = await asyncio.wait_for(reader.readexactly(self.__length - start), self.__timeout)
+                    finally:
+                        writer.close()
+                except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    self.__tail = None
+        return self.__tail
+    
+    # ^ Hidden sync preparation methods
+    
+    def __require(self, size: int) -> None:
+        if self.__full or ((size >= 0) and (self.__size >= size)):
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            # * The loop can not download while it is blocked here, and the partial data would be read as the whole.
+            raise RuntimeError(
+                f"The bytes up to {size if (size >= 0) else 'the end'} are not downloaded yet: "
+                "await `fetch` (or `fill`) before the synchronous IO on the event loop thread, or call it from the executor"
+            )
+        # * It's called from another thread, so the loop downloads the missing data.
+        asyncio.run_coroutine_threadsafe(self.fill(size), self.loop).result()
+    
+    def __read_preparation(self, size: int) -> None:
+        self.__require((self.__pos + size) if (size > 0) else -1)
+    
+    def __in_tail(self, size: int) -> bool:
+        if self.__full or (self.__tail is None) or (size <= 0):
+            return False
+        start = self.__length - len(self.__tail)
+        return (self.__pos >= max(start, self.__size)) and (self.__pos + size <= self.__length)
+    
+    def __read_tail(self, size: int) -> bytes:
+        start = self.__pos - (self.__length - len(self.__tail))
+        data = self.__tail[start:start + size]
+        self.__pos += len(data)
+        return data
+    
+    def __end(self) -> int:
+        if self.__length is None:
+            self.__require(-1)
+            return self.__size
+        return self.__length
+    
+    # ^ IO Check Methods
+    
+    def seekable(self) -> bool:
+        return not self.closed
+    
+    def readable(self) -> bool:
+        return not self.closed
+    
+    def writable(self) -> bool:
+        return False
+    
+    # ^ IO Methods
+    
+    def isatty(self) -> bool:
+        return False
+    
+    def tell(self) -> int:
+        return self.__pos
+    
+    def close(self) -> None:
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+        self.__buffer.close()
+    
+    def read(self, size: int=-1, /) -> bytes:
+        if self.__in_tail(size):
+            return self.__read_tail(size)
+        self.__read_preparation(size)
+        with self.__lock:
+            self.__buffer.seek(self.__pos)
+            data = self.__buffer.read(size)
+            self.__pos += len(data)
+        return data
+    
+    def read1(self, size: int=-1, /) -> bytes:
+        return self.read(size)
+    
+    def readinto(self, b: bytearray, /) -> int:
+        size = len(b)
+        if self.__in_tail(size):
+            data = self.__read_tail(size)
+            b[:len(data)] = data
+            return len(data)
+        if size > 0:
+            self.__read_preparation(size)
+            with self.__lock:
+                self.__buffer.seek(self.__pos)
+                count = self.__buffer.readinto(b)
+                self.__pos += count
+            return count
+        return 0
+    
+    def readinto1(self, b: bytearray, /) -> int:
+        return self.readinto(b)
+    
+    def seek(self, offset: int, whence: int=0, /) -> int:
+        """Set the read position. The data is downloaded only when it is read."""
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self.__pos + offset
+        elif whence == 2:
+            pos = self.__end() + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self.__pos = pos
+        return pos
+    
+    # ^ IO Methods (NOT IMPLEMENTED)
+    
+    @deprecated('NOT IMPLEMENTED')
+    def write(self):
+        raise OSError
+    
+    @deprecated('NOT IMPLEMENTED')
+    def writelines(self, lines: Iterable[bytes], /):
+        raise OSError
+    
+    @deprecated('NOT IMPLEMENTED')
+    def fileno(self):
+        raise OSError
+    
+    @deprecated('NOT IMPLEMENTED')
+    def flush(self):
+        raise NotImplementedError
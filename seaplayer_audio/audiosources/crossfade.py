@@ -0,0 +1,301 @@
+import queue
+import numpy as np
+from numpy import ndarray
+from queue import Queue
+from threading import Thread, Event, Lock
+# > Typing
+from typing_extensions import Iterable, List, Literal, Optional, Tuple, TypeAlias
+# > Local Imports
+from ..base import AudioSourceBase
+from ..processors import convert_samples
+from .virtualaudiosource import VirtualAudioSource, read_into
+
+# ! Types
+
+CrossfadeCurve: TypeAlias = Literal['equal-power', 'linear']
+
+# ! Constants
+
+CROSSFADE_TIME = 3.0
+CROSSFADE_CURVES = ('equal-power', 'linear')
+PREFETCH_BLOCK_SIZE = 8192
+PREFETCH_BLOCKS = 4
+
+# ! Functions
+
+def get_crossfade_curves(frames: int, curve: CrossfadeCurve='equal-power') -> Tuple[ndarray, ndarray]:
+    """The `(fade out, fade in)` gains of the `frames` of a crossfade.
+    
+    The equal-power curves keep the loudness of uncorrelated tracks constant, the linear ones keep the amplitude.
+    """
+    t = (np.arange(frames, dtype=np.float64) + 0.5) / max(frames, 1)
+    if curve == 'equal-power':
+        fade_out, fade_in = np.cos(t * np.pi / 2), np.sin(t * np.pi / 2)
+    elif curve == 'linear':
+        fade_out, fade_in = 1.0 - t, t
+    else:
+        raise ValueError(f"Unknown crossfade curve {curve!r}, should be 'equal-power' or 'linear'")
+    return fade_out.astype(np.float32)[:, None], fade_in.astype(np.float32)[:, None]
+
+# ! Prefetcher Class
+class Prefetcher:
+    """Decodes the source from the frame `start` in a background thread into a queue of blocks.
+    
+    The thread stays `depth` blocks ahead of the reader, so the frames are ready before they are needed.
+    """
+    
+    def __init__(self, source: AudioSourceBase, start: int=0, block_size: int=PREFETCH_BLOCK_SIZE, depth: int=PREFETCH_BLOCKS) -> None:
+        self.source = source
+        self.start = start
+        self.block_size = block_size
+        self.queue: Queue[Optional[ndarray]] = Queue(max(depth, 1))
+        self.exception: Optional[BaseException] = None
+        self.__stopped = Event()
+        self.__pending: Optional[ndarray] = None
+        self.__ended = False
+        self.__decoded = 0
+        self.__lock = Lock()
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+    
+    # ^ Propertyes
+    
+    @property
+    def decoded(self) -> int:
+        """The number of frames decoded ahead of the reader."""
+        return self.__decoded
+    
+    # ^ Methods
+    
+    def run(self) -> None:
+        try:
+            if self.source.tell() != self.start:
+                self.source.seek(self.start)
+            while not self.__stopped.is_set():
+                block = np.empty((self.block_size, self.source.channels), np.float32)
+                count = read_into(self.source, block)
+                if count > 0:
+                    self.__put(block[:count])
+                if count < len(block):
+                    break
+        except BaseException as e:
+            self.exception = e
+        self.__put(None)
+    
+    def __put(self, block: Optional[ndarray]) -> None:
+        while not self.__stopped.is_set():
+            try:
+                self.queue.put(block, timeout=0.1)
+                if block is not None:
+                    with self.__lock:
+                        self.__decoded += len(block)
+                return
+            except queue.Full:
+                pass
+    
+    def readinto(self, out: ndarray) -> int:
+        """Read the next frames into `out` (of any dtype), waits for the decoder if it is behind."""
+        done = 0
+        while (done < len(out)) and (not self.__ended):
+            if (self.__pending is None) or (len(self.__pending) == 0):
+                self.__pending = self.queue.get()
+                if self.__pending is None:
+                    self.__ended = True
+                    if self.exception is not None:
+                        raise self.exception
+                    break
+                with self.__lock:
+                    self.__decoded -= len(self.__pending)
+            size = min(len(out) - done, len(self.__pending))
+            convert_samples(self.__pending[:size], out[done:done + size])
+            self.__pending = self.__pending[size:]
+            done += size
+        return done
+    
+    def close(self) -> None:
+        self.__stopped.set()
+        self.thread.join()
+
+# ! Crossfade Audio Source Class
+class CrossfadeAudioSource(VirtualAudioSource):
+    """Several audio sources (with the same samplerate and channels) played one after another with crossfades.
+    
+    The tail of every source is mixed with the head of the next one over `duration` seconds
+    (at most the half of any of them). The current source and the next one are decoded by
+    background threads ahead of the reader, so the overlap is ready before it is needed,
+    and the result is read like any other source (by the thread and the callback streamers alike).
+    The sources of unknown length are joined without crossfades, the positions of the sources are
+    followed as they are played, so the ones after them still crossfade. The sources must be
+    separate objects: the neighbouring ones are read by different threads at the same time.
+    """
+    
+    def __init__(
+        self,
+        sources: Iterable[AudioSourceBase],
+        duration: float=CROSSFADE_TIME,
+        curve: CrossfadeCurve='equal-power',
+        block_size: int=PREFETCH_BLOCK_SIZE,
+        closefd: bool=False
+    ) -> None:
+        self.sources: List[AudioSourceBase] = list(sources)
+        if len(self.sources) == 0:
+            raise ValueError("At least one audio source is required")
+        super().__init__(self.sources[0], closefd)
+        if curve not in CROSSFADE_CURVES:
+            raise ValueError(f"Unknown crossfade curve {curve!r}, should be one of {CROSSFADE_CURVES}")
+        self.fade_duration = duration
+        self.curve = curve
+        self.block_size = block_size
+        self.starts: List[int] = []
+        self.overlaps: List[int] = []
+        for source in self.sources:
+            self.__check(source)
+        self.__update()
+        self.__scratch = np.empty((2, block_size, self.channels), np.float32)
+        self.__index = 0
+        self.__start = 0
+        self.__current: Optional[Prefetcher] = None
+        self.__next: Optional[Prefetcher] = None
+        self.__curves: Optional[Tuple[ndarray, ndarray]] = None
+        self.__position = -1
+    
+    # ^ Hidden Methods
+    
+    def __check(self, source: AudioSourceBase) -> None:
+        if (source.samplerate != self.samplerate) or (source.channels != self.channels):
+            raise ValueError(
+                f"The audio source {source} ({source.samplerate} Hz, {source.channels} ch) does not match "
+                f"the first one ({self.samplerate} Hz, {self.channels} ch)"
+            )
+    
+    def __update(self) -> None:
+        fade = int(self.fade_duration * self.samplerate)
+        self.starts, self.overlaps = [0], []
+        for source, following in zip(self.sources, self.sources[1:]):
+            if (source.frames < 0) or (following.frames < 0):
+                overlap = 0
+            else:
+                overlap = max(min(fade, source.frames // 2, following.frames // 2), 0)
+            self.overlaps.append(overlap)
+            # * The starts after a source of unknown length are unknown (`-1`) until it is played.
+            self.starts.append(-1 if (self.starts[-1] < 0) or (source.frames < 0) else self.starts[-1] + source.frames - overlap)
+        self.overlaps.append(0)
+    
+    def __stop(self) -> None:
+        for prefetcher in (self.__current, self.__next):
+            if prefetcher is not None:
+                prefetcher.close()
+        self.__current = self.__next = None
+    
+    def __prefetch_next(self) -> None:
+        index = self.__index + 1
+        if (index < len(self.sources)) and (self.overlaps[self.__index] > 0):
+            local = max(self._pos - (self.__start + self.sources[self.__index].frames - self.overlaps[self.__index]), 0)
+            depth = -(-self.overlaps[self.__index] // self.block_size) + 1
+            self.__next = Prefetcher(self.sources[index], local, self.block_size, depth)
+            self.__curves = get_crossfade_curves(self.overlaps[self.__index], self.curve)
+        else:
+            self.__next, self.__curves = None, None
+    
+    def __restart(self) -> None:
+        self.__stop()
+        index = 0
+        # * The crossfade belongs to the source fading out, so the source is chosen by its end.
+        while (index + 1 < len(self.sources)) and (self.starts[index + 1] >= 0) and (self._pos >= self.starts[index] + self.sources[index].frames):
+            index += 1
+        self.__index, self.__start = index, self.starts[index]
+        self.__current = Prefetcher(self.sources[index], self._pos - self.__start, self.block_size)
+        self.__prefetch_next()
+    
+    def __advance(self, start: int) -> None:
+        if self.__current is not None:
+            self.__current.close()
+        self.__current, self.__index, self.__start = self.__next, self.__index + 1, start
+        if (self.__current is None) and (self.__index < len(self.sources)):
+            self.__current = Prefetcher(self.sources[self.__index], 0, self.block_size)
+        if self.__index < len(self.sources):
+            self.__prefetch_next()
+    
+    def _sources(self) -> Iterable[AudioSourceBase]:
+        return self.sources
+    
+    def _readinto(self, out: ndarray) -> int:
+        if (self.__position != self._pos) or ((self.__current is None) and (self.__index < len(self.sources))):
+            self.__restart()
+        done = 0
+        while (done < len(out)) and (self.__index < len(self.sources)):
+            source = self.sources[self.__index]
+            if source.frames < 0:
+                count = self.__current.readinto(out[done:])
+                done += count
+                self._pos += count
+                if done < len(out):
+                    self.__advance(self._pos)
+                continue
+            overlap = self.overlaps[self.__index] if (self.__next is not None) else 0
+            end = self.__start + source.frames
+            fade = end - overlap
+            if self._pos < fade:
+                size = min(len(out) - done, fade - self._pos)
+                count = self.__current.readinto(out[done:done + size])
+                done += count
+                self._pos += count
+                if count < size:
+                    # * The source is shorter than it reported, so it ends here and the next one starts without a crossfade.
+                    self.__advance(self._pos)
+                continue
+            if overlap == 0:
+                self.__advance(self._pos)
+                continue
+            size = min(len(out) - done, end - self._pos, self.block_size)
+            tail, head = self.__scratch[0, :size], self.__scratch[1, :size]
+            tail[self.__current.readinto(tail):] = 0
+            head[self.__next.readinto(head):] = 0
+            fade_out, fade_in = self.__curves
+            position = self._pos - fade
+            np.multiply(tail, fade_out[position:position + size], out=tail)
+            np.multiply(head, fade_in[position:position + size], out=head)
+            np.add(tail, head, out=tail)
+            convert_samples(tail, out[done:done + size])
+            done += size
+            self._pos += size
+            if self._pos == end:
+                self.__advance(end - overlap)
+        self.__position = self._pos
+        return done
+    
+    # ^ Propertyes
+    
+    @property
+    def frames(self) -> int:
+        if self.starts[-1] < 0:
+            return -1
+        return self.starts[-1] + self.sources[-1].frames
+    
+    @property
+    def preloaded(self) -> int:
+        """The number of frames of the next source decoded ahead for the crossfade."""
+        return self.__next.decoded if (self.__next is not None) else 0
+    
+    @property
+    def current(self) -> int:
+        """The index of the source played at the moment."""
+        return self.__index
+    
+    # ^ Methods
+    
+    def append(self, source: AudioSourceBase) -> None:
+        """Add the source to the end of the queue (from any thread)."""
+        self.__check(source)
+        self.semaphore.acquire()
+        try:
+            self.sources.append(source)
+            self.__update()
+            if (self.__current is not None) and (self.__next is None) and (self.__index == len(self.sources) - 2):
+                self.__prefetch_next()
+        finally:
+            self.semaphore.release()
+    
+    def close(self) -> None:
+        self.__stop()
+        super().close()
\ No newline at end of file
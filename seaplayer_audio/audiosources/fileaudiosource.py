@@ -5,19 +5,27 @@ from soundfile import SoundFile
 from threading import Semaphore
 # * Typing
 from types import TracebackType
-from typing_extensions import Optional, Type
+from typing_extensions import Optional, Tuple, Type
 # * Local Imports
 from ..base import AsyncAudioSourceBase, AudioSourceBase
 from .._types import (
     FilePathType,
     AudioDType, AudioSamplerate, AudioChannels, AudioFormat, AudioSubType, AudioEndians
 )
-from ..functions import aiorun, get_audio_metadata, get_mutagen_info
+from ..functions import aiorun, get_audio_metadata, get_audio_image_data, get_mutagen_info, get_gapless_trim
+from ..library.index import LibraryIndex
+from ..library.covers import CoverStore
+from ..library.scanner import TrackInfo, make_track_info
 
 # ^ File Audio Source (sync)
 
 class FileAudioSource(AudioSourceBase):
-    """A class for reading an audio stream in array format from a file."""
+    """A class for reading an audio stream in array format from a file.
+    
+    With an `index`, the tags, the bitrate and the gapless info of a file with a fresh entry are taken
+    from it (without mutagen and the cover, so `metadata.icon` is `None`), and the other files are added to it.
+    With `covers`, the cover is not decoded either: it is put into the store, and `metadata.cover` is its handle there.
+    """
     __repr_attrs__ = ('name', ('metadata', True), 'samplerate', 'channels', 'subtype', 'endian', 'format', 'bitrate')
     
     def __init__(
@@ -28,13 +36,24 @@ class FileAudioSource(AudioSourceBase):
         subtype:  Optional[AudioSubType]=None,
         endian: Optional[AudioEndians]=None,
         format: Optional[AudioFormat]=None,
-        closefd: bool=True
+        closefd: bool=True,
+        index: Optional[LibraryIndex]=None,
+        covers: Optional[CoverStore]=None
     ) -> None:
         self.name = os.path.abspath(str(filepath))
         self.sfio = SoundFile(self.name, 'r', samplerate, channels, subtype, endian, format, closefd=closefd)
         self.semaphore = Semaphore(1)
-        self.minfo = get_mutagen_info(self.name)
-        self.metadata = get_audio_metadata(self.sfio, self.minfo)
+        self.track: Optional[TrackInfo] = index.lookup(self.name) if (index is not None) else None
+        if self.track is not None:
+            self.minfo = None
+            self.metadata = self.track.metadata
+        else:
+            self.minfo = get_mutagen_info(self.name)
+            self.metadata = get_audio_metadata(self.sfio, self.minfo, with_icon=covers is None)
+            if (covers is not None) and ((data := get_audio_image_data(self.minfo)) is not None):
+                covers.put(data)
+            if index is not None:
+                index.upsert([make_track_info(self.name, os.stat(self.name), self.sfio, self.minfo, self.metadata)])
         self.closefd = closefd
     
     # ^ Magic Methods
@@ -94,12 +113,21 @@ class FileAudioSource(AudioSourceBase):
     @property
     def bitrate(self) -> Optional[int]:
         """The speed of the audio stream in the format of bits per second."""
+        if self.track is not None:
+            return self.track.bitrate
         try:
             if self.minfo.info.bitrate is not None:
                 return self.minfo.info.bitrate
         except:
             pass
     
+    @property
+    def gapless(self) -> Tuple[int, int]:
+        """The frames of the encoder delay and padding left at the start and the end of the decoded audio."""
+        if self.track is not None:
+            return self.track.gapless
+        return get_gapless_trim(self.name, self.minfo, self.frames)
+    
     @property
     def closed(self) -> bool:
         """Whether the IO will be closed after the context manager is closed."""
@@ -195,9 +223,11 @@ class AsyncFileAudioSource(AsyncAudioSourceBase, FileAudioSource):
         endian: Optional[AudioEndians]=None,
         format: Optional[AudioFormat]=None,
         closefd: bool=False,
-        loop: Optional[asyncio.AbstractEventLoop]=None
+        loop: Optional[asyncio.AbstractEventLoop]=None,
+        index: Optional[LibraryIndex]=None,
+        covers: Optional[CoverStore]=None
     ) -> None:
-        super().__init__(filepath, samplerate, channels, subtype, endian, format, closefd)
+        super().__init__(filepath, samplerate, channels, subtype, endian, format, closefd, index, covers)
         if loop is not None:
             self.loop = loop
         else:
@@ -231,22 +261,13 @@ class AsyncFileAudioSource(AsyncAudioSourceBase, FileAudioSource):
         always_2d: bool=False,
         **extra: object
     ) -> ndarray:
-        self.semaphore.acquire()
-        result = await aiorun(self.loop, super().read, frames, dtype, always_2d, **extra)
-        self.semaphore.release()
-        return result
+        return await aiorun(self.loop, super().read, frames, dtype, always_2d, **extra)
     
     async def readline(self, seconds: float=-1.0, dtype: AudioDType='float32', always_2d: bool=False, **extra) -> ndarray:
-        self.semaphore.acquire()
-        result = await aiorun(self.loop, super().readline, seconds, dtype, always_2d, **extra)
-        self.semaphore.release()
-        return result
+        return await aiorun(self.loop, super().readline, seconds, dtype, always_2d, **extra)
 
     async def seek(self, frames: int, whence=0) -> int:
-        self.semaphore.acquire()
-        result = await aiorun(self.loop, super().seek, frames, whence)
-        self.semaphore.release()
-        return result
+        return await aiorun(self.loop, super().seek, frames, whence)
     
     async def tell(self) -> int:
         return await aiorun(self.loop, super().tell)
@@ -0,0 +1,399 @@
+import re
+import time
+from http.client import HTTPException
+from threading import Condition, Thread
+from dataclasses import dataclass, field
+from urllib.request import Request, urlopen
+from io import BufferedReader, DEFAULT_BUFFER_SIZE
+from typing_extensions import (
+    Callable, Dict, Iterable, List,
+    Self,
+    Optional,
+    NoReturn, deprecated
+)
+from .._types import URLOpenRet
+
+# ! Constants
+
+RING_SIZE = 1024 * 1024
+HISTORY_SIZE = 64 * 1024
+LIVE_LENGTH = 2 ** 62
+PHANTOM_START = LIVE_LENGTH // 2
+ICY_FIELD_PATTERN = re.compile(r"(\w+)='(.*?)';", re.DOTALL)
+
+# ! Types
+
+@dataclass(frozen=True)
+class ICYMetadata:
+    title: Optional[str]=None
+    url: Optional[str]=None
+    fields: Dict[str, str]=field(default_factory=dict)
+    
+    @staticmethod
+    def parse(data: bytes) -> 'ICYMetadata':
+        text = data.rstrip(b'\x00').decode('utf-8', errors='replace')
+        fields = dict(ICY_FIELD_PATTERN.findall(text))
+        return ICYMetadata(fields.get('StreamTitle', None) or None, fields.get('StreamUrl', None) or None, fields)
+
+ICYMetadataCallback = Callable[[ICYMetadata], None]
+
+# ! Ring Buffer Class
+class ByteRingBuffer:
+    """A fixed-size byte ring addressed by absolute stream positions.
+    
+    The writer is blocked while the unread data leaves less than `history` bytes of the ring,
+    so at least the last `history` bytes before the read position are kept for short backward seeks.
+    While the ring is `pinned`, nothing is overwritten until the reader waits for new data
+    (the decoders seek back to the beginning of the stream while detecting the format).
+    """
+    
+    def __init__(self, capacity: int, history: int) -> None:
+        if capacity <= history:
+            raise ValueError(f"The capacity ({capacity}) must be greater than the history ({history})")
+        self.capacity = capacity
+        self.history = history
+        self.data = bytearray(capacity)
+        self.start = 0
+        self.end = 0
+        self.condition = Condition()
+        self.closed = False
+        self.eof = False
+        self.pinned = True
+        self.waiting = False
+    
+    def write(self, data: bytes, reader: Callable[[], int]) -> bool:
+        """Append the data, waiting for the reader to free the space. Returns `False` if the ring was closed."""
+        view = memoryview(data)
+        while len(view) > 0:
+            with self.condition:
+                while (not self.closed) and (self.end - self.__lowest(reader()) >= self.capacity - self.history):
+                    self.condition.wait()
+                if self.closed:
+                    return False
+                chunk = view[:self.capacity - self.history - max(self.end - self.__lowest(reader()), 0)]
+                self.start = max(self.start, self.end + len(chunk) - self.capacity)
+                offset = self.end % self.capacity
+                first = min(len(chunk), self.capacity - offset)
+                self.data[offset:offset + first] = chunk[:first]
+                self.data[:len(chunk) - first] = chunk[first:]
+                self.end += len(chunk)
+                view = view[len(chunk):]
+                self.condition.notify_all()
+        return True
+    
+    def __lowest(self, reader: int) -> int:
+        if self.pinned and (not self.waiting):
+            return self.start
+        return reader
+    
+    def read(self, position: int, size: int) -> bytes:
+        """Read up to `size` bytes from the absolute `position`, waiting until they are written."""
+        with self.condition:
+            while (not self.closed) and (not self.eof) and (self.end < position + size):
+                self.waiting = True
+                self.condition.notify_all()
+                self.condition.wait()
+            self.waiting = False
+            if position < self.start:
+                raise OSError(f"Position {position} has already left the ring buffer (starts at {self.start})")
+            size = max(min(size, self.end - position), 0)
+            offset = position % self.capacity
+            first = min(size, self.capacity - offset)
+            data = bytes(self.data[offset:offset + first]) + bytes(self.data[:size - first])
+            self.condition.notify_all()
+            return data
+    
+    def unpin(self) -> None:
+        with self.condition:
+            self.pinned = False
+            self.condition.notify_all()
+    
+    def finish(self) -> None:
+        with self.condition:
+            self.eof = True
+            self.condition.notify_all()
+    
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+# ! Live URL IO Class
+class LiveURLIO(BufferedReader):
+    """A non-seekable reader of an endless HTTP stream (Icecast/SHOUTcast radio) with constant memory.
+    
+    The stream is downloaded by a background thread into a fixed-size ring buffer,
+    ICY metadata is cut out of the audio data and reported to the listeners,
+    the connection is reopened when it drops.
+    """
+    # ^ Hidden Methods
+    
+    def __connect(self) -> URLOpenRet:
+        headers = {'Icy-MetaData': '1'} if self.__icy else {}
+        stream: URLOpenRet = urlopen(Request(self.__url, headers=headers), timeout=self.__timeout)
+        metaint = stream.headers.get('icy-metaint', None)
+        self.__metaint = int(metaint) if (self.__icy and (metaint is not None) and metaint.strip().isdigit()) else 0
+        self.__headers = {key.lower(): value for key, value in stream.headers.items()}
+        return stream
+    
+    def __reader_position(self) -> int:
+        return self.__real_pos
+    
+    def __emit(self, metadata: ICYMetadata) -> None:
+        if metadata != self.__metadata:
+            self.__metadata = metadata
+            for callback in list(self.__listeners):
+                try: callback(metadata)
+                except: pass
+    
+    def __pump(self, stream: URLOpenRet) -> bool:
+        left = self.__metaint
+        while not self.__closing:
+            size = min(left, DEFAULT_BUFFER_SIZE) if (self.__metaint > 0) else DEFAULT_BUFFER_SIZE
+            data = stream.read(size)
+            if len(data) == 0:
+                return False
+            if not self.__ring.write(data, self.__reader_position):
+                return True
+            if self.__metaint > 0:
+                left -= len(data)
+                if left == 0:
+                    length = stream.read(1)
+                    if len(length) == 0:
+                        return False
+                    if length[0] > 0:
+                        self.__emit(ICYMetadata.parse(stream.read(length[0] * 16)))
+                    left = self.__metaint
+        return True
+    
+    def __run(self) -> None:
+        attempts = 0
+        stream = self.__stream
+        while not self.__closing:
+            try:
+                if stream is None:
+                    stream = self.__connect()
+                    self.__reconnects += 1
+                attempts = 0
+                if self.__pump(stream):
+                    break
+            except (OSError, HTTPException):
+                pass
+            finally:
+                if stream is not None:
+                    stream.close()
+                    stream = None
+            attempts += 1
+            if (not self.__reconnect) or self.__closing or \
+                ((self.__reconnect_attempts is not None) and (attempts > self.__reconnect_attempts)):
+                break
+            time.sleep(self.__reconnect_delay)
+        self.__ring.finish()
+    
+    # ^ Init Method
+    
+    def __init__(
+        self,
+        url: str,
+        buffer_size: int=RING_SIZE,
+        closefd: bool=True,
+        icy: bool=True,
+        reconnect: bool=True,
+        reconnect_attempts: Optional[int]=None,
+        reconnect_delay: float=1.0,
+        timeout: Optional[float]=10.0
+    ) -> None:
+        self.__url = url
+        self.__closefd = closefd
+        self.__icy = icy
+        self.__reconnect = reconnect
+        self.__reconnect_attempts = reconnect_attempts
+        self.__reconnect_delay = reconnect_delay
+        self.__timeout = timeout
+        # * Live URL IO Attrs
+        self.__ring = ByteRingBuffer(buffer_size, min(HISTORY_SIZE, buffer_size // 4))
+        self.__listeners: List[ICYMetadataCallback] = []
+        self.__metadata = ICYMetadata()
+        self.__metaint = 0
+        self.__headers: Dict[str, str] = {}
+        self.__reconnects = 0
+        self.__pos = 0
+        self.__real_pos = 0
+        self.__closing = False
+        self.__stream: Optional[URLOpenRet] = self.__connect()
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+    
+    # ^ Magic Methods
+    
+    def __del__(self) -> None:
+        if self.closefd and (not self.closed):
+            self.close()
+    
+    def __iter__(self) -> NoReturn:
+        raise NotImplementedError
+    
+    def __next__(self) -> NoReturn:
+        raise NotImplementedError
+    
+    def __enter__(self) -> Self:
+        return self
+    
+    def __exit__(self, *args: object) -> None:
+        if self.closefd and (not self.closed):
+            self.close()
+    
+    # ^ Main Propertyes
+    
+    @property
+    def name(self) -> Optional[str]:
+        return None
+    
+    @property
+    def mode(self) -> str:
+        return 'r'
+    
+    @property
+    def closed(self) -> bool:
+        return self.__ring.closed
+    
+    @property
+    def closefd(self) -> bool:
+        return self.__closefd
+    
+    # ^ URL Open Propertyes
+    
+    @property
+    def length(self) -> None:
+        return None
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self.__headers
+    
+    # ^ Live URL IO Propertyes
+    
+    @property
+    def url(self) -> str:
+        return self.__url
+    
+    @property
+    def downloaded(self) -> int:
+        """The total number of audio bytes received (ICY metadata excluded)."""
+        return self.__ring.end
+    
+    @property
+    def buffer_size(self) -> int:
+        return self.__ring.capacity
+    
+    @property
+    def metaint(self) -> int:
+        """The ICY metadata interval in bytes (`0` if the server does not send metadata)."""
+        return self.__metaint
+    
+    @property
+    def metadata(self) -> ICYMetadata:
+        """The last received ICY metadata."""
+        return self.__metadata
+    
+    @property
+    def reconnects(self) -> int:
+        return self.__reconnects
+    
+    # ^ Live URL IO Methods
+    
+    def add_listener(self, callback: ICYMetadataCallback) -> None:
+        """Subscribe to the ICY metadata updates. The callback is called from the download thread."""
+        self.__listeners.append(callback)
+    
+    def remove_listener(self, callback: ICYMetadataCallback) -> None:
+        self.__listeners.remove(callback)
+    
+    def release_head(self) -> None:
+        """Let the ring buffer drop the beginning of the stream.
+        
+        Until it is called, the downloaded data is kept for the format detection
+        and the download runs only as fast as the reading.
+        """
+        self.__ring.unpin()
+    
+    # ^ IO Check Methods
+    
+    def seekable(self) -> bool:
+        return False
+    
+    def readable(self) -> bool:
+        return not self.closed
+    
+    def writable(self) -> bool:
+        return False
+    
+    # ^ IO Methods
+    
+    def isatty(self) -> bool:
+        return False
+    
+    def tell(self) -> int:
+        return self.__pos
+    
+    def close(self) -> None:
+        self.__closing = True
+        self.__ring.close()
+    
+    def read(self, size: int=-1, /) -> bytes:
+        if size < 0:
+            size = DEFAULT_BUFFER_SIZE
+        if self.__pos >= PHANTOM_START:
+            # * The decoders probe the end of the stream (ID3v1 and etc.), there is nothing there.
+            self.__pos += size
+            return bytes(size)
+        data = self.__ring.read(self.__pos, size)
+        self.__pos += len(data)
+        self.__real_pos = self.__pos
+        return data
+    
+    def read1(self, size: int=-1, /) -> bytes:
+        return self.read(size)
+    
+    def readinto(self, b: bytearray, /) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+    
+    def readinto1(self, b: bytearray, /) -> int:
+        return self.readinto(b)
+    
+    def seek(self, offset: int, whence: int=0, /) -> int:
+        """Move inside the kept history or ahead of the stream. The end of the stream is virtual."""
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self.__pos + offset
+        elif whence == 2:
+            pos = LIVE_LENGTH + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < PHANTOM_START:
+            if pos < self.__ring.start:
+                raise OSError(f"Position {pos} has already left the ring buffer")
+            self.__real_pos = pos
+        self.__pos = pos
+        return pos
+    
+    # ^ IO Methods (NOT IMPLEMENTED)
+    
+    @deprecated('NOT IMPLEMENTED')
+    def write(self):
+        raise OSError
+    
+    @deprecated('NOT IMPLEMENTED')
+    def writelines(self, lines: Iterable[bytes], /):
+        raise OSError
+    
+    @deprecated('NOT IMPLEMENTED')
+    def fileno(self):
+        raise OSError
+    
+    @deprecated('NOT IMPLEMENTED')
+    def flush(self):
+        raise NotImplementedError
\ No newline at end of file
@@ -0,0 +1,249 @@
+import queue
+import numpy as np
+from numpy import ndarray
+from queue import Queue
+from threading import Lock
+# > Typing
+from typing_extensions import Iterator, List, Optional, Tuple
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels, AudioDType
+from ..base import AudioSourceBase, StreamerBase
+from ..processors import Converter, get_mix_matrix, convert_samples
+from .virtualaudiosource import read_into
+
+# ! Constants
+
+MIXER_BLOCK_SIZE = 1024
+# * The mixed blocks are reused in a ring: one is mixed, one waits in the queue of a streamer, one is played.
+MIXER_OUTPUT_BLOCKS = 4
+MIXER_STREAM_QUEUE_SIZE = 8
+
+# ! Mixer Input Class
+class MixerInput:
+    """An input of the `Mixer` reading an audio source. Returned by `Mixer.add`.
+    
+    The `gain` and `pan` can be changed at any moment, the mixing matrix is rebuilt
+    in the calling thread and picked up by the mixer at the next block.
+    """
+    
+    def __init__(self, mixer: 'Mixer', source: Optional[AudioSourceBase], channels: AudioChannels, gain: float, pan: float) -> None:
+        self.mixer = mixer
+        self.source = source
+        self.channels = channels
+        self.block = np.zeros((mixer.block_size, channels), np.float32)
+        self.ended = False
+        self.__gain = gain
+        self.__pan = pan
+    
+    # ^ Propertyes
+    
+    @property
+    def gain(self) -> float:
+        return self.__gain
+    
+    @gain.setter
+    def gain(self, value: float) -> None:
+        self.__gain = value
+        self.mixer.rebuild()
+    
+    @property
+    def pan(self) -> float:
+        """The balance between the left (`-1.0`) and the right (`1.0`) output channels."""
+        return self.__pan
+    
+    @pan.setter
+    def pan(self, value: float) -> None:
+        if not (-1.0 <= value <= 1.0):
+            raise ValueError(f"The pan must be between -1.0 and 1.0, not {value}")
+        self.__pan = value
+        self.mixer.rebuild()
+    
+    # ^ Methods
+    
+    def get_matrix(self, channels: AudioChannels) -> ndarray:
+        """The `self.channels x channels` gains of the input in the output channels."""
+        matrix = get_mix_matrix(self.channels, channels) * self.__gain
+        if channels == 2:
+            matrix[:, 0] *= min(1.0, 1.0 - self.__pan)
+            matrix[:, 1] *= min(1.0, 1.0 + self.__pan)
+        return matrix
+    
+    def fill(self, out: ndarray) -> int:
+        """Fill `out` with the next frames (called by the mixer), return the number of frames available."""
+        count = read_into(self.source, out)
+        if count < len(out):
+            out[count:] = 0
+            self.ended = True
+        return count
+    
+    def remove(self) -> None:
+        self.mixer.remove(self)
+
+# ! Mixer Stream Class
+class MixerStream(MixerInput):
+    """An input of the `Mixer` fed with arrays like a streamer. Returned by `Mixer.add_stream`.
+    
+    An underrun is filled with silence, the input ends after `close` when all the arrays are mixed.
+    """
+    
+    def __init__(self, mixer: 'Mixer', channels: AudioChannels, gain: float, pan: float, maxsize: int=MIXER_STREAM_QUEUE_SIZE) -> None:
+        super().__init__(mixer, None, channels, gain, pan)
+        self.queue: Queue[ndarray] = Queue(maxsize)
+        self.closed = False
+        self.__pending: Optional[ndarray] = None
+    
+    def send(self, data: ndarray) -> bool:
+        """Put the `frames x channels` (or `frames` for the mono) array to play, waits while the queue is full."""
+        if self.closed or self.ended:
+            return False
+        self.queue.put(data.reshape(-1, self.channels))
+        return True
+    
+    def close(self) -> None:
+        self.closed = True
+    
+    def fill(self, out: ndarray) -> int:
+        done = 0
+        while done < len(out):
+            if (self.__pending is None) or (len(self.__pending) == 0):
+                try:
+                    self.__pending = self.queue.get_nowait()
+                except queue.Empty:
+                    self.ended = self.closed
+                    break
+            size = min(len(out) - done, len(self.__pending))
+            convert_samples(self.__pending[:size], out[done:done + size])
+            self.__pending = self.__pending[size:]
+            done += size
+        out[done:] = 0
+        return done
+
+# ! Mixer Class
+class Mixer:
+    """Mixes any number of audio sources and streams into one stream of blocks for a streamer.
+    
+    The inputs are read into their own blocks and copied side by side into one work buffer,
+    so all the inputs are summed by a single matrix product with the gains and pans of the inputs
+    into a preallocated output block. The inputs, the matrix and the buffers are built in the thread
+    adding or changing the inputs and published with one assignment, so the mixing
+    allocates nothing and the inputs can be changed while it runs.
+    """
+    
+    def __init__(
+        self,
+        samplerate: AudioSamplerate=44100,
+        channels: AudioChannels=2,
+        dtype: AudioDType='float32',
+        block_size: int=MIXER_BLOCK_SIZE
+    ) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self.block_size = block_size
+        self.converter = Converter(channels, channels, 'float32', self.dtype)
+        self.__lock = Lock()
+        self.__mixed = np.zeros((block_size, channels), np.float32)
+        self.__outputs = [np.zeros((block_size, channels), self.dtype) for _ in range(MIXER_OUTPUT_BLOCKS)]
+        self.__index = 0
+        self.__snapshot: Tuple[Tuple[MixerInput, ...], ndarray, ndarray] = ((), np.zeros((0, channels), np.float32), np.zeros((block_size, 0), np.float32))
+    
+    # ^ Magic Methods
+    
+    def __len__(self) -> int:
+        return len(self.inputs)
+    
+    def __iter__(self) -> Iterator[MixerInput]:
+        return iter(self.inputs)
+    
+    # ^ Propertyes
+    
+    @property
+    def inputs(self) -> Tuple[MixerInput, ...]:
+        return self.__snapshot[0]
+    
+    # ^ Hidden Methods
+    
+    def __publish(self, inputs: Tuple[MixerInput, ...]) -> None:
+        matrix = np.zeros((sum(i.channels for i in inputs), self.channels), np.float32)
+        offset = 0
+        for i in inputs:
+            matrix[offset:offset + i.channels] = i.get_matrix(self.channels)
+            offset += i.channels
+        self.__snapshot = (inputs, matrix, np.zeros((self.block_size, len(matrix)), np.float32))
+    
+    def __add(self, i: MixerInput) -> None:
+        with self.__lock:
+            self.__publish(self.inputs + (i,))
+    
+    # ^ Methods
+    
+    def add(self, source: AudioSourceBase, gain: float=1.0, pan: float=0.0) -> MixerInput:
+        """Add the source to the mix (from any thread). The samplerate of the source must match the mixer.
+        
+        Raises:
+            ValueError: The samplerate of the source does not match (see `ResampledAudioSource`).
+        """
+        if source.samplerate != self.samplerate:
+            raise ValueError(f"The source samplerate {source.samplerate} does not match the mixer samplerate {self.samplerate}")
+        i = MixerInput(self, source, source.channels, gain, pan)
+        self.__add(i)
+        return i
+    
+    def add_stream(self, channels: Optional[AudioChannels]=None, gain: float=1.0, pan: float=0.0, maxsize: int=MIXER_STREAM_QUEUE_SIZE) -> MixerStream:
+        """Add an input fed with arrays by `MixerStream.send` (from any thread)."""
+        i = MixerStream(self, channels or self.channels, gain, pan, maxsize)
+        self.__add(i)
+        return i
+    
+    def remove(self, i: MixerInput) -> None:
+        with self.__lock:
+            if i in self.inputs:
+                self.__publish(tuple(other for other in self.inputs if (other is not i)))
+    
+    def prune(self) -> List[MixerInput]:
+        """Remove the inputs which have ended, return them."""
+        with self.__lock:
+            ended = [i for i in self.inputs if i.ended]
+            if len(ended) > 0:
+                self.__publish(tuple(i for i in self.inputs if (not i.ended)))
+        return ended
+    
+    def clear(self) -> None:
+        with self.__lock:
+            self.__publish(())
+    
+    def rebuild(self) -> None:
+        """Rebuild the mixing matrix after a change of the gains or pans of the inputs."""
+        with self.__lock:
+            self.__publish(self.inputs)
+    
+    def mix(self, frames: Optional[int]=None) -> ndarray:
+        """Mix the next `frames` (up to `block_size`, by default) frames of all the inputs.
+        
+        Returns:
+            ndarray: The `frames x channels` block of the mixer `dtype`. The block is reused after
+                `MIXER_OUTPUT_BLOCKS - 1` next calls, it should not be kept for longer.
+        """
+        inputs, matrix, work = self.__snapshot
+        frames = self.block_size if (frames is None) else min(frames, self.block_size)
+        mixed = self.__mixed[:frames]
+        out = self.__outputs[self.__index][:frames]
+        self.__index = (self.__index + 1) % len(self.__outputs)
+        if len(inputs) == 0:
+            mixed.fill(0)
+        else:
+            offset = 0
+            for i in inputs:
+                block = i.block[:frames]
+                if i.ended:
+                    block.fill(0)
+                else:
+                    i.fill(block)
+                np.copyto(work[:frames, offset:offset + i.channels], block)
+                offset += i.channels
+            np.matmul(work[:frames], matrix, out=mixed)
+        return self.converter.process(mixed, out)
+    
+    def feed(self, streamer: StreamerBase, frames: Optional[int]=None) -> bool:
+        """Mix the next block and send it to the streamer (waits while the streamer is busy)."""
+        return streamer.send(self.mix(frames))
\ No newline at end of file
@@ -0,0 +1,201 @@
+import math
+from numpy import ndarray
+from threading import Lock
+from concurrent.futures import Future, ThreadPoolExecutor
+# > Typing
+from typing_extensions import Callable, List, Iterable, Optional, Tuple, TypeAlias, Union
+# > Local Imports
+from .._types import FilePathType, AudioSamplerate, AudioChannels
+from ..base import AudioSourceBase
+from ..processors import ResamplerQuality
+from .fileaudiosource import FileAudioSource
+from .virtualaudiosource import VirtualAudioSource, SliceAudioSource, ResampledAudioSource, ConvertedAudioSource
+from .crossfade import Prefetcher, PREFETCH_BLOCK_SIZE
+
+# ! Types
+
+PlaylistItem: TypeAlias = Union[FilePathType, AudioSourceBase, Callable[[], AudioSourceBase]]
+
+# ! Constants
+
+PRELOAD_TIME = 5.0
+
+# ! Playlist Track Class
+class PlaylistTrack:
+    """An opened track of the playlist: the source, its gapless and format wrappers and the prefetcher."""
+    
+    def __init__(self, index: int, source: AudioSourceBase, wrapped: AudioSourceBase, prefetcher: Prefetcher, owned: bool) -> None:
+        self.index = index
+        self.source = source
+        self.wrapped = wrapped
+        self.prefetcher = prefetcher
+        self.owned = owned
+    
+    def close(self) -> None:
+        self.prefetcher.close()
+        if self.owned:
+            self.source.close()
+
+# ! Playlist Audio Source Class
+class PlaylistAudioSource(VirtualAudioSource):
+    """A queue of tracks played one after another without gaps.
+    
+    While a track plays, the next one is opened (the tags, the cover and the decoder) in a background
+    thread and its first `preload` seconds are decoded ahead, so the switch costs nothing. The encoder delay
+    and padding left by the decoder (see `FileAudioSource.gapless`) are dropped, so an album is played
+    sample-continuous. The tracks of other formats are converted to the `samplerate` and `channels` of the playlist.
+    
+    The position, `frames`, `duration` and `metadata` are the ones of the current track.
+    The tracks which failed to open are skipped and kept in `errors`.
+    """
+    
+    def __init__(
+        self,
+        items: Iterable[PlaylistItem],
+        samplerate: Optional[AudioSamplerate]=None,
+        channels: Optional[AudioChannels]=None,
+        preload: float=PRELOAD_TIME,
+        gapless: bool=True,
+        quality: ResamplerQuality='medium',
+        block_size: int=PREFETCH_BLOCK_SIZE
+    ) -> None:
+        self.items: List[PlaylistItem] = list(items)
+        if len(self.items) == 0:
+            raise ValueError("At least one track is required")
+        self.preload = preload
+        self.gapless = gapless
+        self.quality = quality
+        self.block_size = block_size
+        self.errors: List[Tuple[int, BaseException]] = []
+        self.__executor = ThreadPoolExecutor(1, thread_name_prefix='playlist')
+        self.__next: Optional[Future] = None
+        self.__lock = Lock()
+        self.__cursor = 0
+        source, owned = self.__open_source(self.items[0])
+        self.target_samplerate = samplerate or source.samplerate
+        self.target_channels = channels or source.channels
+        self.__track = self.__prepare(0, source, owned)
+        super().__init__(source, True)
+        self.__position = 0
+        self.__schedule()
+    
+    # ^ Hidden Methods
+    
+    def __open_source(self, item: PlaylistItem) -> Tuple[AudioSourceBase, bool]:
+        if isinstance(item, AudioSourceBase):
+            return item, False
+        if callable(item):
+            return item(), True
+        return FileAudioSource(item), True
+    
+    def __prepare(self, index: int, source: AudioSourceBase, owned: bool) -> PlaylistTrack:
+        wrapped = source
+        if self.gapless and ((trim := getattr(source, 'gapless', (0, 0))) != (0, 0)):
+            wrapped = SliceAudioSource(wrapped, trim[0], source.frames - trim[1])
+        if wrapped.samplerate != self.target_samplerate:
+            wrapped = ResampledAudioSource(wrapped, self.target_samplerate, self.quality)
+        if wrapped.channels != self.target_channels:
+            wrapped = ConvertedAudioSource(wrapped, self.target_channels)
+        depth = max(math.ceil(self.preload * self.target_samplerate / self.block_size), 2)
+        return PlaylistTrack(index, source, wrapped, Prefetcher(wrapped, 0, self.block_size, depth), owned)
+    
+    def __open(self, index: int) -> Optional[PlaylistTrack]:
+        try:
+            source, owned = self.__open_source(self.items[index])
+            return self.__prepare(index, source, owned)
+        except Exception as e:
+            self.errors.append((index, e))
+            return None
+    
+    def __schedule(self) -> None:
+        with self.__lock:
+            if (self.__next is None) and (self.__cursor + 1 < len(self.items)):
+                self.__cursor += 1
+                self.__next = self.__executor.submit(self.__open, self.__cursor)
+    
+    def __advance(self) -> bool:
+        while self.__next is not None:
+            track, self.__next = self.__next.result(), None
+            if track is None:
+                # * The track failed to open, the one after it is tried.
+                self.__schedule()
+                continue
+            self.__track.close()
+            self.__track, self.source = track, track.source
+            self._pos = self.__position = 0
+            self.__schedule()
+            return True
+        return False
+    
+    def _sources(self) -> Iterable[AudioSourceBase]:
+        return (self.__track.source,)
+    
+    def _readinto(self, out: ndarray) -> int:
+        if self.__position != self._pos:
+            self.__track.prefetcher.close()
+            self.__track.prefetcher = Prefetcher(self.__track.wrapped, self._pos, self.block_size)
+        done = 0
+        while done < len(out):
+            count = self.__track.prefetcher.readinto(out[done:])
+            done += count
+            self._pos += count
+            if (done < len(out)) and (not self.__advance()):
+                break
+        self.__position = self._pos
+        return done
+    
+    # ^ Propertyes
+    
+    @property
+    def frames(self) -> int:
+        return self.__track.wrapped.frames
+    
+    @property
+    def samplerate(self) -> AudioSamplerate:
+        return self.target_samplerate
+    
+    @property
+    def channels(self) -> AudioChannels:
+        return self.target_channels
+    
+    @property
+    def current(self) -> int:
+        """The index of the current track in the `items`."""
+        return self.__track.index
+    
+    @property
+    def preloaded(self) -> int:
+        """The number of frames of the next track decoded ahead (`0` while it is opened)."""
+        if (self.__next is None) or (not self.__next.done()) or ((track := self.__next.result()) is None):
+            return 0
+        return track.prefetcher.decoded
+    
+    @property
+    def track(self) -> AudioSourceBase:
+        """The source of the current track."""
+        return self.__track.source
+    
+    # ^ Methods
+    
+    def append(self, item: PlaylistItem) -> None:
+        """Add the track to the end of the queue (from any thread)."""
+        self.items.append(item)
+        self.__schedule()
+    
+    def skip(self) -> bool:
+        """Switch to the next track, return `False` if there is none."""
+        self.semaphore.acquire()
+        try:
+            return self.__advance()
+        finally:
+            self.semaphore.release()
+    
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            if self.__next is not None:
+                if (track := self.__next.result()) is not None:
+                    track.close()
+                self.__next = None
+            self.__track.close()
+            self.__executor.shutdown()
\ No newline at end of file
@@ -1,13 +1,25 @@
+import asyncio
 from numpy import ndarray
 from soundfile import SoundFile
 from threading import Semaphore
+from io import DEFAULT_BUFFER_SIZE
 # > Typing
-from typing_extensions import Optional, Self
+from typing_extensions import Literal, Optional, Self, Union
 # > Local Imports
 from .._types import AudioSamplerate, AudioChannels, AudioSubType, AudioFormat, AudioEndians, AudioDType
-from ..base import AudioSourceBase
-from ..functions import get_mutagen_info, get_audio_metadata
+from ..base import AudioSourceBase, AsyncAudioSourceBase
+from ..functions import (
+    aiorun,
+    get_audio_metadata, get_head_size, get_stream_mutagen_info, get_url_mutagen_info,
+    MPEG_PROBE_SIZE, MAX_HEAD_SIZE
+)
 from .urlio import URLIO
+from .asyncurlio import AsyncURLIO
+from .liveurlio import LiveURLIO
+
+# ! Constants
+
+HEAD_SIZE = 64 * 1024
 
 # ! URL Audio Source Class
 class URLAudioSource(AudioSourceBase):
@@ -22,13 +34,27 @@ class URLAudioSource(AudioSourceBase):
         subtype:  Optional[AudioSubType]=None,
         endian: Optional[AudioEndians]=None,
         format: Optional[AudioFormat]=None,
-        closefd: bool=True
+        closefd: bool=True,
+        live: bool=False,
+        connections: int=1
     ):
+        """Open the audio stream.
+        
+        Args:
+            live (bool, optional): The stream is endless (internet radio). It is read through a fixed-size ring buffer without seeking, the ICY metadata is available from `urlio`. Defaults to `False`.
+            connections (int, optional): The number of connections downloading the file by segments in parallel (if the server supports ranges). Defaults to `1`.
+        """
         self.name = None
         self.url = url
-        self.urlio = URLIO(url, closefd=closefd)
+        self.live = live
+        if live:
+            self.urlio: Union[URLIO, LiveURLIO] = LiveURLIO(url, closefd=closefd)
+        else:
+            self.urlio = URLIO(url, closefd=closefd, connections=connections)
         self.sfio = SoundFile(self.urlio, 'r', samplerate, channels, subtype, endian, format, closefd=closefd)
-        self.minfo = get_mutagen_info(self.name)
+        if live:
+            self.urlio.release_head()
+        self.minfo = None if live else get_url_mutagen_info(self.urlio)
         self.metadata = get_audio_metadata(self.sfio, self.minfo)
         self.semaphore = Semaphore(1)
         self.closefd = closefd
@@ -50,11 +76,16 @@ class URLAudioSource(AudioSourceBase):
     
     @property
     def duration(self) -> float:
-        """The duration of the audio source in seconds."""
+        """The duration of the audio source in seconds (`inf` for a live stream)."""
+        if self.live:
+            return float('inf')
         return self.sfio.frames / self.sfio.samplerate
     
     @property
     def frames(self) -> int:
+        """The number of frames of the audio source, `-1` for a live stream (its end is unknown)."""
+        if self.live:
+            return -1
         return self.sfio.frames
     
     @property
@@ -99,7 +130,7 @@ class URLAudioSource(AudioSourceBase):
     # ^ IO Check Methods
     
     def seekable(self) -> bool:
-        return self.sfio.seekable() and not self.closed
+        return self.sfio.seekable() and (not self.live) and (not self.closed)
     
     def readable(self) -> bool:
         return not self.closed
@@ -121,11 +152,13 @@ class URLAudioSource(AudioSourceBase):
             always_2d (bool, optional): With `always_2d=True`, audio data is always returned as a two-dimensional array, even if the audio file has only one channel. Defaults to `False`.
         
         Raises:
-            ValueError: The `dtype` value is incorrect.
+            ValueError: The `dtype` value is incorrect, or the whole rest of a live stream is requested.
 
         Returns:
             ndarray: If out is specified, the data is written into the given array instead of creating a new array. In this case, the arguments *dtype* and *always_2d* are silently ignored! If *frames* is not given, it is obtained from the length of out.
         """
+        if self.live and (frames < 0) and ('out' not in extra):
+            raise ValueError("Unable to read the whole rest of an endless source")
         self.semaphore.acquire()
         result = self.sfio.read(frames, dtype, always_2d, **extra)
         self.semaphore.release()
@@ -140,6 +173,8 @@ class URLAudioSource(AudioSourceBase):
         Returns:
             ndarray: If out is specified, the data is written into the given array instead of creating a new array. In this case, the arguments *dtype* and *always_2d* are silently ignored! If *frames* is not given, it is obtained from the length of out.
         """
+        if self.live and (seconds < 0) and ('out' not in extra):
+            raise ValueError("Unable to read the whole rest of an endless source")
         self.semaphore.acquire()
         result = self.sfio.read(int(seconds * self.sfio.samplerate), dtype, always_2d, **extra)
         self.semaphore.release()
@@ -174,4 +209,147 @@ class URLAudioSource(AudioSourceBase):
     def close(self) -> None:
         """Close the file. Can be called multiple times."""
         self.urlio.close()
-        self.sfio.close()
\ No newline at end of file
+        self.sfio.close()
+
+# ! Async URL Audio Source Class
+class AsyncURLAudioSource(AsyncAudioSourceBase, URLAudioSource):
+    """A class for reading an audio stream in array format by direct/indirect reference (async).
+    
+    The network I/O runs on the event loop, the decoding is handed to the executor only
+    when the estimated amount of bytes for the requested frames is already buffered.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        samplerate: Optional[AudioSamplerate]=None,
+        channels: Optional[AudioChannels]=None,
+        subtype:  Optional[AudioSubType]=None,
+        endian: Optional[AudioEndians]=None,
+        format: Optional[AudioFormat]=None,
+        closefd: bool=False,
+        loop: Optional[asyncio.AbstractEventLoop]=None,
+        buffer_type: Literal['temp', 'mem']='temp',
+        head_size: int=HEAD_SIZE
+    ) -> None:
+        if loop is not None:
+            self.loop = loop
+        else:
+            self.loop = asyncio.get_running_loop()
+        self.name = None
+        self.url = url
+        self.live = False
+        self.urlio = AsyncURLIO(url, buffer_type, closefd=closefd, loop=self.loop)
+        self.sfio: Optional[SoundFile] = None
+        self.minfo = None
+        self.metadata = None
+        self.semaphore = Semaphore(1)
+        self.closefd = closefd
+        self.head_size = head_size
+        self.__sfargs = (samplerate, channels, subtype, endian, format)
+    
+    # ^ Dander Methods
+    
+    def __del__(self) -> None:
+        if self.closefd and (self.sfio is not None) and (not self.closed):
+            super().close()
+    
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+    
+    async def __aexit__(self, *args: object) -> None:
+        if self.closefd and (not self.closed):
+            await self.close()
+    
+    # ^ Hidden Methods
+    
+    def __open_sync(self, head: bytes, tail: Optional[bytes]) -> None:
+        self.sfio = SoundFile(self.urlio, 'r', *self.__sfargs, closefd=self.closefd)
+        self.minfo = get_stream_mutagen_info(head, tail, self.urlio.length)
+        self.metadata = get_audio_metadata(self.sfio, self.minfo)
+    
+    async def __read_head(self) -> bytes:
+        head = await self.urlio.head(max(self.head_size, MPEG_PROBE_SIZE))
+        while (len(head) < (size := min(get_head_size(head), MAX_HEAD_SIZE))):
+            if len(data := await self.urlio.head(size)) == len(head):
+                break
+            head = data
+        return head
+    
+    def __estimate(self, frames: int) -> int:
+        length, total = self.urlio.length, self.sfio.frames
+        if (length is not None) and (total > 0):
+            bpf = length / total
+        elif self.bitrate is not None:
+            bpf = self.bitrate / 8 / self.sfio.samplerate
+        else:
+            bpf = self.sfio.channels * 4
+        return int(frames * bpf) + DEFAULT_BUFFER_SIZE
+    
+    async def __prepare(self, frames: int) -> None:
+        if frames < 0:
+            await self.urlio.fulling()
+        else:
+            await self.urlio.fetch(self.__estimate(frames))
+    
+    # ^ Propertyes
+    
+    @property
+    def closed(self) -> bool:
+        """Whether the IO will be closed after the context manager is closed."""
+        if self.sfio is None:
+            return self.urlio.closed
+        return self.sfio.closed
+    
+    # ^ IO Check Methods
+    
+    def seekable(self) -> bool:
+        return super().seekable()
+    
+    def readable(self) -> bool:
+        return not self.closed
+    
+    # ^ Async Methods
+    
+    async def open(self) -> Self:
+        """Connect, buffer the head of the stream and open the decoder. Can be called multiple times."""
+        if self.sfio is None:
+            await self.urlio.open()
+            head, tail = await asyncio.gather(self.__read_head(), self.urlio.tail())
+            await aiorun(self.loop, self.__open_sync, head, tail)
+        return self
+    
+    async def read(
+        self,
+        frames: int=-1,
+        dtype: AudioDType='float32',
+        always_2d: bool=False,
+        **extra: object
+    ) -> ndarray:
+        await self.open()
+        await self.__prepare(frames)
+        return await aiorun(self.loop, super().read, frames, dtype, always_2d, **extra)
+    
+    async def readline(self, seconds: float=-1.0, dtype: AudioDType='float32', always_2d: bool=False, **extra) -> ndarray:
+        await self.open()
+        await self.__prepare(int(seconds * self.sfio.samplerate))
+        return await aiorun(self.loop, super().readline, seconds, dtype, always_2d, **extra)
+    
+    async def seek(self, frames: int, whence=0) -> int:
+        await self.open()
+        if whence == 0:
+            await self.urlio.fill(self.__estimate(frames))
+        elif whence == 1:
+            await self.urlio.fill(self.__estimate(self.sfio.tell() + frames))
+        else:
+            await self.urlio.fulling()
+        return await aiorun(self.loop, super().seek, frames, whence)
+    
+    async def tell(self) -> int:
+        return super().tell()
+    
+    async def close(self) -> None:
+        if self.sfio is None:
+            return self.urlio.close()
+        return await aiorun(self.loop, super().close)
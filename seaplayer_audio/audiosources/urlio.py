@@ -1,80 +1,205 @@
-from urllib.request import urlopen
+from collections import deque
+from threading import Condition, Thread
+from http.client import HTTPException
+from urllib.request import Request, urlopen
 from tempfile import TemporaryFile
 from io import BufferedRandom, BufferedReader, BytesIO, DEFAULT_BUFFER_SIZE
 from typing_extensions import (
-    Iterable,
+    Iterable, Deque, List, Tuple,
     Self,
     Literal, Optional,
     NoReturn, deprecated
 )
 from .._types import URLOpenRet
 
+# ! Constants
+
+TAIL_SIZE = 16 * 1024
+SEGMENT_SIZE = 1024 * 1024
+SEGMENT_ATTEMPTS = 3
+SEGMENT_PENDING = 0
+SEGMENT_LOADING = 1
+SEGMENT_DONE = 2
+SEGMENT_FAILED = 3
+
 # ! URL IO Class
 class URLIO(BufferedReader):
+    """A seekable reader of a remote file that keeps the downloaded data in a buffer.
+    
+    With `connections > 1` and a server supporting ranges, the file is split into segments of `segment_size` bytes
+    that are downloaded concurrently in the background, a read waits only for the segments it covers.
+    """
     # ^ Hidden init methods
-
+    
     def __open_buffer(self, buffer_type: Literal['temp', 'mem']) -> BufferedRandom:
         if buffer_type == 'mem':
             return BytesIO()
         elif buffer_type == 'temp':
-            return TemporaryFile('wb+', delete=True, delete_on_close=True)
+            return TemporaryFile('wb+')
         raise ValueError(buffer_type)
-
+    
     def __getsize(self) -> int:
-        ct = self.tell()
-        size = self.__buffer.seek(0, 2)
-        self.__buffer.seek(ct)
-        return size
+        return self.__size
     
     def __topload(self, size: int) -> None:
         if not self.__full:
-            ct = self.__buffer.tell()
             data = self.__stream.read(size)
             if len(data) != size:
                 self.__full = True
                 self.__stream.close()
-            self.__buffer.seek(0, 2)
+            self.__buffer.seek(self.__size)
             self.__buffer.write(data)
-            self.__buffer.seek(ct)
+            self.__size += len(data)
     
     def __fullload(self) -> None:
         if not self.__full:
-            ct = self.__buffer.tell()
-            self.__buffer.seek(0, 2)
+            self.__buffer.seek(self.__size)
             while len(data := self.__stream.read(DEFAULT_BUFFER_SIZE)) > 0:
                 self.__buffer.write(data)
+                self.__size += len(data)
             self.__stream.close()
             self.__full = True
-            self.__buffer.seek(ct)
     
     def __read_preparation(self, size: int) -> None:
         if not self.__full:
             if size > 0:
-                s = size - (self.__getsize() - self.__buffer.tell())
+                s = self.__pos + size - self.__size
                 if s > 0:
                     self.__topload(s)
             elif size <= 0:
                 self.__fullload()
     
-    def __seek_preparation(self, offset: int, whence: int) -> None:
-        if (not self.__full) and (offset >= 0):
-            if whence == 0:
-                s = self.__getsize() - offset
-                if s > 0:
-                    self.__topload(s)
-            elif whence == 1:
-                s = offset - (self.__getsize() - self.__buffer.tell())
-                if s > 0:
-                    self.__topload(s)
-            elif whence == 2:
-                if (self.length is not None) and (self.length != 0):
-                    s = self.length - self.__getsize() - offset
-                    if s > 0:
-                        self.__topload(s)
-                    else:
-                        self.__fullload()
+    def __in_tail(self, size: int) -> bool:
+        if self.__full or self.__segmented or (self.__length is None) or (size <= 0):
+            return False
+        start = self.__length - self.__tail_size
+        if (self.__pos < max(start, self.__size)) or (self.__pos + size > self.__length):
+            return False
+        return self.tail() is not None
+    
+    def __read_tail(self, size: int) -> bytes:
+        start = self.__pos - (self.__length - len(self.__tail))
+        data = self.__tail[start:start + size]
+        self.__pos += len(data)
+        return data
+    
+    def __end(self) -> int:
+        if self.__length is None:
+            self.__fullload()
+            return self.__size
+        return self.__length
+    
+    # ^ Hidden segmented download methods
+    
+    def __segment_range(self, index: int) -> Tuple[int, int]:
+        start = index * self.__segment_size
+        return start, min(start + self.__segment_size, self.__length)
+    
+    def __take_segment(self) -> Optional[int]:
+        while len(self.__urgent) > 0:
+            index = self.__urgent.popleft()
+            if self.__segments[index] == SEGMENT_PENDING:
+                return index
+        while self.__cursor < len(self.__segments):
+            index = self.__cursor
+            self.__cursor += 1
+            if self.__segments[index] == SEGMENT_PENDING:
+                return index
+        return None
+    
+    def __fetch_segment(self, index: int) -> bytes:
+        start, end = self.__segment_range(index)
+        request = Request(self.__url, headers={'Range': f"bytes={start}-{end - 1}"})
+        with urlopen(request) as response:
+            if response.status != 206:
+                raise OSError(f"The server ignored the range request (status {response.status})")
+            data = response.read(end - start)
+        if len(data) != end - start:
+            raise OSError(f"The segment {index} is incomplete ({len(data)} of {end - start} bytes)")
+        return data
+    
+    def __segment_worker(self) -> None:
+        while True:
+            with self.__condition:
+                index = None if self.__closing else self.__take_segment()
+                if index is None:
+                    self.__workers -= 1
+                    return
+                self.__segments[index] = SEGMENT_LOADING
+            data, error = None, None
+            for _ in range(SEGMENT_ATTEMPTS):
+                try:
+                    data, error = self.__fetch_segment(index), None
+                    break
+                except (OSError, HTTPException) as e:
+                    error = e
+            with self.__condition:
+                if (data is not None) and (not self.__closing):
+                    self.__buffer.seek(index * self.__segment_size)
+                    self.__buffer.write(data)
+                    self.__segments[index] = SEGMENT_DONE
+                    self.__loaded += len(data)
                 else:
-                    self.__fullload()
+                    self.__segments[index] = SEGMENT_FAILED
+                    self.__error = error
+                self.__condition.notify_all()
+    
+    def __require(self, start: int, end: int) -> None:
+        end = min(end, self.__length)
+        if start >= end:
+            return
+        indexes = range(start // self.__segment_size, (end - 1) // self.__segment_size + 1)
+        with self.__condition:
+            for index in indexes:
+                # * A failed segment is downloaded again once a read needs it, so a network failure is not permanent.
+                if self.__segments[index] == SEGMENT_FAILED:
+                    self.__segments[index] = SEGMENT_PENDING
+                if self.__segments[index] == SEGMENT_PENDING:
+                    self.__urgent.append(index)
+            if (len(self.__urgent) > 0) and (self.__workers == 0) and (not self.__closing):
+                self.__start_workers(1)
+            for index in indexes:
+                while (self.__segments[index] < SEGMENT_DONE) and (not self.__closing):
+                    self.__condition.wait()
+                if self.__segments[index] == SEGMENT_FAILED:
+                    start, end = self.__segment_range(index)
+                    raise OSError(
+                        f"Failed to download the segment {index} (bytes {start}-{end - 1}) of {self.__url!r} "
+                        f"after {SEGMENT_ATTEMPTS} attempts, it is retried by the next read"
+                    ) from self.__error
+    
+    def __read_segmented(self, start: int, size: int) -> bytes:
+        end = self.__length if (size < 0) else min(start + size, self.__length)
+        if start >= end:
+            return b''
+        self.__require(start, end)
+        with self.__condition:
+            self.__buffer.seek(start)
+            return self.__buffer.read(end - start)
+    
+    def __start_segmented(self) -> None:
+        self.__stream.close()
+        count = (self.__length + self.__segment_size - 1) // self.__segment_size
+        self.__segments: List[int] = [SEGMENT_PENDING] * count
+        self.__urgent: Deque[int] = deque()
+        self.__cursor = 0
+        self.__loaded = 0
+        self.__error: Optional[BaseException] = None
+        self.__workers = 0
+        with self.__condition:
+            self.__start_workers(min(self.__connections, count))
+    
+    def __start_workers(self, count: int) -> None:
+        for _ in range(count):
+            self.__workers += 1
+            Thread(target=self.__segment_worker, daemon=True).start()
+    
+    @staticmethod
+    def __content_length(stream: URLOpenRet) -> Optional[int]:
+        value = stream.headers.get('Content-Length', None)
+        if (value is not None) and value.strip().isdigit():
+            return int(value)
+        return None
     
     # ^ Init Method
     
@@ -82,15 +207,34 @@ class URLIO(BufferedReader):
         self,
         url: str,
         buffer_type: Literal['temp', 'mem']='temp',
-        closefd: bool=True
+        closefd: bool=True,
+        tail_size: int=TAIL_SIZE,
+        connections: int=1,
+        segment_size: int=SEGMENT_SIZE
     ) -> None:
+        if connections < 1:
+            raise ValueError(f"The number of connections must be positive, not {connections}")
         self.__url = url
         self.__buffer_type = buffer_type
         self.__closefd = closefd
+        self.__tail_size = tail_size
+        self.__connections = connections
+        self.__segment_size = segment_size
         # * URL IO Attrs
         self.__stream: URLOpenRet = urlopen(self.__url)
         self.__buffer = self.__open_buffer(self.__buffer_type)
+        self.__length = self.__content_length(self.__stream)
+        self.__tail: Optional[bytes] = None
+        self.__tail_fetched = False
+        self.__size = 0
+        self.__pos = 0
         self.__full = False
+        self.__closing = False
+        self.__condition = Condition()
+        self.__segmented = (connections > 1) and (self.__length is not None) and (self.__length > 0) and \
+            (self.__stream.headers.get('Accept-Ranges', '').strip().lower() == 'bytes')
+        if self.__segmented:
+            self.__start_segmented()
     
     # ^ Magic Methods
     
@@ -133,10 +277,7 @@ class URLIO(BufferedReader):
     
     @property
     def length(self) -> Optional[int]:
-        if hasattr(self.__stream, 'length'):
-            if isinstance(self.__stream.length, int):
-                return self.__stream.length
-        return None
+        return self.__length
     
     # ^ URL IO Propertyes
     
@@ -146,6 +287,8 @@ class URLIO(BufferedReader):
     
     @property
     def downloaded(self) -> int:
+        if self.__segmented:
+            return self.__loaded
         return self.__getsize()
     
     @property
@@ -154,13 +297,66 @@ class URLIO(BufferedReader):
     
     @property
     def full(self) -> bool:
+        if self.__segmented:
+            return self.__loaded == self.__length
         return self.__full
     
+    @property
+    def tail_size(self) -> int:
+        return self.__tail_size
+    
+    @property
+    def connections(self) -> int:
+        return self.__connections
+    
+    @property
+    def segmented(self) -> bool:
+        """Whether the file is downloaded by segments over several connections."""
+        return self.__segmented
+    
     # ^ URL IO Methods
     
     def fulling(self) -> None:
+        if self.__segmented:
+            return self.__require(0, self.__length)
         return self.__fullload()
     
+    def head(self, size: int) -> bytes:
+        """Return the first `size` bytes of the stream (downloading them if needed). The position is not changed."""
+        if self.__segmented:
+            return self.__read_segmented(0, size)
+        if (not self.__full) and (size > self.__size):
+            self.__topload(size - self.__size)
+        self.__buffer.seek(0)
+        return self.__buffer.read(size)
+    
+    def tail(self) -> Optional[bytes]:
+        """Return the last `tail_size` bytes of the stream.
+        
+        If they are not downloaded yet, they are fetched once by a single range request
+        and cached. Returns `None` if the length is unknown or the server does not support ranges.
+        """
+        if self.__segmented:
+            return self.__read_segmented(max(self.__length - self.__tail_size, 0), self.__tail_size)
+        if self.__full:
+            start = max(self.__size - self.__tail_size, 0)
+            self.__buffer.seek(start)
+            return self.__buffer.read(self.__size - start)
+        if not self.__tail_fetched:
+            self.__tail_fetched = True
+            if (self.__length is not None) and (self.__length > 0):
+                start = max(self.__length - self.__tail_size, 0)
+                request = Request(self.__url, headers={'Range': f"bytes={start}-{self.__length - 1}"})
+                try:
+                    with urlopen(request) as response:
+                        if response.status == 206:
+                            self.__tail = response.read(self.__length - start)
+                except OSError:
+                    pass
+                if (self.__tail is not None) and (len(self.__tail) != self.__length - start):
+                    self.__tail = None
+        return self.__tail
+    
     # ^ IO Check Methods
     
     def seekable(self) -> bool:
@@ -178,38 +374,57 @@ class URLIO(BufferedReader):
         return False
     
     def tell(self) -> int:
-        return self.__buffer.tell()
+        return self.__pos
     
     def close(self) -> None:
-        if not self.full:
-            self.__stream.close()
+        with self.__condition:
+            self.__closing = True
+            if not (self.__full or self.__segmented):
+                self.__stream.close()
             self.__buffer.close()
+            self.__condition.notify_all()
     
     def read(self, size: int=-1, /) -> bytes:
+        if self.__segmented:
+            data = self.__read_segmented(self.__pos, size)
+            self.__pos += len(data)
+            return data
+        if self.__in_tail(size):
+            return self.__read_tail(size)
         self.__read_preparation(size)
-        return self.__buffer.read(size)
+        self.__buffer.seek(self.__pos)
+        data = self.__buffer.read(size)
+        self.__pos += len(data)
+        return data
     
     def read1(self, size: int=-1, /) -> bytes:
-        self.__read_preparation(size)
-        return self.__buffer.read1(size)
+        return self.read(size)
     
     def readinto(self, b: bytearray, /) -> int:
         size = len(b)
         if size > 0:
-            self.__read_preparation(size)
-            return self.__buffer.readinto(b)
+            data = self.read(size)
+            b[:len(data)] = data
+            return len(data)
         return 0
     
     def readinto1(self, b: bytearray, /) -> int:
-        size = len(b)
-        if size > 0:
-            self.__read_preparation(size)
-            return self.__buffer.readinto1(b)
-        return 0
+        return self.readinto(b)
     
     def seek(self, offset: int, whence: int=0, /) -> int:
-        self.__seek_preparation(offset, whence)
-        return self.__buffer.seek(offset, whence)
+        """Set the read position. The data is downloaded only when it is read."""
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self.__pos + offset
+        elif whence == 2:
+            pos = self.__end() + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self.__pos = pos
+        return pos
     
     # ^ IO Methods (NOT IMPLEMENTED)
     
@@ -227,4 +442,4 @@ class URLIO(BufferedReader):
     
     @deprecated('NOT IMPLEMENTED')
     def flush(self):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
@@ -0,0 +1,579 @@
+import numpy as np
+from numpy import ndarray
+from bisect import bisect_right
+from threading import Semaphore
+# > Typing
+from typing_extensions import Dict, Iterable, List, Optional, Self, Tuple
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels, AudioSubType, AudioFormat, AudioEndians, AudioDType
+from ..base import AudioSourceBase, AudioSourceMetadata, StreamerBase
+from ..processors import (
+    Resampler, ResamplerQuality, Converter, TimeStretcher,
+    convert_samples, get_native_dtype, is_reducing
+)
+
+# ! Constants
+
+RESAMPLE_BLOCK_SIZE = 8192
+CONVERT_BLOCK_SIZE = 8192
+STRETCH_BLOCK_SIZE = 8192
+# * The dtypes tried for the output, from the best one, when the native dtype of a source is not supported.
+DTYPE_PREFERENCES: Dict[str, Tuple[AudioDType, ...]] = {
+    'int16': ('int16', 'int32', 'float32'),
+    'int32': ('int32', 'float32', 'int16'),
+    'float32': ('float32', 'int32', 'int16'),
+    'float64': ('float32', 'int32', 'int16'),
+}
+
+# ! Functions
+
+def read_into(source: AudioSourceBase, out: ndarray) -> int:
+    """Read `len(out)` frames of the source into the 2D array `out`, return the number of frames read."""
+    if isinstance(source, VirtualAudioSource):
+        return source.readinto(out)
+    return len(source.read(len(out), out.dtype.name, True, out=out))
+
+# ! Virtual Audio Source Class
+class VirtualAudioSource(AudioSourceBase):
+    """Base class of the audio sources reading the frames of other sources lazily, without copies."""
+    __repr_attrs__ = ('name', 'samplerate', 'channels', 'frames', 'duration')
+    
+    def __init__(self, source: AudioSourceBase, closefd: bool=False) -> None:
+        self.source = source
+        self.name = getattr(source, 'name', None)
+        self.semaphore = Semaphore(1)
+        self.closefd = closefd
+        self._pos = 0
+        self._closed = False
+    
+    # ^ Magic Methods
+    
+    def __enter__(self) -> Self:
+        return self
+    
+    def __exit__(self, *args: object) -> None:
+        if self.closefd:
+            self.close()
+    
+    # ^ Hidden Methods
+    
+    def _readinto(self, out: ndarray) -> int:
+        raise NotImplementedError
+    
+    def _sources(self) -> Iterable[AudioSourceBase]:
+        return (self.source,)
+    
+    # ^ Propertyes
+    
+    @property
+    def frames(self) -> int:
+        """The number of frames in the audio source."""
+        raise NotImplementedError
+    
+    @property
+    def duration(self) -> float:
+        """The duration of the audio source in seconds."""
+        return self.frames / self.samplerate
+    
+    @property
+    def metadata(self) -> Optional[AudioSourceMetadata]:
+        return getattr(self.source, 'metadata', None)
+    
+    @property
+    def samplerate(self) -> AudioSamplerate:
+        """The sampling rate of the audio source."""
+        return self.source.samplerate
+    
+    @property
+    def channels(self) -> AudioChannels:
+        """The number of channels of the audio source."""
+        return self.source.channels
+    
+    @property
+    def subtype(self) -> AudioSubType:
+        """The type of audio stream packaging."""
+        return self.source.subtype
+    
+    @property
+    def endian(self) -> AudioEndians:
+        """The type of byte sequence."""
+        return self.source.endian
+    
+    @property
+    def format(self) -> AudioFormat:
+        """Audio format for storing an audio stream."""
+        return self.source.format
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed
+    
+    # ^ IO Check Methods
+    
+    def seekable(self) -> bool:
+        return (not self.closed) and all(source.seekable() for source in self._sources())
+    
+    def readable(self) -> bool:
+        return not self.closed
+    
+    # ^ IO Methods
+    
+    def readinto(self, out: ndarray) -> int:
+        """Read `len(out)` frames into the 2D array `out` (`frames x channels`).
+        
+        Returns:
+            int: The number of frames read.
+        """
+        self.semaphore.acquire()
+        try:
+            return self._readinto(out)
+        finally:
+            self.semaphore.release()
+    
+    def read(
+        self,
+        frames: int=-1,
+        dtype: AudioDType='float32',
+        always_2d: bool=False,
+        out: Optional[ndarray]=None,
+        **extra: object
+    ) -> ndarray:
+        """Read from the source and return data as NumPy array.
+        
+        Args:
+            frames (int, optional): The number of frames to read. If `frames < 0`, the whole rest of the source is read. Defaults to `-1`.
+            dtype ({'int16', 'int32', 'float32', 'float64'}, optional): Data type of the returned array. Defaults to `'float32'`.
+            always_2d (bool, optional): With `always_2d=True`, audio data is always returned as a two-dimensional array, even if the audio source has only one channel. Defaults to `False`.
+            out (ndarray, optional): The data is written into the given array instead of creating a new array.
+        
+        Returns:
+            ndarray: The frames read (a view of `out`, if it is specified).
+        """
+        if out is None:
+            if frames < 0:
+                if self.frames < 0:
+                    raise ValueError("Unable to read the whole rest of an endless source")
+                frames = max(self.frames - self.tell(), 0)
+            out = np.empty((frames, self.channels), dtype, order='C')
+        elif frames >= 0:
+            out = out[:frames]
+        data = out if (out.ndim == 2) else out.reshape(-1, self.channels)
+        data = data[:self.readinto(data)]
+        if (not always_2d) and (out.ndim == 2) and (self.channels == 1):
+            return data[:, 0]
+        return data if (out.ndim == 2) else data.reshape(-1)
+    
+    def readline(self, seconds: float=-1.0, dtype: AudioDType='float32', always_2d: bool=False, **extra: object) -> ndarray:
+        """Read from the source and return data (*1 second*) as NumPy array.
+        
+        Args:
+            seconds (int, optional): The second of to read. Defaults to `-1`.
+        """
+        return self.read(int(seconds * self.samplerate) if (seconds >= 0) else -1, dtype, always_2d, **extra)
+    
+    def seek(self, frames: int, whence=0) -> int:
+        """Set the read position.
+        
+        Args:
+            frames (int): The frame index or offset to seek.
+            whence ({0, 1, 2}, optional): `0` - SET, `1` - CURRENT, `2` - END. Defaults to `0`.
+        
+        Raises:
+            ValueError: Invalid `whence` argument is specified.
+        
+        Returns:
+            int: The new absolute read position in frames.
+        """
+        if whence == 0:
+            pos = frames
+        elif whence == 1:
+            pos = self._pos + frames
+        elif whence == 2:
+            if self.frames < 0:
+                raise ValueError("An endless source has no end to seek from")
+            pos = self.frames + frames
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self.semaphore.acquire()
+        self._pos = pos if (self.frames < 0) else min(pos, self.frames)
+        self.semaphore.release()
+        return self._pos
+    
+    def tell(self) -> int:
+        """Return the current read position.
+        
+        Returns:
+            int: Current position.
+        """
+        return self._pos
+    
+    def close(self) -> None:
+        """Close the source (and the wrapped sources if `closefd`). Can be called multiple times."""
+        if not self._closed:
+            self._closed = True
+            if self.closefd:
+                for source in self._sources():
+                    source.close()
+
+# ! Slice Audio Source Class
+class SliceAudioSource(VirtualAudioSource):
+    """The frames `start:stop` of the source as a separate audio source."""
+    
+    def __init__(self, source: AudioSourceBase, start: int=0, stop: Optional[int]=None, closefd: bool=False) -> None:
+        super().__init__(source, closefd)
+        stop = source.frames if (stop is None) else min(stop, source.frames)
+        if not (0 <= start <= stop):
+            raise ValueError(f"Invalid slice of frames ({start}:{stop})")
+        self.start = start
+        self.stop = stop
+    
+    def _readinto(self, out: ndarray) -> int:
+        frames = max(min(len(out), self.stop - self.start - self._pos), 0)
+        if frames == 0:
+            return 0
+        if self.source.tell() != self.start + self._pos:
+            self.source.seek(self.start + self._pos)
+        count = read_into(self.source, out[:frames])
+        self._pos += count
+        return count
+    
+    @property
+    def frames(self) -> int:
+        return self.stop - self.start
+
+# ! Concat Audio Source Class
+class ConcatAudioSource(VirtualAudioSource):
+    """Several audio sources (with the same samplerate and channels) played one after another as one source."""
+    
+    def __init__(self, sources: Iterable[AudioSourceBase], closefd: bool=False) -> None:
+        self.sources: List[AudioSourceBase] = list(sources)
+        if len(self.sources) == 0:
+            raise ValueError("At least one audio source is required")
+        super().__init__(self.sources[0], closefd)
+        for source in self.sources[1:]:
+            if (source.samplerate != self.samplerate) or (source.channels != self.channels):
+                raise ValueError(
+                    f"The audio source {source} ({source.samplerate} Hz, {source.channels} ch) does not match "
+                    f"the first one ({self.samplerate} Hz, {self.channels} ch)"
+                )
+        self.offsets = [0]
+        for source in self.sources:
+            self.offsets.append(self.offsets[-1] + source.frames)
+    
+    def _sources(self) -> Iterable[AudioSourceBase]:
+        return self.sources
+    
+    def _readinto(self, out: ndarray) -> int:
+        done = 0
+        index = bisect_right(self.offsets, self._pos) - 1
+        while (done < len(out)) and (index < len(self.sources)):
+            source, local = self.sources[index], self._pos - self.offsets[index]
+            frames = min(len(out) - done, self.offsets[index + 1] - self._pos)
+            if source.tell() != local:
+                source.seek(local)
+            count = read_into(source, out[done:done + frames])
+            done += count
+            self._pos += count
+            if count < frames:
+                # * The source is shorter than it reported, the rest of its frames are skipped.
+                self._pos = self.offsets[index + 1]
+            index += 1
+        return done
+    
+    @property
+    def frames(self) -> int:
+        return self.offsets[-1]
+    
+    def source_at(self, frame: int) -> int:
+        """Return the index of the source containing the `frame`."""
+        return min(bisect_right(self.offsets, frame) - 1, len(self.sources) - 1)
+
+# ! Loop Audio Source Class
+class LoopAudioSource(VirtualAudioSource):
+    """The frames `start:stop` of the source repeated `count` times (endlessly, if `count` is `None`).
+    
+    The `frames` of an endless loop is `-1`.
+    """
+    
+    def __init__(
+        self,
+        source: AudioSourceBase,
+        start: int=0,
+        stop: Optional[int]=None,
+        count: Optional[int]=None,
+        closefd: bool=False
+    ) -> None:
+        super().__init__(source, closefd)
+        stop = source.frames if (stop is None) else min(stop, source.frames)
+        if not (0 <= start < stop):
+            raise ValueError(f"Invalid loop region of frames ({start}:{stop})")
+        if (count is not None) and (count < 0):
+            raise ValueError(f"The number of repeats must not be negative, not {count}")
+        self.start = start
+        self.stop = stop
+        self.count = count
+    
+    def _readinto(self, out: ndarray) -> int:
+        length = self.stop - self.start
+        frames = len(out) if (self.count is None) else max(min(len(out), self.frames - self._pos), 0)
+        done = 0
+        while done < frames:
+            local = self._pos % length
+            size = min(frames - done, length - local)
+            if self.source.tell() != self.start + local:
+                self.source.seek(self.start + local)
+            count = read_into(self.source, out[done:done + size])
+            done += count
+            self._pos += count
+            if count < size:
+                break
+        return done
+    
+    @property
+    def frames(self) -> int:
+        if self.count is None:
+            return -1
+        return (self.stop - self.start) * self.count
+    
+    @property
+    def duration(self) -> float:
+        if self.count is None:
+            return float('inf')
+        return super().duration
+    
+    @property
+    def iteration(self) -> int:
+        """The number of the current repeat (from `0`)."""
+        return self._pos // (self.stop - self.start)
+
+
+# ! Resampled Audio Source Class
+class ResampledAudioSource(VirtualAudioSource):
+    """The source converted to the `samplerate` on the fly.
+    
+    Sources of any samplerate can be played by one streamer opened with a fixed samplerate.
+    A seek restarts the resampler from the nearest input frame.
+    """
+    
+    def __init__(
+        self,
+        source: AudioSourceBase,
+        samplerate: AudioSamplerate,
+        quality: ResamplerQuality='medium',
+        block_size: int=RESAMPLE_BLOCK_SIZE,
+        closefd: bool=False
+    ) -> None:
+        super().__init__(source, closefd)
+        self.resampler = Resampler(source.samplerate, samplerate, source.channels, quality)
+        self.__block = np.empty((block_size, source.channels), self.resampler.dtype)
+        self.__pending = self.__block[:0]
+        self.__ended = False
+        self.__next = 0
+    
+    def __restart(self) -> None:
+        self.resampler.reset()
+        self.source.seek(self._pos * self.resampler.down // self.resampler.up)
+        self.__pending = self.__block[:0]
+        self.__ended = False
+    
+    def _readinto(self, out: ndarray) -> int:
+        if self.__next != self._pos:
+            self.__restart()
+        done = 0
+        while done < len(out):
+            if len(self.__pending) == 0:
+                if self.__ended:
+                    break
+                count = read_into(self.source, self.__block)
+                self.__pending = self.resampler.process(self.__block[:count])
+                if count < len(self.__block):
+                    self.__pending = np.concatenate([self.__pending, self.resampler.flush()])
+                    self.__ended = True
+                continue
+            size = min(len(out) - done, len(self.__pending))
+            convert_samples(self.__pending[:size], out[done:done + size])
+            self.__pending = self.__pending[size:]
+            done += size
+        self._pos += done
+        self.__next = self._pos
+        return done
+    
+    @property
+    def frames(self) -> int:
+        if self.source.frames < 0:
+            return -1
+        return self.resampler.output_frames(self.source.frames)
+    
+    @property
+    def samplerate(self) -> AudioSamplerate:
+        """The sampling rate of the audio source (after the resampling)."""
+        return self.resampler.target_samplerate
+
+# ! Converted Audio Source Class
+class ConvertedAudioSource(VirtualAudioSource):
+    """The source remixed to the `channels` (mono to stereo, 5.1 to stereo, etc.) on the fly.
+    
+    The samples are converted straight into the output array of any dtype,
+    the integer output is rounded with the optional TPDF `dither`.
+    """
+    
+    def __init__(
+        self,
+        source: AudioSourceBase,
+        channels: AudioChannels,
+        dither: bool=False,
+        normalize: bool=True,
+        block_size: int=CONVERT_BLOCK_SIZE,
+        closefd: bool=False
+    ) -> None:
+        super().__init__(source, closefd)
+        self.target_channels = channels
+        self.dither = dither
+        self.normalize = normalize
+        self.block_size = block_size
+        self.__converters: Dict[np.dtype, Converter] = {}
+        self.__blocks: Dict[np.dtype, ndarray] = {}
+    
+    def __converter(self, dtype: np.dtype) -> Converter:
+        if (converter := self.__converters.get(dtype, None)) is None:
+            work = np.float64 if dtype in (np.float64, np.int32) else np.float32
+            converter = Converter(self.source.channels, self.target_channels, work, dtype, self.dither, self.normalize)
+            self.__converters[dtype] = converter
+            self.__blocks[dtype] = np.empty((self.block_size, self.source.channels), work)
+        return converter
+    
+    def _readinto(self, out: ndarray) -> int:
+        converter = self.__converter(out.dtype)
+        block = self.__blocks[out.dtype]
+        if self.source.tell() != self._pos:
+            self.source.seek(self._pos)
+        done = 0
+        while done < len(out):
+            size = min(len(out) - done, len(block))
+            count = read_into(self.source, block[:size])
+            converter.process(block[:count], out[done:done + count])
+            done += count
+            if count < size:
+                break
+        self._pos += done
+        return done
+    
+    @property
+    def frames(self) -> int:
+        return self.source.frames
+    
+    @property
+    def channels(self) -> AudioChannels:
+        """The number of channels of the audio source (after the remixing)."""
+        return self.target_channels
+
+# ! Time Stretched Audio Source Class
+class TimeStretchedAudioSource(VirtualAudioSource):
+    """The source played at the `speed` (0.5 is twice slower, 2.0 is twice faster) keeping the pitch.
+    
+    The position is counted in the output frames at the current speed, the change of the `speed`
+    keeps the position in the source. A seek restarts the time-stretcher from the matching source frame.
+    """
+    
+    def __init__(
+        self,
+        source: AudioSourceBase,
+        speed: float=1.0,
+        block_size: int=STRETCH_BLOCK_SIZE,
+        closefd: bool=False
+    ) -> None:
+        super().__init__(source, closefd)
+        self.stretcher = TimeStretcher(source.samplerate, source.channels, speed)
+        self.__block = np.empty((block_size, source.channels), np.float32)
+        self.__pending = self.__block[:0]
+        self.__ended = False
+        self.__next = 0
+    
+    def __restart(self) -> None:
+        self.stretcher.reset()
+        self.source.seek(int(round(self._pos * self.stretcher.speed)))
+        self.__pending = self.__block[:0]
+        self.__ended = False
+    
+    def _readinto(self, out: ndarray) -> int:
+        if self.__next != self._pos:
+            self.__restart()
+        done = 0
+        while done < len(out):
+            if len(self.__pending) == 0:
+                if self.__ended:
+                    break
+                count = read_into(self.source, self.__block)
+                self.__pending = self.stretcher.process(self.__block[:count])
+                if count < len(self.__block):
+                    self.__pending = np.concatenate([self.__pending, self.stretcher.flush()])
+                    self.__ended = True
+                continue
+            size = min(len(out) - done, len(self.__pending))
+            convert_samples(self.__pending[:size], out[done:done + size])
+            self.__pending = self.__pending[size:]
+            done += size
+        self._pos += done
+        self.__next = self._pos
+        return done
+    
+    # ^ Propertyes
+    
+    @property
+    def speed(self) -> float:
+        return self.stretcher.speed
+    
+    @speed.setter
+    def speed(self, value: float) -> None:
+        old = self.stretcher.speed
+        self.stretcher.speed = value
+        # * The frames already stretched keep their speed, the position is moved to the same source time.
+        self._pos = int(round(self._pos * old / self.stretcher.speed))
+        self.__next = self._pos
+    
+    @property
+    def frames(self) -> int:
+        if self.source.frames < 0:
+            return -1
+        return int(round(self.source.frames / self.stretcher.speed))
+
+# ! Functions
+
+def negotiate_dtype(source: AudioSourceBase, streamer: StreamerBase) -> AudioDType:
+    """The dtype for the streamer closest to the native sample format of the source (see `get_native_dtype`)."""
+    native = get_native_dtype(getattr(source, 'subtype', None))
+    for dtype in DTYPE_PREFERENCES[native]:
+        if streamer.supports_dtype(dtype):
+            return dtype
+    return streamer.dtype
+
+def negotiate_source(
+    source: AudioSourceBase,
+    streamer: StreamerBase,
+    quality: ResamplerQuality='medium',
+    dither: bool=False,
+    native: bool=False
+) -> AudioSourceBase:
+    """Wrap the source to match the samplerate and channels of the streamer.
+    
+    The data for the streamer is read as `source.read(frames, streamer.dtype)`:
+    the sample type is converted by the decoder or by the wrappers directly into the result.
+    
+    With `native`, the streamer is reconfigured to the dtype of `negotiate_dtype`, so the integer
+    sources are decoded straight into the integer samples of the device without the float round-trip.
+    If the device has fewer bits than the source, the samples are reduced with a dither.
+    
+    Returns:
+        AudioSourceBase: The source itself, if it already matches the streamer.
+    """
+    if native:
+        if (dtype := negotiate_dtype(source, streamer)) != streamer.dtype:
+            streamer.reconfigure(dtype=dtype)
+        dither = dither or is_reducing(get_native_dtype(getattr(source, 'subtype', None)), streamer.dtype)
+    if source.samplerate != streamer.samplerate:
+        source = ResampledAudioSource(source, streamer.samplerate, quality)
+    if (source.channels != streamer.channels) or (native and dither):
+        source = ConvertedAudioSource(source, streamer.channels, dither)
+    return source
\ No newline at end of file
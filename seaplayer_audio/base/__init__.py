@@ -1,10 +1,12 @@
 from .streamer import StreamerState, StreamerBase, AsyncStreamerBase
 from .sndstreamer import SoundDeviceStreamerBase, AsyncSoundDeviceStreamerBase
 from .audiosource import AudioSourceBase, AsyncAudioSourceBase, AudioSourceMetadata
+from .effect import EffectBase
 
 
 __all__ = [
     'AudioSourceBase', 'AsyncAudioSourceBase', 'AudioSourceMetadata',
     'StreamerState', 'StreamerBase', 'AsyncStreamerBase',
-    'SoundDeviceStreamerBase', 'AsyncSoundDeviceStreamerBase'
+    'SoundDeviceStreamerBase', 'AsyncSoundDeviceStreamerBase',
+    'EffectBase'
 ]
\ No newline at end of file
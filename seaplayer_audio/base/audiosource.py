@@ -21,6 +21,8 @@ class AudioSourceMetadata:
     copyright: Optional[str]=None
     software: Optional[str]=None
     icon: Optional[Image.Image]=None
+    # * The content hash of the cover, its handle in a `CoverStore`.
+    cover: Optional[str]=None
 
 # ! Audio Source Class (sync)
 
@@ -0,0 +1,64 @@
+from numpy import ndarray
+from typing_extensions import Any, Generic, Tuple, TypeVar
+from .._types import AudioSamplerate, AudioChannels, Reprable
+
+# ! Types
+
+ParamsType = TypeVar('ParamsType')
+
+# ^ Effect Base Class
+
+class EffectBase(Reprable, Generic[ParamsType]):
+    """Base class of the effects processing `frames x channels` float blocks in place.
+    
+    The parameters are an immutable object. `update` prepares everything derived from them
+    (filter coefficients and etc.) in the calling thread and publishes the pair with one assignment,
+    so the audio thread picks up the new parameters at the next block without any locks.
+    """
+    
+    __repr_attrs__ = ('samplerate', 'channels', 'params', 'enabled')
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels, params: ParamsType) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.enabled = True
+        self.__snapshot: Tuple[ParamsType, Any] = (params, self.prepare(params))
+    
+    # ^ Propertyes
+    
+    @property
+    def params(self) -> ParamsType:
+        return self.__snapshot[0]
+    
+    # ^ Methods for the subclasses
+    
+    def prepare(self, params: ParamsType) -> Any:
+        """Compute the data derived from the parameters (called in the thread updating them)."""
+        return None
+    
+    def apply(self, block: ndarray, params: ParamsType, prepared: Any) -> None:
+        """Process the float block in place."""
+        raise NotImplementedError
+    
+    def reset(self) -> None:
+        """Forget the state kept between the blocks (after a seek or a track change)."""
+        pass
+    
+    # ^ Methods
+    
+    def update(self, params: ParamsType) -> None:
+        """Replace the parameters. Safe to call from any thread while the audio is processed."""
+        self.__snapshot = (params, self.prepare(params))
+    
+    def configure(self, samplerate: AudioSamplerate, channels: AudioChannels) -> None:
+        """Adapt the effect to the new stream format, the state is reset."""
+        self.samplerate, self.channels = samplerate, channels
+        self.update(self.params)
+        self.reset()
+    
+    def process(self, block: ndarray) -> ndarray:
+        """Process the `frames x channels` float block in place (if the effect is enabled) and return it."""
+        if self.enabled and (len(block) > 0):
+            params, prepared = self.__snapshot
+            self.apply(block, params, prepared)
+        return block
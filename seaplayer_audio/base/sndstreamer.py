@@ -1,8 +1,19 @@
+import sounddevice as sd
 from asyncio import AbstractEventLoop
 from typing_extensions import Optional
 from .._types import AudioSamplerate, AudioChannels, AudioDType
 from .streamer import StreamerBase, AsyncStreamerBase
 
+# ^ Functions
+
+def supports_output_dtype(device: Optional[int], channels: AudioChannels, samplerate: AudioSamplerate, dtype: AudioDType) -> bool:
+    """Whether the output `device` accepts the samples of the `dtype` at the `channels` and `samplerate`."""
+    try:
+        sd.check_output_settings(device, channels, dtype, samplerate=samplerate)
+    except Exception:
+        return False
+    return True
+
 # ^ SoundDevice Streamer Base
 
 class SoundDeviceStreamerBase(StreamerBase):
@@ -19,6 +30,10 @@ class SoundDeviceStreamerBase(StreamerBase):
         super().__init__(samplerate, channels, dtype, closefd)
         self.device = device
     
+    def supports_dtype(self, dtype: AudioDType) -> bool:
+        """Whether the device accepts the samples of the `dtype` (at the samplerate and channels of the streamer)."""
+        return supports_output_dtype(self.device, self.channels, self.samplerate, dtype)
+    
     def reconfigure(self,
         samplerate: Optional[AudioSamplerate]=None,
         channels: Optional[AudioChannels]=None,
@@ -45,6 +60,10 @@ class AsyncSoundDeviceStreamerBase(AsyncStreamerBase):
         super().__init__(samplerate, channels, dtype, closefd, loop)
         self.device = device
     
+    def supports_dtype(self, dtype: AudioDType) -> bool:
+        """Whether the device accepts the samples of the `dtype` (at the samplerate and channels of the streamer)."""
+        return supports_output_dtype(self.device, self.channels, self.samplerate, dtype)
+    
     def reconfigure(self,
         samplerate: Optional[AudioSamplerate]=None,
         channels: Optional[AudioChannels]=None,
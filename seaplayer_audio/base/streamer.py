@@ -1,9 +1,15 @@
 import asyncio
+import numpy as np
+from numpy import ndarray
 from asyncio import AbstractEventLoop
 from enum import Flag, auto
 from types import TracebackType
 from typing_extensions import Optional, Type
 from .._types import AudioSamplerate, AudioChannels, AudioDType, Reprable
+from ..processors.effects import EffectChain
+from ..processors.gain import GainRamp, GainRampMode, RAMP_TIME
+from ..processors.scheduler import EventScheduler
+from ..processors.spectrum import SpectrumTap, SPECTRUM_FFT_SIZE, SPECTRUM_RATE, SPECTRUM_BANDS
 
 # ^ Streamer State Class
 
@@ -32,6 +38,10 @@ class StreamerBase(Reprable):
         self.dtype = dtype or 'float32'
         self.closefd = closefd
         self.state = StreamerState(0)
+        self.effects = EffectChain(self.samplerate, self.channels)
+        self.gain = GainRamp(self.samplerate)
+        self.scheduler = EventScheduler(self.samplerate, self.channels)
+        self.spectrum: Optional[SpectrumTap] = None
     
     def __enter__(self):
         self.start()
@@ -57,6 +67,10 @@ class StreamerBase(Reprable):
     def is_busy(self) -> bool:
         return False
     
+    def supports_dtype(self, dtype: AudioDType) -> bool:
+        """Whether the output accepts the samples of the `dtype` as they are."""
+        return True
+    
     def reconfigure(self, 
         samplerate: Optional[AudioSamplerate]=None,
         channels: Optional[AudioChannels]=None,
@@ -65,6 +79,47 @@ class StreamerBase(Reprable):
         self.samplerate = samplerate if (samplerate is not None) else self.samplerate
         self.channels = channels if (channels is not None) else self.channels
         self.dtype = dtype if (dtype is not None) else self.dtype
+        self.effects.configure(self.samplerate, self.channels)
+        self.gain.samplerate = self.samplerate
+        self.scheduler.configure(self.samplerate, self.channels)
+        if (tap := self.spectrum) is not None:
+            self.enable_spectrum(tap.fft_size, tap.rate, tap.bands, tap.delay).subscribers = tap.subscribers
+    
+    @property
+    def volume(self) -> float:
+        return self.gain.volume
+    
+    def set_volume(self, volume: float, duration: float=RAMP_TIME, mode: GainRampMode='linear') -> None:
+        """Change the volume smoothly over the `duration` seconds (applied to the samples just before the output)."""
+        self.gain.set_volume(volume, duration, mode)
+    
+    def enable_spectrum(
+        self,
+        fft_size: int=SPECTRUM_FFT_SIZE,
+        rate: float=SPECTRUM_RATE,
+        bands: int=SPECTRUM_BANDS,
+        delay: float=0.0
+    ) -> SpectrumTap:
+        """Start computing the spectrum of the played blocks for the visualizers (replaces the previous tap)."""
+        self.disable_spectrum()
+        tap = SpectrumTap(self.samplerate, self.channels, fft_size, rate, bands, delay)
+        tap.start()
+        self.spectrum = tap
+        return tap
+    
+    def disable_spectrum(self) -> None:
+        tap, self.spectrum = self.spectrum, None
+        if tap is not None:
+            tap.stop()
+    
+    def _process_sent(self, data: ndarray) -> ndarray:
+        """The sent block processed by the effects, to be queued (the gain is applied to it in place later).
+        
+        The block is copied first if the effects change it or it is read-only, else the caller's block is queued as it is.
+        """
+        if (not data.flags.writeable) or (self.effects.enabled and (len(self.effects) > 0)):
+            data = np.array(data)
+        return self.effects.process(data)
     
     def run(self) -> None:
         raise NotImplementedError
@@ -1,3 +1,5 @@
+import base64
+import hashlib
 import mutagen
 import asyncio
 import inspect
@@ -5,36 +7,232 @@ import dateutil.parser
 from PIL import Image
 from pathlib import Path
 from soundfile import SoundFile
-from io import BufferedReader, BufferedRandom, BytesIO
+from mutagen.id3 import ID3
+from mutagen.flac import Picture
+from io import BufferedReader, BufferedRandom, BytesIO, RawIOBase
 from typing_extensions import (
-    Dict,
+    Dict, Tuple,
     Optional, Union,
     Awaitable, Callable, Coroutine
 )
 from ._types import ResultType, MethodType
 from .base import AudioSourceMetadata
 
+# ! Constants
+
+MPEG_PROBE_SIZE = 16 * 1024
+# * The delay of the standard MP3 decoders (in samples) added to the encoder delay.
+MP3_DECODER_DELAY = 529
+MAX_HEAD_SIZE = 16 * 1024 * 1024
+
+ID3_TAG_KEYS = {
+    'title': 'TIT2', 'artist': 'TPE1', 'album': 'TALB', 'tracknumber': 'TRCK',
+    'date': 'TDRC', 'genre': 'TCON', 'copyright': 'TCOP', 'software': 'TSSE'
+}
+VORBIS_TAG_KEYS = {
+    'title': 'title', 'artist': 'artist', 'album': 'album', 'tracknumber': 'tracknumber',
+    'date': 'date', 'genre': 'genre', 'copyright': 'copyright', 'software': 'encoder'
+}
+
+# ! File Works Classes
+
+class HeadTailIO(RawIOBase):
+    """A read-only file view made of the head and tail bytes of a stream. The gap between them reads as zeros."""
+    
+    def __init__(self, head: bytes, tail: Optional[bytes]=None, length: Optional[int]=None) -> None:
+        self.head = head
+        self.tail = tail or b''
+        self.length = max(length or 0, len(head), len(self.tail))
+        self.position = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self.position
+    
+    def seek(self, offset: int, whence: int=0) -> int:
+        if whence == 0:
+            self.position = offset
+        elif whence == 1:
+            self.position += offset
+        elif whence == 2:
+            self.position = self.length + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+        if self.position < 0:
+            raise OSError(f"Negative seek position {self.position}")
+        return self.position
+    
+    def readinto(self, b: bytearray) -> int:
+        size = max(min(len(b), self.length - self.position), 0)
+        start, end = self.position, self.position + size
+        tail_start = self.length - len(self.tail)
+        view = memoryview(b)
+        view[:size] = bytes(size)
+        if start < len(self.head):
+            chunk = self.head[start:end]
+            view[:len(chunk)] = chunk
+        if end > tail_start:
+            offset = max(start, tail_start)
+            chunk = self.tail[offset - tail_start:end - tail_start]
+            view[offset - start:offset - start + len(chunk)] = chunk
+        self.position = end
+        return size
+
 # ! File Works Methods
 
 def get_mutagen_info(
-    file: Union[str, Path, BufferedReader, BufferedRandom]
+    file: Union[str, Path, BufferedReader, BufferedRandom, RawIOBase]
 ) -> Optional[mutagen.FileType]:
     try: return mutagen.File(file)
     except: return
 
-def get_audio_image(file: Optional[mutagen.FileType]) -> Optional[Image.Image]:
-    if file is None:
+def get_head_size(head: bytes) -> int:
+    """Returns the number of head bytes needed to parse the tags (ID3v2, FLAC or Ogg headers).
+    
+    If the returned value is greater than `len(head)`, more bytes are required.
+    """
+    if head[:3] == b'ID3':
+        if len(head) < 10:
+            return 10
+        size = 10 + ((head[6] & 0x7f) << 21 | (head[7] & 0x7f) << 14 | (head[8] & 0x7f) << 7 | (head[9] & 0x7f))
+        if head[5] & 0x10:
+            size += 10
+        if len(head) <= size:
+            return size + MPEG_PROBE_SIZE
+        return size + get_head_size(head[size:])
+    elif head[:4] == b'fLaC':
+        offset = 4
+        while offset + 4 <= len(head):
+            last = head[offset] & 0x80
+            offset += 4 + int.from_bytes(head[offset+1:offset+4], 'big')
+            if last:
+                return offset
+        return offset + 4
+    elif head[:4] == b'OggS':
+        offset = 0
+        while offset + 27 <= len(head):
+            if head[offset:offset+4] != b'OggS':
+                return offset
+            granule = int.from_bytes(head[offset+6:offset+14], 'little')
+            if granule not in (0, 0xFFFFFFFFFFFFFFFF):
+                return offset
+            count = head[offset+26]
+            if offset + 27 + count > len(head):
+                return offset + 27 + count
+            offset += 27 + count + sum(head[offset+27:offset+27+count])
+        return offset + 27
+    elif len(head) < MPEG_PROBE_SIZE:
+        return MPEG_PROBE_SIZE
+    return len(head)
+
+def get_stream_mutagen_info(head: bytes, tail: Optional[bytes]=None, length: Optional[int]=None) -> Optional[mutagen.FileType]:
+    """Parse the tags and the stream info only from the head (and tail) bytes of a remote file."""
+    return get_mutagen_info(HeadTailIO(head, tail, length))
+
+def get_url_mutagen_info(urlio, head_size: int=MPEG_PROBE_SIZE, max_head_size: int=MAX_HEAD_SIZE) -> Optional[mutagen.FileType]:
+    """Read the tags of `URLIO` from the buffered head bytes plus its tail (one range request at most)."""
+    head = urlio.head(head_size)
+    while (len(head) < (size := min(get_head_size(head), max_head_size))):
+        if len(data := urlio.head(size)) == len(head):
+            break
+        head = data
+    return get_stream_mutagen_info(head, urlio.tail(), urlio.length)
+
+def get_mp3_gapless_info(filepath: Union[str, Path], frame_offset: int=0) -> Optional[Tuple[int, int, int]]:
+    """Read `(encoder delay, encoder padding, encoded samples)` from the Xing/Info LAME tag of the first MP3 frame."""
+    try:
+        with open(filepath, 'rb') as file:
+            file.seek(frame_offset)
+            frame = file.read(512)
+    except OSError:
+        return None
+    if (len(frame) < 4) or (frame[0] != 0xFF) or ((frame[1] & 0xE0) != 0xE0):
         return None
-    apic = file.get('APIC:', None) or file.get('APIC', None)
-    if apic is None:
+    mpeg1, mono = (frame[1] >> 3) & 0x03 == 0x03, (frame[3] >> 6) == 0x03
+    offset = 4 + (17 if mono else 32) if mpeg1 else 4 + (9 if mono else 17)
+    if frame[offset:offset + 4] not in (b'Xing', b'Info'):
         return None
-    return Image.open(BytesIO(apic.data))
+    flags = int.from_bytes(frame[offset + 4:offset + 8], 'big')
+    if not (flags & 0x01):
+        return None
+    frames = int.from_bytes(frame[offset + 8:offset + 12], 'big')
+    offset += 12 + (4 if (flags & 0x02) else 0) + (100 if (flags & 0x04) else 0) + (4 if (flags & 0x08) else 0)
+    if frame[offset:offset + 4] not in (b'LAME', b'Lavc', b'Lavf') or (len(frame) < offset + 24):
+        return None
+    value = int.from_bytes(frame[offset + 21:offset + 24], 'big')
+    return value >> 12, value & 0xFFF, frames * (1152 if mpeg1 else 576)
+
+def get_gapless_trim(filepath: Union[str, Path], file: Optional[mutagen.FileType], frames: int) -> Tuple[int, int]:
+    """The numbers of the frames of the encoder delay and padding left at the start and the end of the decoded audio.
+    
+    Both are `0` if the file has no gapless info or the decoder already dropped them.
+    """
+    if (file is None) or (getattr(file.info, 'layer', None) != 3):
+        return 0, 0
+    if (info := get_mp3_gapless_info(filepath, getattr(file.info, 'frame_offset', 0))) is None:
+        return 0, 0
+    delay, padding, samples = info
+    if frames == samples:
+        return delay + MP3_DECODER_DELAY, max(padding - MP3_DECODER_DELAY, 0)
+    return 0, 0
+
+def get_mutagen_tags(file: Optional[mutagen.FileType]) -> Dict[str, str]:
+    tags = {}
+    if (file is None) or (file.tags is None):
+        return tags
+    if isinstance(file.tags, ID3):
+        for key, frame in ID3_TAG_KEYS.items():
+            if (value := file.tags.get(frame, None)) is not None:
+                tags[key] = str(value)
+    else:
+        for key, name in VORBIS_TAG_KEYS.items():
+            try: value = file.tags.get(name, None)
+            except: value = None
+            if value:
+                tags[key] = str(value[0]) if isinstance(value, list) else str(value)
+    return tags
+
+def get_audio_image_data(file: Optional[mutagen.FileType]) -> Optional[bytes]:
+    """The encoded bytes of the cover of the file (without decoding the image)."""
+    if file is None:
+        return None
+    try:
+        apic = file.get('APIC:', None) or file.get('APIC', None)
+    except:
+        apic = None
+    if apic is not None:
+        return apic.data
+    pictures = getattr(file, 'pictures', None)
+    if pictures:
+        return pictures[0].data
+    try:
+        blocks = file.get('metadata_block_picture', None)
+    except:
+        blocks = None
+    if blocks:
+        return Picture(base64.b64decode(blocks[0])).data
+    return None
+
+def get_cover_hash(data: Optional[bytes]) -> Optional[str]:
+    """The content hash of the encoded cover, the same for all the files with the same picture."""
+    return hashlib.sha1(data).hexdigest() if (data is not None) else None
+
+def get_audio_image(file: Optional[mutagen.FileType]) -> Optional[Image.Image]:
+    if (data := get_audio_image_data(file)) is not None:
+        return Image.open(BytesIO(data))
+    return None
 
-def get_audio_metadata(io: SoundFile, file: Optional[mutagen.FileType]) -> AudioSourceMetadata:
-    metadata = io.copy_metadata()
+def get_audio_metadata(io: SoundFile, file: Optional[mutagen.FileType], with_icon: bool=True) -> AudioSourceMetadata:
+    metadata = {**get_mutagen_tags(file), **{k: v for k, v in io.copy_metadata().items() if check_string(v) is not None}}
     year = check_string(metadata.get('date', None))
-    if file is not None:
-        icon = get_audio_image(file)
+    data = get_audio_image_data(file)
+    if (data is not None) and with_icon:
+        icon = Image.open(BytesIO(data))
     else:
         icon = None
     try: date = dateutil.parser.parse(year) if (year is not None) else None
@@ -48,7 +246,8 @@ def get_audio_metadata(io: SoundFile, file: Optional[mutagen.FileType]) -> Audio
         genre=check_string(metadata.get('genre', None)),
         copyright=check_string(metadata.get('copyright', None)),
         software=check_string(metadata.get('software', None)),
-        icon=icon
+        icon=icon,
+        cover=get_cover_hash(data)
     )
 
 # ! Formatiing Methods
@@ -0,0 +1,13 @@
+from .covers import CoverStore, COVER_SIZES
+from .scanner import TrackInfo, LibraryScanner, AUDIO_EXTENSIONS, walk_audio_files, extract_track_info, make_track_info, scan_library
+from .probe import ProbeInfo, probe, probe_many
+from .index import LibraryIndex
+from .catalog import TrackCatalog, TrigramIndex
+
+
+__all__ = [
+    'CoverStore', 'COVER_SIZES',
+    'TrackInfo', 'LibraryScanner', 'AUDIO_EXTENSIONS', 'walk_audio_files', 'extract_track_info', 'make_track_info', 'scan_library',
+    'ProbeInfo', 'probe', 'probe_many',
+    'LibraryIndex', 'TrackCatalog', 'TrigramIndex'
+]
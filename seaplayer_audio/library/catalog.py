@@ -0,0 +1,293 @@
+import datetime
+import numpy as np
+from numpy import ndarray
+from bisect import bisect_left, bisect_right
+# > Typing
+from typing_extensions import Any, Dict, Iterable, List, Optional, Sequence, Self, Tuple, Union
+# > Local Imports
+from .scanner import TrackInfo
+from .index import LibraryIndex
+
+# ! Constants
+
+CATALOG_TEXT_FIELDS = ('title', 'artist', 'album', 'genre')
+CATALOG_SEARCH_FIELDS = ('title', 'artist', 'album')
+# * The last possible character: `prefix + PREFIX_END` is after all the strings starting with `prefix`.
+PREFIX_END = '\U0010ffff'
+
+DateType = Union[datetime.date, str, int]
+
+# ! Functions
+
+def encode_strings(values: Sequence[Optional[str]]) -> Tuple[List[str], ndarray]:
+    """The dictionary of the unique strings sorted case-insensitively and the int32 codes of the values (`-1` for `None`).
+    
+    As the codes are the positions in the sorted dictionary, ordering the codes orders the strings.
+    """
+    mapping: Dict[str, int] = {}
+    codes = np.fromiter((-1 if (value is None) else mapping.setdefault(value, len(mapping)) for value in values), np.int32, len(values))
+    words = list(mapping)
+    keys = [word.casefold() for word in words]
+    order = sorted(range(len(words)), key=lambda index: (keys[index], words[index]))
+    remap = np.full(len(words) + 1, -1, np.int32)
+    remap[np.array(order, np.int64)] = np.arange(len(words), dtype=np.int32)
+    return [words[index] for index in order], remap[codes]
+
+def encode_dates(values: Sequence[Optional[DateType]]) -> ndarray:
+    """The `datetime64[D]` column of the dates (a year alone is its first day, `None` is `NaT`)."""
+    return np.array([to_day(value) for value in values], 'datetime64[D]')
+
+def to_day(value: Optional[DateType]) -> np.datetime64:
+    if value is None:
+        return np.datetime64('NaT', 'D')
+    if isinstance(value, int):
+        return np.datetime64(f"{value:04d}-01-01", 'D')
+    return np.datetime64(str(value)[:10], 'D')
+
+def parse_tracknumber(value: Optional[str]) -> int:
+    """The number of the `'3'` or `'3/12'` tag, `0` if there is none."""
+    digits = ''
+    for char in (value or '').strip():
+        if not char.isdigit():
+            break
+        digits += char
+    return min(int(digits), 32767) if (len(digits) > 0) else 0
+
+def get_trigram_keys(codepoints: ndarray) -> ndarray:
+    """The uint64 keys of the trigrams of the uint64 codepoints (21 bits per character)."""
+    return (codepoints[:-2] << np.uint64(42)) | (codepoints[1:-1] << np.uint64(21)) | codepoints[2:]
+
+# ! Trigram Index Class
+class TrigramIndex:
+    """The substring search over a list of (case-folded) strings.
+    
+    Every trigram is mapped to the sorted ids of the strings containing it, in flat arrays,
+    so a word is found by intersecting the lists of its trigrams and checking the few candidates left.
+    The index is built without a Python loop over the characters: the strings are joined into one
+    array of codepoints and all the trigrams are taken at once.
+    """
+    
+    def __init__(self, texts: List[str]) -> None:
+        self.texts = texts
+        codepoints = np.frombuffer('\0'.join(texts).encode('utf-32-le'), np.uint32).astype(np.uint64)
+        if len(codepoints) < 3:
+            self.keys, self.offsets, self.ids = np.empty(0, np.uint64), np.zeros(1, np.int64), np.empty(0, np.int32)
+            return
+        lengths = np.fromiter((len(text) + 1 for text in texts), np.int64, len(texts))
+        owners = np.repeat(np.arange(len(texts), dtype=np.int32), lengths)[:len(codepoints)]
+        valid = (codepoints[:-2] != 0) & (codepoints[1:-1] != 0) & (codepoints[2:] != 0)
+        keys, ids = get_trigram_keys(codepoints)[valid], owners[:-2][valid]
+        order = np.argsort(keys, kind='stable')
+        keys, ids = keys[order], ids[order]
+        unique = np.ones(len(keys), bool)
+        unique[1:] = (keys[1:] != keys[:-1]) | (ids[1:] != ids[:-1])
+        keys, ids = keys[unique], ids[unique]
+        starts = np.flatnonzero(np.append(True, keys[1:] != keys[:-1]))
+        self.keys = keys[starts]
+        self.offsets = np.append(starts, len(keys))
+        self.ids = ids
+    
+    # ^ Methods
+    
+    def find(self, word: str) -> ndarray:
+        """The sorted ids of the strings containing the (case-folded) word of 3 or more characters."""
+        trigrams = np.unique(get_trigram_keys(np.array([ord(char) for char in word], np.uint64)))
+        positions = np.searchsorted(self.keys, trigrams)
+        if np.any(positions >= len(self.keys)) or np.any(self.keys[np.minimum(positions, len(self.keys) - 1)] != trigrams):
+            return np.empty(0, np.int32)
+        postings = sorted((self.ids[self.offsets[p]:self.offsets[p + 1]] for p in positions), key=len)
+        found = postings[0]
+        for posting in postings[1:]:
+            found = np.intersect1d(found, posting, assume_unique=True)
+        # * A word longer than its trigram may have them all without containing the word (like "aaaa" in "xaaax").
+        if len(word) > 3:
+            found = np.array([index for index in found.tolist() if (word in self.texts[index])], np.int32)
+        return found
+
+# ! Track Catalog Class
+class TrackCatalog:
+    """The tags of a library kept in NumPy columns, for filtering, sorting and searching without Python loops.
+    
+    The text fields are dictionary-encoded: every unique string is kept once, in a dictionary sorted
+    case-insensitively, and a track holds its int32 position there, so ordering by a text field is ordering
+    integers, an exact or prefix match is a range of codes found by a binary search, and the tracks of any codes
+    come from the slices of a per-field ordering. The dates are `datetime64[D]`, the durations float32.
+    The queries return the ids (positions) of the tracks, see `get` and `filepaths`.
+    """
+    
+    def __init__(
+        self,
+        filepaths: Sequence[str],
+        title: Sequence[Optional[str]],
+        artist: Sequence[Optional[str]],
+        album: Sequence[Optional[str]],
+        genre: Sequence[Optional[str]],
+        date: Sequence[Optional[DateType]],
+        duration: Sequence[float],
+        tracknumber: Sequence[Optional[str]]
+    ) -> None:
+        self.filepaths = list(filepaths)
+        self.dictionaries: Dict[str, List[str]] = {}
+        self.codes: Dict[str, ndarray] = {}
+        self.__keys: Dict[str, List[str]] = {}
+        self.__trigrams: Dict[str, TrigramIndex] = {}
+        self.__orders: Dict[Tuple[str, ...], ndarray] = {}
+        self.__offsets: Dict[str, ndarray] = {}
+        for field, values in zip(CATALOG_TEXT_FIELDS, (title, artist, album, genre)):
+            self.dictionaries[field], self.codes[field] = encode_strings(values)
+            self.__keys[field] = [word.casefold() for word in self.dictionaries[field]]
+        self.date = encode_dates(date)
+        self.duration = np.asarray(duration, np.float32)
+        self.tracknumber = np.fromiter((parse_tracknumber(value) for value in tracknumber), np.int16, len(self.filepaths))
+    
+    # ^ Class Methods
+    
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[TrackInfo]) -> Self:
+        tracks = list(tracks)
+        return cls(
+            [track.filepath for track in tracks],
+            [track.metadata.title for track in tracks],
+            [track.metadata.artist for track in tracks],
+            [track.metadata.album for track in tracks],
+            [track.metadata.genre for track in tracks],
+            [track.metadata.date for track in tracks],
+            [track.duration for track in tracks],
+            [track.metadata.tracknumber for track in tracks]
+        )
+    
+    @classmethod
+    def from_index(cls, index: LibraryIndex) -> Self:
+        """The catalog of the entries of the index, read as plain rows."""
+        with index.lock:
+            rows = index.connection.execute(
+                "SELECT filepath, title, artist, album, genre, date, duration, tracknumber FROM tracks"
+            ).fetchall()
+        if len(rows) == 0:
+            return cls([], [], [], [], [], [], [], [])
+        return cls(*(list(column) for column in zip(*rows)))
+    
+    # ^ Magic Methods
+    
+    def __len__(self) -> int:
+        return len(self.filepaths)
+    
+    # ^ Hidden Methods
+    
+    def __get_offsets(self, field: str) -> ndarray:
+        """The bounds of the tracks of every code of the field in its ordering (`-1` codes first)."""
+        if (offsets := self.__offsets.get(field, None)) is None:
+            codes = self.codes[field][self.get_order((field,))]
+            offsets = np.searchsorted(codes, np.arange(-1, len(self.dictionaries[field]) + 1, dtype=np.int32))
+            self.__offsets[field] = offsets
+        return offsets
+    
+    def __get_range(self, field: str, value: str, prefix: bool=False) -> Tuple[int, int]:
+        keys, key = self.__keys[field], value.casefold()
+        if prefix:
+            return bisect_left(keys, key), bisect_left(keys, key + PREFIX_END)
+        return bisect_left(keys, key), bisect_right(keys, key)
+    
+    def __get_tracks(self, field: str, codes: ndarray) -> ndarray:
+        """The ids of the tracks with any of the codes of the field (in no particular order)."""
+        order, offsets = self.get_order((field,)), self.__get_offsets(field)
+        starts, ends = offsets[codes + 1], offsets[codes + 2]
+        counts = ends - starts
+        return order[np.repeat(ends - np.cumsum(counts), counts) + np.arange(counts.sum())]
+    
+    def __get_trigrams(self, field: str) -> TrigramIndex:
+        if (trigrams := self.__trigrams.get(field, None)) is None:
+            trigrams = self.__trigrams[field] = TrigramIndex(self.__keys[field])
+        return trigrams
+    
+    # ^ Methods
+    
+    def get(self, id: int) -> Dict[str, Any]:
+        """The fields of the track."""
+        fields: Dict[str, Any] = {'filepath': self.filepaths[id]}
+        for field in CATALOG_TEXT_FIELDS:
+            code = self.codes[field][id]
+            fields[field] = self.dictionaries[field][code] if (code >= 0) else None
+        date = self.date[id]
+        fields['date'] = None if np.isnat(date) else date.astype(datetime.date)
+        fields['duration'] = float(self.duration[id])
+        fields['tracknumber'] = int(self.tracknumber[id])
+        return fields
+    
+    def get_order(self, by: Tuple[str, ...]) -> ndarray:
+        """The ids of all the tracks ordered by the fields (built once per combination)."""
+        if (order := self.__orders.get(by, None)) is None:
+            columns = [self.codes[field] if (field in self.codes) else getattr(self, field) for field in reversed(by)]
+            order = self.__orders[by] = np.lexsort(columns).astype(np.int32) if (len(self) > 0) else np.empty(0, np.int32)
+        return order
+    
+    def sort(self, ids: Optional[ndarray]=None, by: Union[str, Tuple[str, ...]]=('artist', 'album', 'tracknumber'), descending: bool=False) -> ndarray:
+        """The ids (all of them by default) ordered by the fields, in `O(n)` from the cached order."""
+        order = self.get_order((by,) if isinstance(by, str) else tuple(by))
+        if ids is not None:
+            selected = np.zeros(len(self), bool)
+            selected[ids] = True
+            order = order[selected[order]]
+        return order[::-1].copy() if descending else order.copy()
+    
+    def filter(
+        self,
+        ids: Optional[ndarray]=None,
+        *,
+        title: Optional[str]=None,
+        artist: Optional[str]=None,
+        album: Optional[str]=None,
+        genre: Optional[str]=None,
+        date: Optional[Tuple[Optional[DateType], Optional[DateType]]]=None,
+        duration: Optional[Tuple[Optional[float], Optional[float]]]=None
+    ) -> ndarray:
+        """The sorted ids (among `ids`) of the tracks matching all the conditions.
+        
+        The text fields are compared case-insensitively, the `date` and `duration` are `[start, end)` ranges
+        with any bound optional.
+        """
+        mask = np.ones(len(self), bool)
+        for field, value in zip(CATALOG_TEXT_FIELDS, (title, artist, album, genre)):
+            if value is not None:
+                start, end = self.__get_range(field, value)
+                codes = self.codes[field]
+                mask &= (codes >= start) & (codes < end)
+        for column, bounds, convert in ((self.date, date, to_day), (self.duration, duration, np.float32)):
+            if bounds is not None:
+                if bounds[0] is not None:
+                    mask &= column >= convert(bounds[0])
+                if bounds[1] is not None:
+                    mask &= column < convert(bounds[1])
+        if ids is not None:
+            return ids[mask[ids]]
+        return np.flatnonzero(mask)
+    
+    def prefix(self, field: str, text: str) -> ndarray:
+        """The sorted ids of the tracks whose field starts with the text (case-insensitive)."""
+        start, end = self.__get_range(field, text, True)
+        offsets = self.__get_offsets(field)
+        return np.sort(self.get_order((field,))[offsets[start + 1]:offsets[end + 1]])
+    
+    def search(self, text: str, fields: Sequence[str]=CATALOG_SEARCH_FIELDS, ids: Optional[ndarray]=None) -> ndarray:
+        """The sorted ids (among `ids`) of the tracks with every word of the text in any of the fields (case-insensitive).
+        
+        The words of 3 or more characters are found anywhere in the fields through the trigrams,
+        the shorter ones (while the query is typed) at the start of the fields. The trigrams of a field
+        are indexed by its first search.
+        """
+        mask: Optional[ndarray] = None
+        for word in text.casefold().split():
+            found = np.zeros(len(self), bool)
+            for field in fields:
+                if len(word) >= 3:
+                    codes = self.__get_trigrams(field).find(word)
+                else:
+                    codes = np.arange(*self.__get_range(field, word, True), dtype=np.int32)
+                if len(codes) > 0:
+                    found[self.__get_tracks(field, codes)] = True
+            mask = found if (mask is None) else (mask & found)
+        if mask is None:
+            return np.arange(len(self)) if (ids is None) else ids
+        if ids is not None:
+            return ids[mask[ids]]
+        return np.flatnonzero(mask)
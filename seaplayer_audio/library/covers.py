@@ -0,0 +1,145 @@
+import os
+import threading
+from PIL import Image
+from io import BytesIO
+from pathlib import Path
+from collections import OrderedDict
+# > Typing
+from typing_extensions import Iterable, Optional, Tuple, Union
+# > Local Imports
+from ..functions import get_cover_hash
+
+# ! Constants
+
+COVER_SIZES = (64, 256)
+COVER_MEMORY = 64 << 20
+COVER_MODES = ('RGB', 'RGBA', 'L', 'LA')
+
+# ! Functions
+
+def get_image_size(image: Image.Image) -> int:
+    """The memory taken by the decoded image in bytes."""
+    return image.width * image.height * len(image.getbands())
+
+def make_thumbnail(image: Image.Image, size: int) -> Image.Image:
+    """The copy of the image fitting into `size x size` pixels, in a mode the PNG keeps."""
+    thumbnail = image.copy()
+    thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+    if thumbnail.mode not in COVER_MODES:
+        thumbnail = thumbnail.convert('RGBA' if ('A' in thumbnail.getbands()) or ('transparency' in thumbnail.info) else 'RGB')
+    return thumbnail
+
+# ! Cover Store Class
+class CoverStore:
+    """The covers of a library stored once per picture, by its content hash (the `cover` of `AudioSourceMetadata`).
+    
+    The encoded picture and its thumbnails of the `sizes` are written into the directory when the picture
+    is put for the first time, so the tracks of an album share one copy and a view of the thumbnails
+    never decodes the full pictures. The decoded images are kept in memory up to `memory` bytes,
+    the least recently used are dropped first. Safe to share between threads, and between processes
+    through the directory (the files are written atomically).
+    """
+    
+    def __init__(self, dirpath: Union[str, Path], sizes: Iterable[int]=COVER_SIZES, memory: int=COVER_MEMORY) -> None:
+        self.dirpath = str(dirpath)
+        self.sizes = tuple(sizes)
+        self.memory = memory
+        self.used = 0
+        self.lock = threading.Lock()
+        self.__images: OrderedDict[Tuple[str, int], Image.Image] = OrderedDict()
+    
+    # ^ Magic Methods
+    
+    def __contains__(self, handle: str) -> bool:
+        return os.path.exists(self.get_filepath(handle))
+    
+    def __len__(self) -> int:
+        """The number of the images decoded in memory."""
+        return len(self.__images)
+    
+    # ^ Hidden Methods
+    
+    def __write(self, filepath: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        temp = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, 'wb') as file:
+            file.write(data)
+        os.replace(temp, filepath)
+    
+    def __remember(self, key: Tuple[str, int], image: Image.Image) -> Image.Image:
+        with self.lock:
+            if key not in self.__images:
+                self.__images[key] = image
+                self.used += get_image_size(image)
+            self.__images.move_to_end(key)
+            while (self.used > self.memory) and (len(self.__images) > 1):
+                _, evicted = self.__images.popitem(last=False)
+                self.used -= get_image_size(evicted)
+            return self.__images[key]
+    
+    def __recall(self, key: Tuple[str, int]) -> Optional[Image.Image]:
+        with self.lock:
+            if (image := self.__images.get(key, None)) is not None:
+                self.__images.move_to_end(key)
+            return image
+    
+    # ^ Methods
+    
+    def get_filepath(self, handle: str, size: int=0) -> str:
+        """The path of the encoded picture (`size=0`) or of its PNG thumbnail."""
+        filename = handle if (size == 0) else f"{handle}.{size}.png"
+        return os.path.join(self.dirpath, handle[:2], filename)
+    
+    def put(self, data: bytes) -> str:
+        """Store the encoded picture and its thumbnails if they are new, return its handle."""
+        handle = get_cover_hash(data)
+        if handle not in self:
+            image = None
+            for size in self.sizes:
+                if not os.path.exists(filepath := self.get_filepath(handle, size)):
+                    if image is None:
+                        image = Image.open(BytesIO(data))
+                    buffer = BytesIO()
+                    make_thumbnail(image, size).save(buffer, 'PNG')
+                    self.__write(filepath, buffer.getvalue())
+            self.__write(self.get_filepath(handle), data)
+        return handle
+    
+    def get(self, handle: Optional[str]) -> Optional[Image.Image]:
+        """The decoded picture (shared, do not modify it), `None` if it is not stored."""
+        if handle is None:
+            return None
+        if (image := self.__recall((handle, 0))) is not None:
+            return image
+        try:
+            with open(self.get_filepath(handle), 'rb') as file:
+                image = Image.open(BytesIO(file.read()))
+                image.load()
+        except OSError:
+            return None
+        return self.__remember((handle, 0), image)
+    
+    def thumbnail(self, handle: Optional[str], size: int) -> Optional[Image.Image]:
+        """The thumbnail of the picture fitting into `size x size` (made and stored if the size is not pregenerated)."""
+        if handle is None:
+            return None
+        if (image := self.__recall((handle, size))) is not None:
+            return image
+        filepath = self.get_filepath(handle, size)
+        try:
+            image = Image.open(filepath)
+            image.load()
+        except OSError:
+            if (full := self.get(handle)) is None:
+                return None
+            image = make_thumbnail(full, size)
+            buffer = BytesIO()
+            image.save(buffer, 'PNG')
+            self.__write(filepath, buffer.getvalue())
+        return self.__remember((handle, size), image)
+    
+    def clear(self) -> None:
+        """Drop the decoded images from memory (the stored files are kept)."""
+        with self.lock:
+            self.__images.clear()
+            self.used = 0
@@ -0,0 +1,175 @@
+import os
+import sqlite3
+import datetime
+from threading import Lock
+from pathlib import Path
+# > Typing
+from types import TracebackType
+from typing_extensions import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+# > Local Imports
+from .._types import FilePathType
+from ..base import AudioSourceMetadata
+from .covers import CoverStore
+from .scanner import TrackInfo, LibraryScanner, SCAN_CHUNK_SIZE
+
+# ! Constants
+
+INDEX_VERSION = 1
+INDEX_BATCH_SIZE = 512
+INDEX_COLUMNS = (
+    'filepath', 'size', 'mtime_ns', 'samplerate', 'channels', 'frames', 'format', 'subtype', 'endian', 'bitrate',
+    'duration', 'title', 'artist', 'album', 'tracknumber', 'date', 'genre', 'copyright', 'software',
+    'cover_hash', 'gapless_delay', 'gapless_padding'
+)
+INDEX_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS tracks (
+    filepath TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,
+    samplerate INTEGER NOT NULL, channels INTEGER NOT NULL, frames INTEGER NOT NULL,
+    format TEXT, subtype TEXT, endian TEXT, bitrate INTEGER, duration REAL,
+    title TEXT, artist TEXT, album TEXT, tracknumber TEXT, date TEXT, genre TEXT, copyright TEXT, software TEXT,
+    cover_hash TEXT, gapless_delay INTEGER NOT NULL DEFAULT 0, gapless_padding INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tracks_cover_hash ON tracks (cover_hash);
+PRAGMA user_version = {INDEX_VERSION};
+"""
+INDEX_UPSERT = f"INSERT OR REPLACE INTO tracks ({', '.join(INDEX_COLUMNS)}) VALUES ({', '.join('?' * len(INDEX_COLUMNS))})"
+INDEX_SELECT = f"SELECT {', '.join(INDEX_COLUMNS)} FROM tracks"
+
+# ! Functions
+
+def track_to_row(track: TrackInfo) -> Tuple:
+    metadata = track.metadata
+    return (
+        track.filepath, track.size, track.mtime_ns, track.samplerate, track.channels, track.frames,
+        track.format, track.subtype, track.endian, track.bitrate, track.duration,
+        metadata.title, metadata.artist, metadata.album, metadata.tracknumber,
+        metadata.date.isoformat() if (metadata.date is not None) else None,
+        metadata.genre, metadata.copyright, metadata.software,
+        track.cover_hash, track.gapless[0], track.gapless[1]
+    )
+
+def row_to_track(row: Tuple) -> TrackInfo:
+    (
+        filepath, size, mtime_ns, samplerate, channels, frames, format, subtype, endian, bitrate, _,
+        title, artist, album, tracknumber, date, genre, copyright, software, cover_hash, delay, padding
+    ) = row
+    metadata = AudioSourceMetadata(
+        title, artist, album, tracknumber,
+        datetime.datetime.fromisoformat(date) if (date is not None) else None,
+        genre, copyright, software, None, cover_hash
+    )
+    return TrackInfo(
+        filepath, size, mtime_ns, samplerate, channels, frames, format, subtype, endian, bitrate,
+        metadata, cover_hash, (delay, padding)
+    )
+
+# ! Library Index Class
+class LibraryIndex:
+    """A persistent SQLite index of the tracks (the stream parameters, the tags and the cover hash) by the file path.
+    
+    The database is in the WAL mode, so the lookups of other connections and processes are not blocked
+    by a writer, and the upserts are batched in single transactions. An entry is fresh while the size
+    and the modification time of its file are unchanged, see `lookup`. Safe to share between threads.
+    """
+    
+    def __init__(self, filepath: Union[str, Path]) -> None:
+        self.filepath = str(filepath)
+        if self.filepath != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.filepath)), exist_ok=True)
+        self.connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        self.lock = Lock()
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(INDEX_SCHEMA)
+    
+    # ^ Magic Methods
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+    
+    def __contains__(self, filepath: FilePathType) -> bool:
+        return self.get(filepath) is not None
+    
+    def __iter__(self) -> Iterator[TrackInfo]:
+        with self.lock:
+            rows = self.connection.execute(INDEX_SELECT).fetchall()
+        return map(row_to_track, rows)
+    
+    # ^ Methods
+    
+    def get(self, filepath: FilePathType) -> Optional[TrackInfo]:
+        """The entry of the file, fresh or not."""
+        with self.lock:
+            row = self.connection.execute(f"{INDEX_SELECT} WHERE filepath = ?", (os.path.abspath(str(filepath)),)).fetchone()
+        return row_to_track(row) if (row is not None) else None
+    
+    def get_many(self, filepaths: Iterable[FilePathType]) -> Dict[str, TrackInfo]:
+        """The entries of the files (fresh or not) found in the index."""
+        filepaths = [os.path.abspath(str(filepath)) for filepath in filepaths]
+        tracks: Dict[str, TrackInfo] = {}
+        with self.lock:
+            for start in range(0, len(filepaths), INDEX_BATCH_SIZE):
+                part = filepaths[start:start + INDEX_BATCH_SIZE]
+                query = f"{INDEX_SELECT} WHERE filepath IN ({', '.join('?' * len(part))})"
+                for row in self.connection.execute(query, part):
+                    tracks[row[0]] = row_to_track(row)
+        return tracks
+    
+    def lookup(self, filepath: FilePathType) -> Optional[TrackInfo]:
+        """The entry of the file if it is fresh (the file has not changed since), else `None`."""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        if ((track := self.get(filepath)) is not None) and track.is_fresh(stat.st_size, stat.st_mtime_ns):
+            return track
+        return None
+    
+    def upsert(self, tracks: Iterable[TrackInfo]) -> int:
+        """Insert or replace the entries of the tracks in one transaction, return their number."""
+        rows = [track_to_row(track) for track in tracks]
+        with self.lock, self.connection:
+            self.connection.executemany(INDEX_UPSERT, rows)
+        return len(rows)
+    
+    def remove(self, filepaths: Iterable[FilePathType]) -> None:
+        rows = [(os.path.abspath(str(filepath)),) for filepath in filepaths]
+        with self.lock, self.connection:
+            self.connection.executemany("DELETE FROM tracks WHERE filepath = ?", rows)
+    
+    def scan(
+        self,
+        *dirpaths: FilePathType,
+        workers: Optional[int]=None,
+        chunksize: int=SCAN_CHUNK_SIZE,
+        covers: Optional[CoverStore]=None
+    ) -> Iterator[Tuple[str, Union[TrackInfo, Exception]]]:
+        """Like `LibraryScanner.scan` from the entries of the index, storing the read tracks by batches and dropping the removed files."""
+        scanner = LibraryScanner({track.filepath: track for track in self}, workers, chunksize, covers=covers)
+        batch: List[TrackInfo] = []
+        for filepath, result in scanner.scan(*dirpaths):
+            if isinstance(result, TrackInfo):
+                batch.append(result)
+                if len(batch) >= INDEX_BATCH_SIZE:
+                    self.upsert(batch)
+                    batch = []
+            yield filepath, result
+        self.upsert(batch)
+        self.remove(scanner.removed)
+    
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,77 @@
+import os
+from soundfile import SoundFile
+from concurrent.futures import ThreadPoolExecutor
+# > Typing
+from typing_extensions import Dict, Iterable, Optional, Union
+# > Local Imports
+from .._types import FilePathType, AudioSamplerate, AudioChannels, AudioFormat, AudioSubType, AudioEndians
+
+# ! Probe Info Class
+class ProbeInfo:
+    """The stream parameters of a file, read from its header only. Returned by `probe`."""
+    
+    __slots__ = ('filepath', 'samplerate', 'channels', 'frames', 'format', 'subtype', 'endian')
+    
+    def __init__(
+        self,
+        filepath: str,
+        samplerate: AudioSamplerate,
+        channels: AudioChannels,
+        frames: int,
+        format: AudioFormat,
+        subtype: AudioSubType,
+        endian: AudioEndians
+    ) -> None:
+        self.filepath = filepath
+        self.samplerate = samplerate
+        self.channels = channels
+        self.frames = frames
+        self.format = format
+        self.subtype = subtype
+        self.endian = endian
+    
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(filepath={self.filepath!r}, samplerate={self.samplerate}, channels={self.channels}, "
+            f"frames={self.frames}, format={self.format!r}, subtype={self.subtype!r})"
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProbeInfo):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    # ^ Propertyes
+    
+    @property
+    def duration(self) -> float:
+        """The duration of the stream in seconds."""
+        return self.frames / self.samplerate
+
+# ! Functions
+
+def probe(filepath: FilePathType) -> ProbeInfo:
+    """The stream parameters of the file, from libsndfile alone (no tags, cover or decoding).
+    
+    Raises:
+        soundfile.LibsndfileError: The file is not a supported audio file.
+    """
+    filepath = os.path.abspath(str(filepath))
+    with SoundFile(filepath) as io:
+        return ProbeInfo(filepath, io.samplerate, io.channels, io.frames, io.format, io.subtype, io.endian)
+
+def probe_many(filepaths: Iterable[FilePathType], workers: Optional[int]=None) -> Dict[str, Union[ProbeInfo, Exception]]:
+    """The stream parameters of the files probed in parallel threads (libsndfile releases the GIL while parsing).
+    
+    Returns:
+        Dict[str, Union[ProbeInfo, Exception]]: The parameters or the error of every file.
+    """
+    def run(filepath: str) -> Union[ProbeInfo, Exception]:
+        try:
+            return probe(filepath)
+        except Exception as e:
+            return e
+    
+    filepaths = [str(filepath) for filepath in filepaths]
+    with ThreadPoolExecutor(workers or min(32, (os.cpu_count() or 1) * 4), thread_name_prefix='probe') as executor:
+        return dict(zip(filepaths, executor.map(run, filepaths)))
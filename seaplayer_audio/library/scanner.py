@@ -0,0 +1,199 @@
+import os
+import mutagen
+from soundfile import SoundFile
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+# > Typing
+from typing_extensions import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+# > Local Imports
+from .._types import FilePathType, AudioSamplerate, AudioChannels, AudioFormat, AudioSubType, AudioEndians
+from ..base import AudioSourceMetadata
+from .covers import CoverStore
+from ..functions import get_mutagen_info, get_audio_metadata, get_audio_image_data, get_gapless_trim
+
+# ! Constants
+
+AUDIO_EXTENSIONS = frozenset({
+    '.mp3', '.flac', '.ogg', '.oga', '.opus', '.wav', '.wave', '.aif', '.aiff', '.aifc',
+    '.caf', '.w64', '.rf64', '.au', '.snd', '.mat', '.voc'
+})
+SCAN_CHUNK_SIZE = 32
+
+# ! Track Info Class
+@dataclass(frozen=True)
+class TrackInfo:
+    """The stream parameters and the tags of a file, as read by the scanner (the cover is kept as its hash).
+    
+    The `size` and `mtime_ns` are those of the file when it was read, the rescans compare them
+    to tell whether it has changed.
+    """
+    filepath: str
+    size: int
+    mtime_ns: int
+    samplerate: AudioSamplerate
+    channels: AudioChannels
+    frames: int
+    format: AudioFormat
+    subtype: AudioSubType
+    endian: AudioEndians
+    bitrate: Optional[int]
+    metadata: AudioSourceMetadata
+    cover_hash: Optional[str]=None
+    gapless: Tuple[int, int]=(0, 0)
+    
+    # ^ Propertyes
+    
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate
+    
+    # ^ Methods
+    
+    def is_fresh(self, size: int, mtime_ns: int) -> bool:
+        """Whether the file of the `size` and `mtime_ns` is the one that was read."""
+        return (self.size == size) and (self.mtime_ns == mtime_ns)
+
+# ! Functions
+
+def walk_audio_files(dirpaths: Iterable[FilePathType], extensions: Iterable[str]=AUDIO_EXTENSIONS) -> Iterator[Tuple[str, int, int]]:
+    """The absolute paths, sizes and modification times (ns) of the audio files in the directories and their subdirectories.
+    
+    The sizes and times come from the directory entries, so no file is opened.
+    """
+    extensions = frozenset(extension.lower() for extension in extensions)
+    stack = [os.path.abspath(str(dirpath)) for dirpath in reversed(list(dirpaths))]
+    while len(stack) > 0:
+        try:
+            entries = sorted(os.scandir(stack.pop()), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirpaths = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subdirpaths.append(entry.path)
+                elif entry.is_file() and (os.path.splitext(entry.name)[1].lower() in extensions):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime_ns
+            except OSError:
+                continue
+        stack.extend(reversed(subdirpaths))
+
+def make_track_info(filepath: str, stat: os.stat_result, io: SoundFile, minfo: Optional[mutagen.FileType], metadata: AudioSourceMetadata) -> TrackInfo:
+    """The track of the opened file, from the already read `minfo` and `metadata` (their icon is dropped)."""
+    try:
+        bitrate = minfo.info.bitrate or None
+    except:
+        bitrate = None
+    return TrackInfo(
+        filepath, stat.st_size, stat.st_mtime_ns,
+        io.samplerate, io.channels, io.frames, io.format, io.subtype, io.endian, bitrate,
+        replace(metadata, icon=None) if (metadata.icon is not None) else metadata,
+        metadata.cover,
+        get_gapless_trim(filepath, minfo, io.frames)
+    )
+
+def extract_track_info(filepath: FilePathType, covers: Optional[CoverStore]=None) -> TrackInfo:
+    """Read the stream parameters and the tags of the file, without decoding the audio.
+    
+    The cover is only decoded to make its thumbnails when it is new to the `covers`.
+    """
+    filepath = os.path.abspath(str(filepath))
+    stat = os.stat(filepath)
+    with SoundFile(filepath) as io:
+        minfo = get_mutagen_info(filepath)
+        if (covers is not None) and ((data := get_audio_image_data(minfo)) is not None):
+            covers.put(data)
+        return make_track_info(filepath, stat, io, minfo, get_audio_metadata(io, minfo, with_icon=False))
+
+def _extract_track_infos(filepaths: List[str], covers: Optional[Tuple[str, Tuple[int, ...]]]) -> List[Tuple[str, Union[TrackInfo, Exception]]]:
+    store = CoverStore(*covers, memory=0) if (covers is not None) else None
+    results = []
+    for filepath in filepaths:
+        try:
+            results.append((filepath, extract_track_info(filepath, store)))
+        except Exception as e:
+            results.append((filepath, e))
+    return results
+
+def scan_library(
+    dirpaths: Iterable[FilePathType],
+    workers: Optional[int]=None,
+    chunksize: int=SCAN_CHUNK_SIZE,
+    covers: Optional[CoverStore]=None
+) -> Dict[str, Union[TrackInfo, Exception]]:
+    """The tracks (or the errors) of all the audio files of the directories, read in parallel processes."""
+    return dict(LibraryScanner(workers=workers, chunksize=chunksize, covers=covers).scan(*dirpaths))
+
+# ! Library Scanner Class
+class LibraryScanner:
+    """Reads the audio files of directories in parallel processes, skipping the files read before.
+    
+    The files are sent to the processes by chunks of `chunksize` while the directories are still walked,
+    and the results come back as the chunks complete, so the first tracks are available
+    long before the scan ends. The `tracks` read by a scan are kept, a rescan only reads the new files and
+    the files whose size or modification time has changed, and reports the removed ones in `removed`.
+    With `covers`, the processes also store the new covers and their thumbnails there.
+    """
+    
+    def __init__(
+        self,
+        tracks: Optional[Dict[str, TrackInfo]]=None,
+        workers: Optional[int]=None,
+        chunksize: int=SCAN_CHUNK_SIZE,
+        extensions: Iterable[str]=AUDIO_EXTENSIONS,
+        covers: Optional[CoverStore]=None
+    ) -> None:
+        self.tracks: Dict[str, TrackInfo] = {} if (tracks is None) else tracks
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.extensions = frozenset(extensions)
+        self.covers = covers
+        self.removed: List[str] = []
+        self.skipped = 0
+    
+    # ^ Hidden Methods
+    
+    def __collect(self, futures: Iterable[Future]) -> Iterator[Tuple[str, Union[TrackInfo, Exception]]]:
+        for future in futures:
+            for filepath, result in future.result():
+                if isinstance(result, TrackInfo):
+                    self.tracks[filepath] = result
+                yield filepath, result
+    
+    # ^ Methods
+    
+    def scan(self, *dirpaths: FilePathType) -> Iterator[Tuple[str, Union[TrackInfo, Exception]]]:
+        """Read the new and changed audio files of the directories, yield the path and the track (or the error) of each as they complete.
+        
+        The known tracks of the missing files under the directories are dropped and listed in `removed` once the scan ends.
+        """
+        roots = tuple(os.path.join(os.path.abspath(str(dirpath)), '') for dirpath in dirpaths)
+        seen: Set[str] = set()
+        self.removed, self.skipped = [], 0
+        chunk: List[str] = []
+        pending: Set[Future] = set()
+        covers = (self.covers.dirpath, self.covers.sizes) if (self.covers is not None) else None
+        with ProcessPoolExecutor(self.workers) as executor:
+            for filepath, size, mtime_ns in walk_audio_files(dirpaths, self.extensions):
+                seen.add(filepath)
+                if ((track := self.tracks.get(filepath)) is not None) and track.is_fresh(size, mtime_ns):
+                    self.skipped += 1
+                    continue
+                chunk.append(filepath)
+                if len(chunk) >= self.chunksize:
+                    pending.add(executor.submit(_extract_track_infos, chunk, covers))
+                    chunk = []
+                # * Keeps a few chunks per process queued, and the memory bounded on huge libraries.
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from self.__collect(done)
+            if len(chunk) > 0:
+                pending.add(executor.submit(_extract_track_infos, chunk, covers))
+            while len(pending) > 0:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from self.__collect(done)
+        for filepath in list(self.tracks):
+            if filepath.startswith(roots) and (filepath not in seen):
+                del self.tracks[filepath]
+                self.removed.append(filepath)
@@ -0,0 +1,24 @@
+from .resampler import Resampler, ResamplerQuality, RESAMPLER_QUALITIES
+from .converter import (
+    Converter, CHANNEL_LAYOUTS, STEREO_DOWNMIX, SUBTYPE_DTYPES, DTYPE_BITS,
+    get_mix_matrix, get_sample_scale, convert_samples, get_native_dtype, is_reducing
+)
+from .effects import EffectChain
+from .timestretch import TimeStretcher, MIN_SPEED, MAX_SPEED
+from .gain import GainRamp, GainRampMode, RAMP_TIME, db_to_gain, gain_to_db
+from .scheduler import EventScheduler, ScheduledEvent, SCHEDULER_BLOCK_SIZE
+from .spectrum import SpectrumTap, SpectrumFrame, HistoryRing, get_band_edges
+from .equalizer import BiquadEQ, BiquadCascade, EQBand, EQBandKind, get_biquad_coefficients
+
+
+__all__ = [
+    'Resampler', 'ResamplerQuality', 'RESAMPLER_QUALITIES',
+    'Converter', 'CHANNEL_LAYOUTS', 'STEREO_DOWNMIX', 'SUBTYPE_DTYPES', 'DTYPE_BITS',
+    'get_mix_matrix', 'get_sample_scale', 'convert_samples', 'get_native_dtype', 'is_reducing',
+    'EffectChain',
+    'TimeStretcher', 'MIN_SPEED', 'MAX_SPEED',
+    'GainRamp', 'GainRampMode', 'RAMP_TIME', 'db_to_gain', 'gain_to_db',
+    'EventScheduler', 'ScheduledEvent', 'SCHEDULER_BLOCK_SIZE',
+    'SpectrumTap', 'SpectrumFrame', 'HistoryRing', 'get_band_edges',
+    'BiquadEQ', 'BiquadCascade', 'EQBand', 'EQBandKind', 'get_biquad_coefficients'
+]
\ No newline at end of file
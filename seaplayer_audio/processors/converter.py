@@ -0,0 +1,186 @@
+import numpy as np
+from numpy import ndarray
+# > Typing
+from typing_extensions import Dict, Optional, Tuple
+# > Local Imports
+from .._types import AudioChannels, AudioDType, AudioSubType
+
+# ! Constants
+
+CHANNEL_LAYOUTS: Dict[int, Tuple[str, ...]] = {
+    1: ('M',),
+    2: ('L', 'R'),
+    3: ('L', 'R', 'C'),
+    4: ('L', 'R', 'Ls', 'Rs'),
+    5: ('L', 'R', 'C', 'Ls', 'Rs'),
+    6: ('L', 'R', 'C', 'LFE', 'Ls', 'Rs'),
+    8: ('L', 'R', 'C', 'LFE', 'Ls', 'Rs', 'Lb', 'Rb'),
+}
+# * The ITU-R BS.775 downmix coefficients (left, right) of every speaker.
+STEREO_DOWNMIX: Dict[str, Tuple[float, float]] = {
+    'M': (1.0, 1.0),
+    'L': (1.0, 0.0),
+    'R': (0.0, 1.0),
+    'C': (0.7071, 0.7071),
+    'LFE': (0.0, 0.0),
+    'Ls': (0.7071, 0.0),
+    'Rs': (0.0, 0.7071),
+    'Lb': (0.7071, 0.0),
+    'Rb': (0.0, 0.7071),
+}
+# * The dtypes holding the samples of the subtypes without losses, the lossy codecs are decoded into float32.
+SUBTYPE_DTYPES: Dict[str, AudioDType] = {
+    'PCM_S8': 'int16',
+    'PCM_U8': 'int16',
+    'PCM_16': 'int16',
+    'ULAW': 'int16',
+    'ALAW': 'int16',
+    'PCM_24': 'int32',
+    'PCM_32': 'int32',
+    'FLOAT': 'float32',
+    'DOUBLE': 'float64',
+}
+# * The significant bits of the samples of the dtypes.
+DTYPE_BITS: Dict[str, int] = {'int16': 16, 'float32': 24, 'int32': 32, 'float64': 53}
+
+# ! Functions
+
+def get_sample_scale(dtype: AudioDType) -> float:
+    """The value of the full scale of the samples (`1.0` for the float types)."""
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return 1.0
+    return -float(np.iinfo(dtype).min)
+
+def get_native_dtype(subtype: Optional[AudioSubType]) -> AudioDType:
+    """The dtype the samples of the `subtype` are decoded into without conversions or losses."""
+    return SUBTYPE_DTYPES.get(subtype, 'float32')
+
+def is_reducing(dtype: AudioDType, target_dtype: AudioDType) -> bool:
+    """Whether the conversion to the integer `target_dtype` loses bits of the samples (so it should be dithered)."""
+    return (np.dtype(target_dtype).kind == 'i') and (DTYPE_BITS[np.dtype(dtype).name] > DTYPE_BITS[np.dtype(target_dtype).name])
+
+def get_mix_matrix(channels: AudioChannels, target_channels: AudioChannels, normalize: bool=True) -> ndarray:
+    """Build the `channels x target_channels` mixing matrix (`target = source @ matrix`) for the standard layouts.
+    
+    The channels of unknown layouts are mapped one to one. With `normalize`, the gains of
+    every output channel are scaled to the sum of `1.0` at most, so the downmix does not clip.
+    """
+    if channels == target_channels:
+        return np.eye(channels, dtype=np.float64)
+    source_layout, target_layout = CHANNEL_LAYOUTS.get(channels), CHANNEL_LAYOUTS.get(target_channels)
+    if (source_layout is None) or (target_layout is None):
+        return np.eye(channels, target_channels, dtype=np.float64)
+    to_stereo = np.array([STEREO_DOWNMIX[speaker] for speaker in source_layout], dtype=np.float64)
+    if target_channels == 1:
+        matrix = to_stereo @ np.array([[0.5], [0.5]])
+    else:
+        from_stereo = np.zeros((2, target_channels), dtype=np.float64)
+        from_stereo[0, target_layout.index('L')] = 1.0
+        from_stereo[1, target_layout.index('R')] = 1.0
+        matrix = to_stereo @ from_stereo
+    if normalize:
+        matrix /= np.maximum(np.abs(matrix).sum(axis=0, keepdims=True), 1.0)
+    return matrix
+
+def convert_samples(data: ndarray, out: ndarray) -> ndarray:
+    """Write the samples into `out` scaling them between the float and integer full ranges (without dither)."""
+    scale = get_sample_scale(out.dtype) / get_sample_scale(data.dtype)
+    if scale == 1.0:
+        np.copyto(out, data, casting='unsafe')
+    elif out.dtype.kind == 'f':
+        np.multiply(data, scale, out=out, casting='unsafe')
+    else:
+        info = np.iinfo(out.dtype)
+        np.copyto(out, np.clip(np.rint(data * scale), info.min, info.max), casting='unsafe')
+    return out
+
+# ! Converter Class
+class Converter:
+    """The channel remixing and sample type conversion of `frames x channels` blocks.
+    
+    The scales of the sample types are folded into the mixing matrix, so a conversion
+    to a float type is a single matrix product written directly into the output buffer.
+    The conversion to an integer type rounds (with an optional TPDF dither) and clips
+    in a scratch buffer reused between the blocks.
+    """
+    
+    def __init__(
+        self,
+        channels: AudioChannels,
+        target_channels: AudioChannels,
+        dtype: AudioDType='float32',
+        target_dtype: AudioDType='float32',
+        dither: bool=False,
+        normalize: bool=True,
+        matrix: Optional[ndarray]=None
+    ) -> None:
+        self.channels = channels
+        self.target_channels = target_channels
+        self.dtype = np.dtype(dtype)
+        self.target_dtype = np.dtype(target_dtype)
+        self.dither = dither
+        self.matrix = get_mix_matrix(channels, target_channels, normalize) if (matrix is None) else np.asarray(matrix, np.float64)
+        if self.matrix.shape != (channels, target_channels):
+            raise ValueError(f"The mixing matrix must be of the shape {(channels, target_channels)}, not {self.matrix.shape}")
+        precise = (np.float64 in (self.dtype, self.target_dtype)) or (np.int32 in (self.dtype, self.target_dtype))
+        self.work_dtype = np.dtype(np.float64 if precise else np.float32)
+        self.identity = (channels == target_channels) and np.array_equal(self.matrix, np.eye(channels))
+        self.scale = get_sample_scale(self.target_dtype) / get_sample_scale(self.dtype)
+        self.__matrix = (self.matrix * self.scale).astype(self.work_dtype)
+        self.__work = np.empty((0, target_channels), self.work_dtype)
+        self.__noise = np.empty((0, target_channels), self.work_dtype)
+        self.__rng = np.random.default_rng()
+    
+    # ^ Hidden Methods
+    
+    def __scratch(self, frames: int) -> Tuple[ndarray, ndarray]:
+        if len(self.__work) < frames:
+            self.__work = np.empty((frames, self.target_channels), self.work_dtype)
+            self.__noise = np.empty((frames, self.target_channels), self.work_dtype)
+        return self.__work[:frames], self.__noise[:frames]
+    
+    def __mix(self, data: ndarray, out: ndarray) -> None:
+        if self.identity:
+            if self.scale == 1.0:
+                np.copyto(out, data, casting='unsafe')
+            else:
+                np.multiply(data, self.scale, out=out, casting='unsafe')
+        else:
+            np.matmul(data, self.__matrix, out=out, casting='unsafe')
+    
+    # ^ Methods
+    
+    def process(self, data: ndarray, out: Optional[ndarray]=None) -> ndarray:
+        """Convert the block of samples (`frames x channels`, or `frames` for the mono).
+        
+        Args:
+            data (ndarray): The samples of `dtype`.
+            out (ndarray, optional): The `frames x target_channels` buffer of `target_dtype` to write to.
+        
+        Returns:
+            ndarray: The converted samples (`out`, if it is specified).
+        """
+        frames = len(data)
+        data = data.reshape(frames, self.channels)
+        if out is None:
+            out = np.empty((frames, self.target_channels), self.target_dtype)
+        target = out.reshape(frames, self.target_channels)
+        if self.target_dtype.kind == 'f':
+            self.__mix(data, target)
+        elif self.identity and (self.dtype == self.target_dtype):
+            np.copyto(target, data)
+        else:
+            work, noise = self.__scratch(frames)
+            self.__mix(data, work)
+            if self.dither:
+                # * The triangular noise of +-1 LSB decorrelates the rounding error from the signal.
+                self.__rng.random(out=noise, dtype=self.work_dtype)
+                np.add(work, noise, out=work)
+                self.__rng.random(out=noise, dtype=self.work_dtype)
+                np.subtract(work, noise, out=work)
+            info = np.iinfo(self.target_dtype)
+            np.rint(work, out=work)
+            np.clip(work, info.min, info.max, out=work)
+            np.copyto(target, work, casting='unsafe')
+        return out
@@ -0,0 +1,94 @@
+import numpy as np
+from numpy import ndarray
+from threading import Lock
+# > Typing
+from typing_extensions import Any, Iterable, Iterator, Tuple
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+from ..base.effect import EffectBase
+from .converter import convert_samples
+
+# ! Effect Chain Class
+class EffectChain(EffectBase[Tuple[EffectBase, ...]]):
+    """An ordered chain of effects applied to the blocks one after another.
+    
+    The effects are kept in a tuple replaced as a whole on every change,
+    so the chain can be edited from any thread while the audio thread walks it.
+    Integer blocks are processed through a float scratch buffer and converted back.
+    """
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels, effects: Iterable[EffectBase]=()) -> None:
+        super().__init__(samplerate, channels, tuple(effects))
+        self.__lock = Lock()
+        self.__work = np.empty((0, channels), np.float32)
+    
+    # ^ Magic Methods
+    
+    def __len__(self) -> int:
+        return len(self.params)
+    
+    def __iter__(self) -> Iterator[EffectBase]:
+        return iter(self.params)
+    
+    def __getitem__(self, index: int) -> EffectBase:
+        return self.params[index]
+    
+    # ^ Hidden Methods
+    
+    def __scratch(self, frames: int) -> ndarray:
+        if (len(self.__work) < frames) or (self.__work.shape[1] != self.channels):
+            self.__work = np.empty((frames, self.channels), np.float32)
+        return self.__work[:frames]
+    
+    # ^ Effect Methods
+    
+    def apply(self, block: ndarray, params: Tuple[EffectBase, ...], prepared: Any) -> None:
+        for effect in params:
+            effect.process(block)
+    
+    def reset(self) -> None:
+        for effect in self.params:
+            effect.reset()
+    
+    def configure(self, samplerate: AudioSamplerate, channels: AudioChannels) -> None:
+        for effect in self.params:
+            effect.configure(samplerate, channels)
+        super().configure(samplerate, channels)
+    
+    def process(self, block: ndarray) -> ndarray:
+        """Process the `frames x channels` (or `frames` for the mono) block in place and return it."""
+        if (not self.enabled) or (len(self.params) == 0) or (len(block) == 0):
+            return block
+        data = block.reshape(len(block), self.channels)
+        if data.dtype.kind == 'f':
+            super().process(data)
+        else:
+            work = convert_samples(data, self.__scratch(len(data)))
+            super().process(work)
+            convert_samples(work, data)
+        return block
+    
+    # ^ Chain Methods
+    
+    def add(self, effect: EffectBase) -> EffectBase:
+        """Append the effect to the end of the chain."""
+        with self.__lock:
+            self.update(self.params + (effect,))
+        return effect
+    
+    def insert(self, index: int, effect: EffectBase) -> EffectBase:
+        with self.__lock:
+            effects = list(self.params)
+            effects.insert(index, effect)
+            self.update(tuple(effects))
+        return effect
+    
+    def remove(self, effect: EffectBase) -> None:
+        with self.__lock:
+            effects = list(self.params)
+            effects.remove(effect)
+            self.update(tuple(effects))
+    
+    def clear(self) -> None:
+        with self.__lock:
+            self.update(())
@@ -0,0 +1,153 @@
+import math
+import numpy as np
+from numpy import ndarray
+from dataclasses import dataclass
+# > Typing
+from typing_extensions import Dict, Iterable, Literal, Tuple, TypeAlias
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+from ..base.effect import EffectBase
+
+# ! Types
+
+EQBandKind: TypeAlias = Literal['peaking', 'lowshelf', 'highshelf', 'lowpass', 'highpass', 'bandpass', 'notch']
+
+@dataclass(frozen=True)
+class EQBand:
+    kind: EQBandKind='peaking'
+    frequency: float=1000.0
+    gain: float=0.0
+    q: float=0.7071
+
+# ! Functions
+
+def get_biquad_coefficients(band: EQBand, samplerate: AudioSamplerate) -> Tuple[float, float, float, float, float]:
+    """Compute the normalized `(b0, b1, b2, a1, a2)` of the band (RBJ Audio EQ Cookbook)."""
+    w0 = 2 * math.pi * min(band.frequency, samplerate * 0.49) / samplerate
+    cos, alpha = math.cos(w0), math.sin(w0) / (2 * band.q)
+    amp = 10 ** (band.gain / 40)
+    if band.kind == 'peaking':
+        b, a = (1 + alpha * amp, -2 * cos, 1 - alpha * amp), (1 + alpha / amp, -2 * cos, 1 - alpha / amp)
+    elif band.kind in ('lowshelf', 'highshelf'):
+        sign = 1 if (band.kind == 'lowshelf') else -1
+        root = 2 * math.sqrt(amp) * alpha
+        b = (
+            amp * ((amp + 1) - sign * (amp - 1) * cos + root),
+            sign * 2 * amp * ((amp - 1) - sign * (amp + 1) * cos),
+            amp * ((amp + 1) - sign * (amp - 1) * cos - root)
+        )
+        a = (
+            (amp + 1) + sign * (amp - 1) * cos + root,
+            -sign * 2 * ((amp - 1) + sign * (amp + 1) * cos),
+            (amp + 1) + sign * (amp - 1) * cos - root
+        )
+    elif band.kind == 'lowpass':
+        b, a = ((1 - cos) / 2, 1 - cos, (1 - cos) / 2), (1 + alpha, -2 * cos, 1 - alpha)
+    elif band.kind == 'highpass':
+        b, a = ((1 + cos) / 2, -(1 + cos), (1 + cos) / 2), (1 + alpha, -2 * cos, 1 - alpha)
+    elif band.kind == 'bandpass':
+        b, a = (alpha, 0.0, -alpha), (1 + alpha, -2 * cos, 1 - alpha)
+    elif band.kind == 'notch':
+        b, a = (1.0, -2 * cos, 1.0), (1 + alpha, -2 * cos, 1 - alpha)
+    else:
+        raise ValueError(f"Unknown EQ band kind {band.kind!r}")
+    return b[0] / a[0], b[1] / a[0], b[2] / a[0], a[1] / a[0], a[2] / a[0]
+
+# ! Biquad Cascade Class
+class BiquadCascade:
+    """The coefficients of the biquad sections and their block kernels cached by the block size."""
+    
+    def __init__(self, coefficients: ndarray) -> None:
+        self.coefficients = coefficients
+        self.kernels: Dict[int, Tuple[int, ndarray, ndarray]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.coefficients)
+    
+    def get_kernels(self, frames: int) -> Tuple[int, ndarray, ndarray]:
+        """Return `(nfft, spectra of the impulse responses, all-pole responses)` for the blocks of `frames`."""
+        if (kernels := self.kernels.get(frames, None)) is None:
+            # * The recursion is kept sequential: the doubling by the powers of the state matrix loses
+            # * the precision of the filters with the poles close to the unit circle (low shelves, high-passes).
+            a1, a2 = self.coefficients[:, 3], self.coefficients[:, 4]
+            poles = np.zeros((len(self), frames), np.float64)
+            poles[:, 0] = 1.0
+            if frames > 1:
+                poles[:, 1] = -a1
+            for n in range(2, frames):
+                poles[:, n] = -a1 * poles[:, n - 1] - a2 * poles[:, n - 2]
+            # * The impulse response of B(z)/A(z) truncated to the block is exact inside the block.
+            responses = self.coefficients[:, 0, None] * poles
+            responses[:, 1:] += self.coefficients[:, 1, None] * poles[:, :-1]
+            responses[:, 2:] += self.coefficients[:, 2, None] * poles[:, :-2]
+            nfft = 1 << (2 * frames - 1).bit_length()
+            kernels = (nfft, np.fft.rfft(responses, nfft, axis=1), poles)
+            self.kernels[frames] = kernels
+        return kernels
+
+# ! Biquad EQ Class
+class BiquadEQ(EffectBase[Tuple[EQBand, ...]]):
+    """A parametric equalizer made of a cascade of biquad filters.
+    
+    Each section filters the whole block at once: the zero-state response is an FFT convolution
+    with the impulse response truncated to the block length (exact inside the block), and the
+    response to the state left by the previous block is added from the all-pole impulse response.
+    """
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels, bands: Iterable[EQBand]=()) -> None:
+        self.__frames = 0
+        super().__init__(samplerate, channels, tuple(bands))
+        self.reset()
+    
+    # ^ Effect Methods
+    
+    def prepare(self, params: Tuple[EQBand, ...]) -> BiquadCascade:
+        coefficients = [get_biquad_coefficients(band, self.samplerate) for band in params]
+        cascade = BiquadCascade(np.array(coefficients, np.float64).reshape(-1, 5))
+        if self.__frames > 0:
+            # * The kernels for the current block size are built here, not in the audio thread.
+            cascade.get_kernels(self.__frames)
+        return cascade
+    
+    def reset(self) -> None:
+        # * Per section and channel: x[-1], x[-2], y[-1], y[-2]
+        self.__state = np.zeros((len(self.params), 4, self.channels), np.float64)
+    
+    def apply(self, block: ndarray, params: Tuple[EQBand, ...], prepared: BiquadCascade) -> None:
+        if len(prepared) == 0:
+            return
+        frames = self.__frames = len(block)
+        if self.__state.shape != (len(prepared), 4, block.shape[1]):
+            self.__state = np.zeros((len(prepared), 4, block.shape[1]), np.float64)
+        nfft, spectra, poles = prepared.get_kernels(frames)
+        x = block.astype(np.float64)
+        for index, (b0, b1, b2, a1, a2) in enumerate(prepared.coefficients):
+            x1, x2, y1, y2 = self.__state[index].copy()
+            y = np.fft.irfft(np.fft.rfft(x, nfft, axis=0) * spectra[index, :, None], nfft, axis=0)[:frames]
+            y += poles[index, :, None] * (b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2)
+            y[1:] += poles[index, :-1, None] * (b2 * x1 - a2 * y1)
+            self.__state[index] = (
+                x[-1], x[-2] if (frames > 1) else x1,
+                y[-1], y[-2] if (frames > 1) else y1
+            )
+            x = y
+        np.copyto(block, x, casting='unsafe')
+    
+    # ^ Methods
+    
+    def set_bands(self, bands: Iterable[EQBand]) -> None:
+        """Replace the bands (from any thread). The filter state is kept while the number of bands is the same."""
+        self.update(tuple(bands))
+    
+    def set_band(self, index: int, band: EQBand) -> None:
+        bands = list(self.params)
+        bands[index] = band
+        self.update(tuple(bands))
+    
+    def get_response(self, frequencies: ndarray) -> ndarray:
+        """The magnitude response (in dB) of the equalizer at the frequencies."""
+        z = np.exp(-2j * np.pi * np.asarray(frequencies, np.float64) / self.samplerate)
+        response = np.ones_like(z)
+        for b0, b1, b2, a1, a2 in self.prepare(self.params).coefficients:
+            response *= (b0 + b1 * z + b2 * z * z) / (1 + a1 * z + a2 * z * z)
+        return 20 * np.log10(np.abs(response))
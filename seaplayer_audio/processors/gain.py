@@ -0,0 +1,137 @@
+import math
+import numpy as np
+from numpy import ndarray
+# > Typing
+from typing_extensions import Dict, Literal, Optional, Tuple, TypeAlias, Union
+# > Local Imports
+from .._types import AudioSamplerate
+
+# ! Types
+
+GainRampMode: TypeAlias = Literal['linear', 'db']
+
+# ! Constants
+
+RAMP_TIME = 0.02
+MIN_GAIN = 1e-6
+SCRATCH_SIZE = 8192
+
+# ! Functions
+
+def db_to_gain(db: float) -> float:
+    return 10 ** (db / 20)
+
+def gain_to_db(gain: float) -> float:
+    return 20 * math.log10(max(gain, MIN_GAIN))
+
+# ! Gain Ramp Class
+class GainRamp:
+    """The volume of a stream changed smoothly over a ramp, applied to the blocks in place.
+    
+    The ramp shapes are precomputed in the thread changing the volume and published with one assignment.
+    The audio thread starts every new ramp from the gain it has actually reached, so the changes
+    never jump, and applies it through a preallocated buffer without allocations
+    (the float blocks, integer ones are scaled through a float buffer and clipped to their range).
+    """
+    
+    def __init__(self, samplerate: AudioSamplerate, volume: float=1.0) -> None:
+        self.samplerate = samplerate
+        self.__curves: Dict[int, ndarray] = {}
+        self.__ramp: Tuple[float, Optional[ndarray], GainRampMode] = (volume, None, 'linear')
+        self.__active = self.__ramp
+        self.__gain = volume
+        self.__start = volume
+        self.__position = 0
+        self.__scratch = np.empty(SCRATCH_SIZE, np.float32)
+        self.__values = np.empty(0, np.float64)
+    
+    # ^ Propertyes
+    
+    @property
+    def volume(self) -> float:
+        """The target volume (linear gain)."""
+        return self.__ramp[0]
+    
+    @property
+    def gain(self) -> float:
+        """The gain reached by the audio at the moment."""
+        return self.__gain
+    
+    @property
+    def ramping(self) -> bool:
+        return self.__gain != self.__ramp[0]
+    
+    # ^ Hidden Methods
+    
+    def __curve(self, frames: int) -> ndarray:
+        if (curve := self.__curves.get(frames, None)) is None:
+            curve = np.arange(1, frames + 1, dtype=np.float32) / frames
+            self.__curves[frames] = curve
+        return curve
+    
+    def __multiply_integers(self, data: ndarray, gains: Union[float, ndarray]) -> None:
+        info = np.iinfo(data.dtype)
+        if len(self.__values) < len(data):
+            self.__values = np.empty(len(data), np.float64)
+        values = self.__values[:len(data)]
+        for channel in range(data.shape[1]):
+            np.multiply(data[:, channel], gains, out=values)
+            np.rint(values, out=values)
+            np.clip(values, info.min, info.max, out=values)
+            np.copyto(data[:, channel], values, casting='unsafe')
+    
+    # ^ Methods
+    
+    def set_volume(self, volume: float, duration: float=RAMP_TIME, mode: GainRampMode='linear') -> None:
+        """Change the volume (linear gain) over the `duration` seconds. Safe to call from any thread.
+        
+        Args:
+            mode ({'linear', 'db'}, optional): Interpolate the gain itself or its decibels (sounds even for long fades). Defaults to `'linear'`.
+        """
+        if volume < 0:
+            raise ValueError(f"The volume must not be negative, not {volume}")
+        frames = int(duration * self.samplerate)
+        self.__ramp = (volume, self.__curve(frames) if (frames > 0) else None, mode)
+    
+    def set_gain_db(self, db: float, duration: float=RAMP_TIME, mode: GainRampMode='db') -> None:
+        """Change the volume to the gain in decibels over the `duration` seconds."""
+        self.set_volume(db_to_gain(db), duration, mode)
+    
+    def process(self, block: ndarray) -> ndarray:
+        """Apply the gain to the `frames x channels` (or `frames`) block in place and return it."""
+        ramp = self.__ramp
+        if ramp is not self.__active:
+            self.__active, self.__start, self.__position = ramp, self.__gain, 0
+        target, curve, mode = ramp
+        frames = len(block)
+        if (curve is None) or (self.__position >= len(curve)):
+            self.__gain = target
+            if (target != 1.0) and (block.dtype.kind == 'f'):
+                np.multiply(block, target, out=block, casting='unsafe')
+            elif target != 1.0:
+                self.__multiply_integers(block.reshape(frames, -1), target)
+            return block
+        if len(self.__scratch) < frames:
+            self.__scratch = np.empty(frames, np.float32)
+        gains = self.__scratch[:frames]
+        count = min(frames, len(curve) - self.__position)
+        part = gains[:count]
+        if mode == 'db':
+            start, end = math.log(max(self.__start, MIN_GAIN)), math.log(max(target, MIN_GAIN))
+            np.multiply(curve[self.__position:self.__position + count], end - start, out=part)
+            np.add(part, start, out=part)
+            np.exp(part, out=part)
+        else:
+            np.multiply(curve[self.__position:self.__position + count], target - self.__start, out=part)
+            np.add(part, self.__start, out=part)
+        gains[count:] = target
+        self.__position += count
+        self.__gain = target if (self.__position >= len(curve)) else float(part[-1])
+        # * Channel by channel: the broadcasting of the gains over the channels makes numpy allocate buffers.
+        data = block.reshape(frames, -1)
+        if data.dtype.kind != 'f':
+            self.__multiply_integers(data, gains)
+            return block
+        for channel in range(data.shape[1]):
+            np.multiply(data[:, channel], gains, out=data[:, channel], casting='unsafe')
+        return block
@@ -0,0 +1,142 @@
+import math
+import numpy as np
+from numpy import ndarray
+from numpy.lib.stride_tricks import sliding_window_view
+# > Typing
+from typing_extensions import Dict, Literal, Tuple, TypeAlias
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+
+# ! Types
+
+ResamplerQuality: TypeAlias = Literal['fast', 'medium', 'high', 'best']
+
+# ! Constants
+
+# * quality: (half of the filter taps, kaiser window beta, cutoff relative to the nyquist frequency)
+RESAMPLER_QUALITIES: Dict[str, Tuple[int, float, float]] = {
+    'fast':     (8,     5.0,    0.85),
+    'medium':   (16,    7.0,    0.91),
+    'high':     (32,    8.6,    0.95),
+    'best':     (64,    10.0,   0.97),
+}
+
+# ! Functions
+
+def get_resampler_filters(up: int, down: int, half: int, beta: float, cutoff: float) -> ndarray:
+    """Build the polyphase bank of the kaiser-windowed sinc filter (`up` phases, `2 * half` taps each)."""
+    taps = 2 * half
+    cutoff = cutoff * min(1.0, up / down)
+    phases = np.arange(up, dtype=np.float64)[:, None] / up
+    # * The output of the phase `p` lies between the taps `half - 1` and `half` of its window.
+    x = (half - 1 + phases) - np.arange(taps, dtype=np.float64)[None, :]
+    window = np.i0(beta * np.sqrt(np.clip(1.0 - (x / half) ** 2, 0.0, None))) / np.i0(beta)
+    filters = cutoff * np.sinc(cutoff * x) * window
+    filters /= filters.sum(axis=1, keepdims=True)
+    return filters
+
+# ! Resampler Class
+class Resampler:
+    """A streaming polyphase resampler (kaiser-windowed sinc) for blocks of `frames x channels` arrays.
+    
+    The input history and the filter phase are carried between the blocks,
+    so the result of the block processing is equal to the processing of the whole signal.
+    """
+    
+    def __init__(
+        self,
+        samplerate: AudioSamplerate,
+        target_samplerate: AudioSamplerate,
+        channels: AudioChannels=2,
+        quality: ResamplerQuality='medium',
+        dtype: str='float32'
+    ) -> None:
+        if quality not in RESAMPLER_QUALITIES:
+            raise ValueError(f"Unknown resampler quality {quality!r}, should be one of {tuple(RESAMPLER_QUALITIES)}")
+        divisor = math.gcd(samplerate, target_samplerate)
+        self.samplerate = samplerate
+        self.target_samplerate = target_samplerate
+        self.channels = channels
+        self.quality = quality
+        self.dtype = np.dtype(dtype)
+        self.up = target_samplerate // divisor
+        self.down = samplerate // divisor
+        half, beta, cutoff = RESAMPLER_QUALITIES[quality]
+        # * The filter is widened on downsampling to keep the transition band the same.
+        self.half = int(math.ceil(half * max(1.0, self.down / self.up)))
+        self.taps = 2 * self.half
+        self.filters = get_resampler_filters(self.up, self.down, self.half, beta, cutoff).astype(self.dtype)
+        self.reset()
+    
+    # ^ Propertyes
+    
+    @property
+    def ratio(self) -> float:
+        return self.up / self.down
+    
+    @property
+    def latency(self) -> int:
+        """The number of input frames held back until the next block (or `flush`)."""
+        return self.half
+    
+    # ^ Hidden Methods
+    
+    def __resample(self, data: ndarray) -> ndarray:
+        data = np.concatenate([self.__history, data.reshape(-1, self.channels).astype(self.dtype, copy=False)])
+        if len(data) < self.taps:
+            self.__history = data
+            return np.empty((0, self.channels), self.dtype)
+        # * The window start `t // up` must leave `taps` frames to the end of the data.
+        count = max(((len(data) - self.taps) * self.up + self.up - 1 - self.__time) // self.down + 1, 0)
+        out = np.empty((count, self.channels), self.dtype)
+        windows = sliding_window_view(data, self.taps, axis=0)
+        # * Every `up`-th output frame has the same filter phase and the window shifted by `down` frames.
+        for first in range(min(self.up, count)):
+            start, phase = divmod(self.__time + self.down * first, self.up)
+            number = (count - first + self.up - 1) // self.up
+            np.matmul(windows[start::self.down][:number], self.filters[phase], out=out[first::self.up])
+        time = self.__time + self.down * count
+        consumed = time // self.up
+        self.__time = time - consumed * self.up
+        self.__history = data[consumed:].copy()
+        return out
+    
+    # ^ Methods
+    
+    def reset(self) -> None:
+        """Forget the input history (before a seek)."""
+        self.__history = np.zeros((self.half - 1, self.channels), self.dtype)
+        self.__time = 0
+        self.__consumed = 0
+        self.__produced = 0
+    
+    def process(self, data: ndarray) -> ndarray:
+        """Resample the next block of `frames x channels` (or `frames` for the mono) samples.
+        
+        Returns:
+            ndarray: The resampled frames available so far (`frames x channels`).
+        """
+        if self.up == self.down:
+            return data.reshape(-1, self.channels).astype(self.dtype)
+        self.__consumed += len(data)
+        out = self.__resample(data)
+        self.__produced += len(out)
+        return out
+    
+    def flush(self) -> ndarray:
+        """Return the rest of the resampled frames at the end of the stream and reset the state."""
+        if self.up == self.down:
+            return np.empty((0, self.channels), self.dtype)
+        total = (self.__consumed * self.up + self.down - 1) // self.down
+        out = self.__resample(np.zeros((self.half, self.channels), self.dtype))
+        out = out[:max(total - self.__produced, 0)]
+        self.reset()
+        return out
+    
+    def output_frames(self, frames: int) -> int:
+        """The number of output frames for the `frames` input frames."""
+        return (frames * self.up + self.down - 1) // self.down
+    
+    def input_frames(self, frames: int) -> int:
+        """The number of input frames needed for the `frames` output frames."""
+        return (frames * self.down + self.up - 1) // self.up
\ No newline at end of file
@@ -0,0 +1,217 @@
+import heapq
+import itertools
+import numpy as np
+from numpy import ndarray
+from queue import SimpleQueue, Empty
+# > Typing
+from typing_extensions import List, Optional, Tuple, Union
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+from ..base.audiosource import AudioSourceBase
+from .converter import convert_samples, get_sample_scale
+
+# ! Constants
+
+SCHEDULER_BLOCK_SIZE = 4096
+
+# ! Scheduled Event Class
+class ScheduledEvent:
+    """A clip mixed into the stream from the frame `start`. Returned by `EventScheduler.schedule`."""
+    
+    __slots__ = ('start', 'data', 'gain', 'position', 'cancelled', 'ended')
+    
+    def __init__(self, start: int, data: Union[ndarray, AudioSourceBase], gain: float) -> None:
+        self.start = start
+        self.data = data
+        self.gain = gain
+        self.position = 0
+        self.cancelled = False
+        self.ended = False
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(start={self.start}, position={self.position}, ended={self.ended})"
+    
+    # ^ Methods
+    
+    def fill(self, out: ndarray) -> int:
+        """Read the next frames of the clip into the float block `out`, return the number of frames read."""
+        if isinstance(self.data, ndarray):
+            count = min(len(out), len(self.data) - self.position)
+            np.copyto(out[:count], self.data[self.position:self.position + count])
+        else:
+            count = len(self.data.read(len(out), 'float32', True, out=out))
+        self.position += count
+        return count
+    
+    def cancel(self) -> None:
+        """Stop the event (at the next block, from any thread)."""
+        self.cancelled = True
+
+# ! Event Scheduler Class
+class EventScheduler:
+    """Mixes clips (arrays and audio sources) into the blocks of a stream at exact frames.
+    
+    The stream frames are counted by `process`, so an event scheduled at the frame `start` begins
+    at its exact offset inside the block containing it, whatever the sizes of the blocks.
+    The events are handed to the audio thread through a lock-free queue and kept there in a heap
+    ordered by the start, so scheduling and picking up an event are `O(log n)` even with
+    thousands of them pending, and a block without due events costs one comparison.
+    """
+    
+    def __init__(self, samplerate: AudioSamplerate, channels: AudioChannels, block_size: int=SCHEDULER_BLOCK_SIZE) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.late = 0
+        self.__inbox: SimpleQueue[ScheduledEvent] = SimpleQueue()
+        self.__heap: List[Tuple[int, int, ScheduledEvent]] = []
+        self.__counter = itertools.count()
+        self.__active: List[ScheduledEvent] = []
+        self.__position = 0
+        self.__anchor: Optional[Tuple[int, float]] = None
+        # * In float64: the samples of the 32-bit integer blocks do not fit into float32.
+        self.__mixed = np.zeros((block_size, channels), np.float64)
+        self.__scratch = np.zeros((block_size, channels), np.float32)
+    
+    # ^ Magic Methods
+    
+    def __len__(self) -> int:
+        return self.__inbox.qsize() + len(self.__heap) + len(self.__active)
+    
+    # ^ Propertyes
+    
+    @property
+    def position(self) -> int:
+        """The number of frames of the stream processed so far."""
+        return self.__position
+    
+    @property
+    def active(self) -> Tuple[ScheduledEvent, ...]:
+        """The events playing at the moment."""
+        return tuple(self.__active)
+    
+    # ^ Hidden Methods
+    
+    def __prepare(self, data: Union[ndarray, AudioSourceBase]) -> Union[ndarray, AudioSourceBase]:
+        if isinstance(data, ndarray):
+            if (data.ndim == 1) or (data.shape[1] == 1):
+                data = np.repeat(data.reshape(-1, 1), self.channels, axis=1)
+            elif data.shape[1] != self.channels:
+                raise ValueError(f"The array has {data.shape[1]} channels, the stream has {self.channels}")
+            return convert_samples(data, np.empty(data.shape, np.float32))
+        if (data.samplerate != self.samplerate) or (data.channels != self.channels):
+            raise ValueError(
+                f"The audio source ({data.samplerate} Hz, {data.channels} ch) does not match "
+                f"the stream ({self.samplerate} Hz, {self.channels} ch)"
+            )
+        return data
+    
+    def __grow(self, frames: int) -> None:
+        if len(self.__mixed) < frames:
+            self.__mixed = np.zeros((frames, self.channels), np.float64)
+            self.__scratch = np.zeros((frames, self.channels), np.float32)
+    
+    # ^ Methods
+    
+    def configure(self, samplerate: AudioSamplerate, channels: AudioChannels) -> None:
+        """Follow a reconfigured stream. The pending events are dropped."""
+        self.samplerate, self.channels = samplerate, channels
+        self.clear()
+        self.__mixed = np.zeros((len(self.__mixed), channels), np.float64)
+        self.__scratch = np.zeros((len(self.__scratch), channels), np.float32)
+    
+    def time_to_frame(self, time: float) -> int:
+        """The stream frame played at the `time` of the stream clock (the DAC time of the callbacks).
+        
+        Raises:
+            ValueError: The stream has not reported its time yet (the thread streamers never do).
+        """
+        if self.__anchor is None:
+            raise ValueError("The time of the stream is unknown, schedule by frames")
+        position, anchor = self.__anchor
+        return position + round((time - anchor) * self.samplerate)
+    
+    def schedule(self, start: int, data: Union[ndarray, AudioSourceBase], gain: float=1.0) -> ScheduledEvent:
+        """Mix the array (`frames x channels`, or mono) or the audio source into the stream from the frame `start`.
+        
+        Safe to call from any thread. The array is converted to float here, the source is read by the audio thread.
+        An event scheduled in the past starts at once with the missed frames skipped, so it stays in sync.
+        """
+        event = ScheduledEvent(int(start), self.__prepare(data), gain)
+        self.__inbox.put(event)
+        return event
+    
+    def schedule_time(self, time: float, data: Union[ndarray, AudioSourceBase], gain: float=1.0) -> ScheduledEvent:
+        """Like `schedule`, at the `time` of the stream clock (see `time_to_frame`)."""
+        return self.schedule(self.time_to_frame(time), data, gain)
+    
+    def schedule_in(self, delay: float, data: Union[ndarray, AudioSourceBase], gain: float=1.0) -> ScheduledEvent:
+        """Like `schedule`, `delay` seconds after the frames processed so far."""
+        return self.schedule(self.__position + round(delay * self.samplerate), data, gain)
+    
+    def clear(self) -> None:
+        """Cancel all the pending and playing events."""
+        for event in self.__active:
+            event.cancel()
+        for _, _, event in self.__heap:
+            event.cancel()
+        while True:
+            try:
+                self.__inbox.get_nowait().cancel()
+            except Empty:
+                break
+    
+    def process(self, block: ndarray, time: Optional[float]=None) -> ndarray:
+        """Mix the events due in the `frames x channels` block (of any dtype) in place and return it.
+        
+        Args:
+            time (Optional[float], optional): The stream time of the first frame of the block. Defaults to `None`.
+        """
+        frames = len(block)
+        start, end = self.__position, self.__position + frames
+        if time is not None:
+            self.__anchor = (start, time)
+        self.__position = end
+        heap = self.__heap
+        while True:
+            try:
+                event = self.__inbox.get_nowait()
+            except Empty:
+                break
+            heapq.heappush(heap, (event.start, next(self.__counter), event))
+        while (len(heap) > 0) and (heap[0][0] < end):
+            event = heapq.heappop(heap)[2]
+            if event.start < start:
+                self.late += 1
+                if isinstance(event.data, ndarray):
+                    event.position = start - event.start
+                else:
+                    event.data.seek(event.data.tell() + start - event.start)
+            self.__active.append(event)
+        if len(self.__active) == 0:
+            return block
+        self.__grow(frames)
+        mixed = self.__mixed[:frames]
+        mixed.fill(0)
+        for event in self.__active:
+            if event.cancelled:
+                event.ended = True
+                continue
+            offset = max(event.start - start, 0)
+            part = self.__scratch[:frames - offset]
+            count = event.fill(part)
+            if event.gain != 1.0:
+                np.multiply(part[:count], event.gain, out=part[:count])
+            np.add(mixed[offset:offset + count], part[:count], out=mixed[offset:offset + count])
+            event.ended = count < len(part)
+        self.__active = [event for event in self.__active if (not event.ended)]
+        data = block.reshape(frames, -1)
+        if data.dtype.kind == 'f':
+            np.add(data, mixed, out=data, casting='unsafe')
+        else:
+            info = np.iinfo(data.dtype)
+            np.multiply(mixed, get_sample_scale(data.dtype), out=mixed)
+            np.add(mixed, data, out=mixed)
+            np.rint(mixed, out=mixed)
+            np.clip(mixed, info.min, info.max, out=mixed)
+            np.copyto(data, mixed, casting='unsafe')
+        return block
@@ -0,0 +1,175 @@
+import numpy as np
+from numpy import ndarray
+from dataclasses import dataclass
+from threading import Thread, Event
+# > Typing
+from typing_extensions import Callable, Optional, Tuple
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+from .converter import convert_samples
+
+# ! Constants
+
+SPECTRUM_FFT_SIZE = 2048
+SPECTRUM_RATE = 30.0
+SPECTRUM_BANDS = 32
+SPECTRUM_MIN_FREQUENCY = 20.0
+SPECTRUM_FLOOR = -120.0
+
+# ! Functions
+
+def get_band_edges(samplerate: AudioSamplerate, fft_size: int, bands: int, min_frequency: float=SPECTRUM_MIN_FREQUENCY) -> ndarray:
+    """The FFT bins bounding the log-spaced bands from `min_frequency` to the nyquist frequency.
+    
+    The bands narrower than one bin are merged, so there may be fewer of them at the low frequencies.
+    """
+    bins = fft_size // 2 + 1
+    frequencies = np.geomspace(min_frequency, samplerate / 2, bands + 1)
+    edges = np.unique(np.clip(np.round(frequencies * fft_size / samplerate).astype(np.int64), 1, bins))
+    return edges
+
+# ! Spectrum Frame Class
+@dataclass(frozen=True)
+class SpectrumFrame:
+    """The spectrum of the `fft_size` frames played before the frame `position` of the stream.
+    
+    The `spectrum` holds the magnitudes (dB relative to a full scale sine) of the FFT bins,
+    the `bands` the mean power (dB) of the log-spaced bands of the tap.
+    """
+    position: int
+    spectrum: ndarray
+    bands: ndarray
+
+# ! History Ring Class
+class HistoryRing:
+    """A ring of the last `capacity` frames written by one thread and read by the others without locks.
+    
+    The writer announces the frames it is going to overwrite before the copy and publishes them after it,
+    so a reader detects a copy torn by the writer and drops it instead of waiting.
+    """
+    
+    def __init__(self, channels: AudioChannels, capacity: int) -> None:
+        self.channels = channels
+        self.capacity = capacity
+        self.buffer = np.zeros((capacity, channels), np.float32)
+        self.written = 0
+        self.writing = 0
+    
+    def write(self, block: ndarray) -> None:
+        """Copy the `frames x channels` block (of any dtype) into the ring (from the writer thread only)."""
+        data = block.reshape(len(block), self.channels)
+        written = self.written
+        if len(data) > self.capacity:
+            written += len(data) - self.capacity
+            data = data[-self.capacity:]
+        frames = len(data)
+        self.writing = written + frames
+        start = written % self.capacity
+        first = min(frames, self.capacity - start)
+        convert_samples(data[:first], self.buffer[start:start + first])
+        if frames > first:
+            convert_samples(data[first:], self.buffer[:frames - first])
+        self.written = written + frames
+    
+    def read(self, out: ndarray, end: Optional[int]=None) -> Optional[int]:
+        """Copy the `len(out)` frames before the frame `end` (the last written by default) into `out`.
+        
+        Returns:
+            Optional[int]: The `end`, or `None` if the frames are not in the ring (yet or anymore).
+        """
+        written = self.written
+        end = written if (end is None) else min(end, written)
+        frames = len(out)
+        start = end - frames
+        if (start < 0) or (start < written - self.capacity):
+            return None
+        offset = start % self.capacity
+        first = min(frames, self.capacity - offset)
+        np.copyto(out[:first], self.buffer[offset:offset + first])
+        np.copyto(out[first:], self.buffer[:frames - first])
+        if start < self.writing - self.capacity:
+            return None
+        return end
+
+# ! Spectrum Tap Class
+class SpectrumTap:
+    """Computes the spectrum of what a streamer plays, for the visualizers.
+    
+    The audio thread only copies the played blocks into a `HistoryRing` (see `push`). A consumer thread
+    computes the windowed FFT of the latest frames and the energies of the bands `rate` times a second,
+    publishes the `SpectrumFrame` as `latest` and passes it to the subscribers, so neither the FFT
+    nor a slow subscriber ever delays the audio. With `delay`, the frames are taken that long before the last
+    pushed ones, to follow the latency of the device.
+    """
+    
+    def __init__(
+        self,
+        samplerate: AudioSamplerate,
+        channels: AudioChannels,
+        fft_size: int=SPECTRUM_FFT_SIZE,
+        rate: float=SPECTRUM_RATE,
+        bands: int=SPECTRUM_BANDS,
+        delay: float=0.0
+    ) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.fft_size = fft_size
+        self.rate = rate
+        self.bands = bands
+        self.delay = delay
+        self.ring = HistoryRing(channels, 4 * fft_size + int(delay * samplerate))
+        self.window = np.hanning(fft_size).astype(np.float32)
+        self.frequencies = np.fft.rfftfreq(fft_size, 1 / samplerate)
+        self.edges = get_band_edges(samplerate, fft_size, bands)
+        self.latest: Optional[SpectrumFrame] = None
+        self.subscribers: Tuple[Callable[[SpectrumFrame], None], ...] = ()
+        self.__scale = 2.0 / self.window.sum()
+        self.__block = np.zeros((fft_size, channels), np.float32)
+        self.__stopped = Event()
+        self.__position = -1
+        self.thread: Optional[Thread] = None
+    
+    # ^ Methods
+    
+    def compute(self) -> Optional[SpectrumFrame]:
+        """Compute the frame of the latest pushed frames (`None` if nothing was pushed since the previous one)."""
+        end = self.ring.written - int(self.delay * self.samplerate)
+        if (end == self.__position) or (self.ring.read(self.__block, end) is None):
+            return None
+        self.__position = end
+        mono = self.__block.mean(axis=1) * self.window
+        power = np.square(np.abs(np.fft.rfft(mono)) * self.__scale)
+        spectrum = 10 * np.log10(np.maximum(power, 10 ** (SPECTRUM_FLOOR / 10)))
+        bands = np.add.reduceat(power, self.edges[:-1]) / np.diff(self.edges)
+        bands = 10 * np.log10(np.maximum(bands, 10 ** (SPECTRUM_FLOOR / 10)))
+        return SpectrumFrame(end, spectrum.astype(np.float32), bands.astype(np.float32))
+    
+    def push(self, block: ndarray) -> None:
+        """Copy the played block into the history (called by the audio thread, a plain copy without new buffers)."""
+        self.ring.write(block)
+    
+    def run(self) -> None:
+        while not self.__stopped.wait(1 / self.rate):
+            if (frame := self.compute()) is not None:
+                self.latest = frame
+                for subscriber in self.subscribers:
+                    subscriber(frame)
+    
+    def start(self) -> None:
+        if self.thread is None:
+            self.__stopped.clear()
+            self.thread = Thread(target=self.run, name='spectrum', daemon=True)
+            self.thread.start()
+    
+    def stop(self) -> None:
+        if self.thread is not None:
+            self.__stopped.set()
+            self.thread.join()
+            self.thread = None
+    
+    def subscribe(self, subscriber: Callable[[SpectrumFrame], None]) -> None:
+        """Call the `subscriber` with every new frame (in the consumer thread)."""
+        self.subscribers = self.subscribers + (subscriber,)
+    
+    def unsubscribe(self, subscriber: Callable[[SpectrumFrame], None]) -> None:
+        self.subscribers = tuple(other for other in self.subscribers if (other is not subscriber))
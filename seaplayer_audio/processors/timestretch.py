@@ -0,0 +1,149 @@
+import math
+import numpy as np
+from numpy import ndarray
+# > Typing
+from typing_extensions import List, Optional
+# > Local Imports
+from .._types import AudioSamplerate, AudioChannels
+
+# ! Constants
+
+STRETCH_FRAME_TIME = 0.03
+STRETCH_TOLERANCE_TIME = 0.01
+MIN_SPEED = 0.25
+MAX_SPEED = 4.0
+
+# ! Time Stretcher Class
+class TimeStretcher:
+    """A streaming WSOLA time-stretcher changing the tempo of `frames x channels` blocks without changing the pitch.
+    
+    Every output hop overlap-adds (Hann window, 50% overlap) the input frame near the ideal position
+    which matches best the natural continuation of the previous frame. The search is an FFT
+    cross-correlation normalized by the energy of the candidates, only the choice of the frames
+    is sequential, the windowing and the overlap-add of the chosen frames are done for the whole block.
+    The `speed` can be changed at any moment (from any thread), it takes effect from the next hop.
+    """
+    
+    def __init__(
+        self,
+        samplerate: AudioSamplerate,
+        channels: AudioChannels=2,
+        speed: float=1.0,
+        frame_time: float=STRETCH_FRAME_TIME,
+        tolerance_time: float=STRETCH_TOLERANCE_TIME
+    ) -> None:
+        self.samplerate = samplerate
+        self.channels = channels
+        self.speed = speed
+        self.hop = max(int(frame_time * samplerate) // 2, 16)
+        self.size = 2 * self.hop
+        self.tolerance = max(int(tolerance_time * samplerate), 1)
+        self.window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(self.size) / self.size)).astype(np.float32)
+        self.nfft = 1 << (2 * self.tolerance + 2 * self.hop).bit_length()
+        self.__offsets = np.arange(self.size)
+        self.reset()
+    
+    # ^ Propertyes
+    
+    @property
+    def speed(self) -> float:
+        return self.__speed
+    
+    @speed.setter
+    def speed(self, value: float) -> None:
+        if not (MIN_SPEED <= value <= MAX_SPEED):
+            raise ValueError(f"The speed must be between {MIN_SPEED} and {MAX_SPEED}, not {value}")
+        self.__speed = float(value)
+    
+    @property
+    def latency(self) -> int:
+        """The number of input frames held back until the next block (or `flush`)."""
+        return self.size + self.tolerance
+    
+    # ^ Hidden Methods
+    
+    def __append(self, data: ndarray) -> None:
+        self.__buffer = np.concatenate([self.__buffer, data])
+        self.__mono = np.concatenate([self.__mono, data.mean(axis=1, dtype=np.float32)])
+    
+    def __search(self, ideal: int) -> int:
+        start, end = max(ideal - self.tolerance, 0), ideal + self.tolerance
+        natural = self.__prev + self.hop
+        reference = self.__mono[natural:natural + self.hop]
+        segment = self.__mono[start:end + self.hop]
+        count = end - start + 1
+        spectrum = np.fft.rfft(segment, self.nfft) * np.conj(np.fft.rfft(reference, self.nfft))
+        correlation = np.fft.irfft(spectrum, self.nfft)[:count]
+        energy = np.concatenate([[0.0], np.cumsum(np.square(segment, dtype=np.float64))])
+        energy = energy[self.hop:self.hop + count] - energy[:count]
+        return start + int(np.argmax(correlation / np.sqrt(np.maximum(energy, 1e-12))))
+    
+    def __stretch(self, steps: Optional[int]=None) -> ndarray:
+        positions: List[int] = []
+        while (steps is None) or (len(positions) < steps):
+            ideal = int(round(self.__ideal))
+            if self.__prev is None:
+                need = ideal + self.size
+            else:
+                need = max(ideal + self.tolerance, self.__prev + self.hop) + self.size
+            if need > len(self.__buffer):
+                break
+            self.__prev = ideal if (self.__prev is None) else self.__search(ideal)
+            positions.append(self.__prev)
+            self.__ideal += self.hop * self.__speed
+        if len(positions) == 0:
+            return np.empty((0, self.channels), np.float32)
+        frames = self.__buffer[np.array(positions)[:, None] + self.__offsets] * self.window[None, :, None]
+        heads = frames[:, :self.hop]
+        heads[0] += self.__tail
+        heads[1:] += frames[:-1, self.hop:]
+        self.__tail = frames[-1, self.hop:].copy()
+        out = heads.reshape(-1, self.channels)
+        if self.__skip > 0:
+            skipped = min(self.__skip, len(out))
+            out, self.__skip = out[skipped:], self.__skip - skipped
+        self.__produced += len(out)
+        # * Nothing before the natural continuation and the earliest candidate is needed anymore.
+        drop = max(min(self.__prev + self.hop, int(self.__ideal) - self.tolerance), 0)
+        self.__buffer, self.__mono = self.__buffer[drop:], self.__mono[drop:]
+        self.__prev -= drop
+        self.__ideal -= drop
+        return out
+    
+    # ^ Methods
+    
+    def reset(self) -> None:
+        """Forget the input history (before a seek)."""
+        # * The half of the frame of silence before the signal, the output of it is skipped,
+        # * so the first output frames are not faded in by the window.
+        self.__buffer = np.zeros((self.hop, self.channels), np.float32)
+        self.__mono = np.zeros(self.hop, np.float32)
+        self.__tail = np.zeros((self.hop, self.channels), np.float32)
+        self.__ideal = 0.0
+        self.__prev: Optional[int] = None
+        self.__skip = self.hop
+        self.__expected = 0.0
+        self.__produced = 0
+    
+    def process(self, data: ndarray) -> ndarray:
+        """Stretch the next block of `frames x channels` (or `frames` for the mono) samples.
+        
+        Returns:
+            ndarray: The `frames x channels` float32 output frames available so far.
+        """
+        data = data.reshape(-1, self.channels).astype(np.float32, copy=False)
+        self.__expected += len(data) / self.__speed
+        self.__append(data)
+        return self.__stretch()
+    
+    def flush(self) -> ndarray:
+        """Return the rest of the output frames at the end of the stream and reset the state."""
+        missing = int(round(self.__expected)) - self.__produced
+        out = np.empty((0, self.channels), np.float32)
+        if missing > 0:
+            steps = -(-(missing + self.__skip) // self.hop)
+            padding = int(math.ceil((steps + 1) * self.hop * self.__speed)) + self.size + 2 * self.tolerance + self.hop
+            self.__append(np.zeros((padding, self.channels), np.float32))
+            out = self.__stretch(steps)[:missing]
+        self.reset()
+        return out
\ No newline at end of file
@@ -46,6 +46,13 @@ class CallbackSoundDeviceStreamer(SoundDeviceStreamerBase):
         )
     
     def __callback__(self, outdata: ndarray, frames: int, time, status: CallbackFlags):
+        self.__fill__(outdata, frames)
+        self.scheduler.process(outdata, time.outputBufferDacTime)
+        self.gain.process(outdata)
+        if (spectrum := self.spectrum) is not None:
+            spectrum.push(outdata)
+    
+    def __fill__(self, outdata: ndarray, frames: int) -> None:
         if self.buffer is not None:
             if len(self.buffer) == frames:
                 wdata = self.buffer.copy()
@@ -151,7 +158,7 @@ class CallbackSoundDeviceStreamer(SoundDeviceStreamerBase):
     
     def send(self, data: ndarray) -> bool:
         if StreamerState.LOCKED not in self.state:
-            self.queue.put(data)
+            self.queue.put(self._process_sent(data))
             return True
         return False
 
@@ -183,6 +190,13 @@ class AsyncCallbackSoundDeviceStreamer(AsyncSoundDeviceStreamerBase):
         )
     
     def __callback__(self, outdata: ndarray, frames: int, time, status: CallbackFlags):
+        self.__fill__(outdata, frames)
+        self.scheduler.process(outdata, time.outputBufferDacTime)
+        self.gain.process(outdata)
+        if (spectrum := self.spectrum) is not None:
+            spectrum.push(outdata)
+    
+    def __fill__(self, outdata: ndarray, frames: int) -> None:
         if self.buffer is not None:
             if len(self.buffer) == frames:
                 wdata = self.buffer.copy()
@@ -288,6 +302,6 @@ class AsyncCallbackSoundDeviceStreamer(AsyncSoundDeviceStreamerBase):
     
     async def send(self, data: ndarray) -> bool:
         if StreamerState.LOCKED not in self.state:
-            await self.queue.put(data)
+            await self.queue.put(self._process_sent(data))
             return True
         return False
\ No newline at end of file
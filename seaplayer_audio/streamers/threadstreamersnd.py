@@ -66,6 +66,9 @@ class ThreadSoundDeviceStreamer(SoundDeviceStreamerBase):
         while StreamerState.RUNNING in self.state:
             try:
                 data = self.queue.get_nowait()
+                data = self.gain.process(self.scheduler.process(data))
+                if (spectrum := self.spectrum) is not None:
+                    spectrum.push(data)
                 self.stream.write(data)
             except queue.Empty:
                 pass
@@ -100,7 +103,7 @@ class ThreadSoundDeviceStreamer(SoundDeviceStreamerBase):
     
     def send(self, data: np.ndarray) -> bool:
         if StreamerState.LOCKED not in self.state:
-            self.queue.put(data)
+            self.queue.put(self._process_sent(data))
             return True
         return False
 
@@ -160,6 +163,9 @@ class AsyncThreadSoundDeviceStreamer(AsyncSoundDeviceStreamerBase):
         while StreamerState.RUNNING in self.state:
             try:
                 data = self.queue.get_nowait()
+                data = self.gain.process(self.scheduler.process(data))
+                if (spectrum := self.spectrum) is not None:
+                    spectrum.push(data)
                 self.stream.write(data)
             except queue.Empty:
                 pass
@@ -194,6 +200,6 @@ class AsyncThreadSoundDeviceStreamer(AsyncSoundDeviceStreamerBase):
     
     async def send(self, data: np.ndarray) -> bool:
         if StreamerState.LOCKED not in self.state:
-            await self.queue.put(data)
+            await self.queue.put(self._process_sent(data))
             return True
         return False
\ No newline at end of file
@@ -1,5 +1,7 @@
 from .logio import Logger
 from .timing import Timer
+from .httpserver import LocalHTTPServer, ICYHTTPRequestHandler, FlakyRangeHTTPRequestHandler
+from .fakestream import RecordingOutputStream, patch_output_stream
 from .units import LOCAL_DIRPATH, SAMPLES_DIRPATH, SAMPLES_FILEPATHS
 
 logger = Logger()
\ No newline at end of file
@@ -0,0 +1,55 @@
+import numpy as np
+import sounddevice as sd
+from typing_extensions import Any, List, Optional
+import seaplayer_audio.streamers.callbackstreamersnd as callbackstreamersnd
+
+# ! Fake Stream Class
+class RecordingOutputStream:
+    """An output stream keeping the written blocks instead of playing them, so the streamers run without a device."""
+    
+    def __init__(
+        self,
+        samplerate: Optional[float]=None,
+        blocksize: Optional[int]=None,
+        device: Optional[int]=None,
+        channels: Optional[int]=None,
+        dtype: Optional[str]=None,
+        callback: Optional[Any]=None,
+        **kwargs: object
+    ) -> None:
+        self.samplerate = samplerate
+        self.blocksize = blocksize or 0
+        self.device = device
+        self.channels = channels
+        self.dtype = dtype
+        self.callback = callback
+        self.active = False
+        self.closed = False
+        self.written: List[np.ndarray] = []
+    
+    def start(self) -> None:
+        self.active = True
+    
+    def stop(self) -> None:
+        self.active = False
+    
+    def abort(self) -> None:
+        self.active = False
+    
+    def close(self) -> None:
+        self.active = False
+        self.closed = True
+    
+    def write(self, data: np.ndarray) -> bool:
+        self.written.append(np.array(data))
+        return False
+
+# ! Functions
+def check_output_settings(*args: object, **kwargs: object) -> None:
+    pass
+
+def patch_output_stream(monkeypatch) -> None:
+    """Replace the PortAudio output streams (and the device checks) by `RecordingOutputStream` for the test."""
+    monkeypatch.setattr(sd, 'OutputStream', RecordingOutputStream)
+    monkeypatch.setattr(sd, 'check_output_settings', check_output_settings)
+    monkeypatch.setattr(callbackstreamersnd, 'OutputStream', RecordingOutputStream)
\ No newline at end of file
@@ -0,0 +1,122 @@
+import os
+import re
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from typing_extensions import Optional
+
+# ! Handlers
+class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+    
+    def handle(self) -> None:
+        try:
+            super().handle()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+
+class RangeHTTPRequestHandler(QuietHTTPRequestHandler):
+    """Serves `Range: bytes=start-end` requests with `206 Partial Content`."""
+    
+    def end_headers(self) -> None:
+        self.send_header('Accept-Ranges', 'bytes')
+        super().end_headers()
+    
+    def send_head(self):
+        match = re.fullmatch(r'bytes=(\d*)-(\d*)', self.headers.get('Range', ''))
+        path = self.translate_path(self.path)
+        if (match is None) or (not os.path.isfile(path)):
+            return super().send_head()
+        size = os.path.getsize(path)
+        if match.group(1):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else size - 1
+        else:
+            start, end = size - int(match.group(2)), size - 1
+        end = min(end, size - 1)
+        if start > end:
+            self.send_error(416)
+            return None
+        file = open(path, 'rb')
+        file.seek(start)
+        self.send_response(206)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Range', f"bytes {start}-{end}/{size}")
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        self.range_left = end - start + 1
+        return file
+    
+    def copyfile(self, source, outputfile):
+        left = getattr(self, 'range_left', None)
+        if left is None:
+            return super().copyfile(source, outputfile)
+        while (left > 0) and len(data := source.read(min(left, 64 * 1024))) > 0:
+            outputfile.write(data)
+            left -= len(data)
+
+class FlakyRangeHTTPRequestHandler(RangeHTTPRequestHandler):
+    """Fails the range requests starting at the offsets in `failing` with `503 Service Unavailable`."""
+    failing = set()
+    
+    def send_head(self):
+        match = re.fullmatch(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if (match is not None) and (int(match.group(1)) in self.failing):
+            self.send_error(503)
+            return None
+        return super().send_head()
+
+class ICYHTTPRequestHandler(QuietHTTPRequestHandler):
+    """Serves a file (without the ID3v2 tag) as an endless radio stream with ICY metadata.
+    
+    The connection is dropped after `drop_after` bytes, the next one continues from the same place.
+    """
+    metaint = 8192
+    drop_after = 256 * 1024
+    position = 0
+    
+    def do_GET(self) -> None:
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return self.send_error(404)
+        with open(path, 'rb') as file:
+            data = file.read()
+        if data[:3] == b'ID3':
+            data = data[10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]):]
+        icy = self.headers.get('Icy-MetaData', '0') == '1'
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(path))
+        if icy:
+            self.send_header('icy-metaint', str(self.metaint))
+        self.end_headers()
+        sent, block = 0, 0
+        while sent < self.drop_after:
+            offset = (ICYHTTPRequestHandler.position + sent) % len(data)
+            chunk = data[offset:offset + self.metaint]
+            chunk += data[:self.metaint - len(chunk)]
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if icy:
+                meta = f"StreamTitle='Track {block}';".encode()
+                meta += bytes(-len(meta) % 16)
+                self.wfile.write(bytes([len(meta) // 16]) + meta)
+                block += 1
+        ICYHTTPRequestHandler.position += sent
+
+# ! Main Class
+class LocalHTTPServer:
+    def __init__(self, directory: str, handler: Optional[type]=None) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), partial(handler or RangeHTTPRequestHandler, directory=directory))
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def url(self, filename: str) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/{filename}"
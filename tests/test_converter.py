@@ -0,0 +1,65 @@
+import pytest
+# * Required Imports
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import (
+    FileAudioSource, ConvertedAudioSource, ResampledAudioSource, Converter,
+    StreamerBase, negotiate_source
+)
+from seaplayer_audio.processors import get_mix_matrix
+
+# ! Methods for Tests
+def main_test_converter0():
+    rng = np.random.default_rng(0)
+    data = (rng.random((48000, 6)) * 2 - 1).astype(np.float32)
+    out = np.empty((48000, 2), np.int16)
+    converter = Converter(6, 2, 'float32', 'int16', dither=True)
+    
+    with Timer() as timer:
+        result = converter.process(data, out)
+    expected = data @ get_mix_matrix(6, 2) * 32768
+    
+    logger.rule("START converter test")
+    logger.debug(f"Convert Time (5.1 float32 -> stereo int16): {timer.timing:.4f} second(s)", with_new_line=True)
+    logger.rule("END converter test")
+    
+    assert result is out
+    assert np.abs(out - expected).max() <= 2
+    assert np.array_equal(Converter(1, 2, 'int16', 'int16').process(np.array([1, -5], np.int16)), [[1, 1], [-5, -5]])
+    assert np.allclose(Converter(2, 1, 'int16', 'float32').process(np.array([[16384, 0]], np.int16)), [[0.25]])
+    return converter
+
+def main_test_negotiate_source0():
+    source = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+    data = source.read(source.samplerate, always_2d=True)
+    source.seek(0)
+    
+    mono = negotiate_source(source, StreamerBase(source.samplerate, 1, 'float32'))
+    mono_data = mono.read(source.samplerate)
+    mono.seek(0)
+    surround = ConvertedAudioSource(mono, 6).read(source.samplerate, 'int16')
+    resampled = negotiate_source(source, StreamerBase(48000, 1, 'float32'))
+    
+    logger.rule("START negotiate source test")
+    logger.debug(f"Mono: {mono}", with_new_line=True)
+    logger.debug(f"Resampled: {resampled}")
+    logger.rule("END negotiate source test")
+    
+    assert negotiate_source(source, StreamerBase(source.samplerate, source.channels)) is source
+    assert isinstance(mono, ConvertedAudioSource) and (mono.channels, mono.frames) == (1, source.frames)
+    assert np.allclose(mono_data, data.mean(axis=1), atol=1e-6)
+    assert surround.shape == (source.samplerate, 6)
+    assert np.array_equal(surround[:, 0], surround[:, 1]) and not surround[:, 2:].any()
+    assert isinstance(resampled, ConvertedAudioSource) and isinstance(resampled.source, ResampledAudioSource)
+    assert (resampled.samplerate, resampled.channels) == (48000, 1)
+    source.close()
+    return mono
+
+# ! Tests
+def test_converter0():
+    assert isinstance(main_test_converter0(), Converter)
+
+def test_negotiate_source0():
+    assert isinstance(main_test_negotiate_source0(), ConvertedAudioSource)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import pytest
+# * Required Imports
+import time
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, SliceAudioSource, CrossfadeAudioSource
+from seaplayer_audio.audiosources import get_crossfade_curves
+
+# ! Classes for Tests
+class UnknownSliceAudioSource(SliceAudioSource):
+    """A slice that does not report its length, like a stream."""
+    
+    @property
+    def frames(self) -> int:
+        return -1
+
+class ShortSliceAudioSource(SliceAudioSource):
+    """A slice that reports more frames than it has."""
+    
+    @property
+    def frames(self) -> int:
+        return self.stop - self.start + 44100
+
+# ! Methods for Tests
+def get_slices(*regions: tuple, types: tuple=()):
+    files = [FileAudioSource(SAMPLES_FILEPATHS['sample0']) for _ in regions]
+    types = types or (SliceAudioSource,) * len(regions)
+    return files, [cls(file, start, stop) for file, cls, (start, stop) in zip(files, types, regions)]
+
+def read_blocks(source, size: int=4096) -> np.ndarray:
+    blocks = []
+    while len(block := source.read(size, always_2d=True)) > 0:
+        blocks.append(block)
+    return np.concatenate(blocks)
+
+def read_regions(*regions: tuple):
+    with FileAudioSource(SAMPLES_FILEPATHS['sample0']) as file:
+        return [SliceAudioSource(file, start, stop).read(always_2d=True) for start, stop in regions]
+
+def main_test_crossfade_source0():
+    regions = [(0, 5 * 44100), (10 * 44100, 13 * 44100), (20 * 44100, 24 * 44100)]
+    files, slices = get_slices(*regions)
+    tracks = [s.read(always_2d=True) for s in slices]
+    for s in slices:
+        s.seek(0)
+    crossfade = CrossfadeAudioSource(slices, 1.0, 'equal-power')
+    overlap = 44100
+    fade_out, fade_in = get_crossfade_curves(overlap, 'equal-power')
+    expected = np.concatenate([
+        tracks[0][:-overlap],
+        tracks[0][-overlap:] * fade_out + tracks[1][:overlap] * fade_in,
+        tracks[1][overlap:-overlap],
+        tracks[1][-overlap:] * fade_out + tracks[2][:overlap] * fade_in,
+        tracks[2][overlap:]
+    ])
+    
+    first = crossfade.read(44100)
+    time.sleep(0.2)
+    preloaded = crossfade.preloaded
+    with Timer() as read_timer:
+        rest = crossfade.read(dtype='float32')
+    data = np.concatenate([first, rest])
+    crossfade.seek(5 * 44100 - overlap // 2)
+    middle = crossfade.read(overlap)
+    
+    logger.rule("START crossfade source test")
+    logger.debug(f"Frames: {crossfade.frames}, preloaded before the crossfade: {preloaded}", with_new_line=True)
+    logger.debug(f"Read Time: {read_timer.timing:.3f} second(s)")
+    logger.debug(f"Max Error: {np.abs(data - expected).max():.2e}")
+    logger.rule("END crossfade source test")
+    
+    assert crossfade.frames == len(expected) == len(data) == 12 * 44100 - 2 * overlap
+    assert preloaded >= overlap
+    assert np.allclose(data, expected, atol=1e-6)
+    assert np.allclose(middle, expected[5 * 44100 - overlap // 2:5 * 44100 + overlap // 2], atol=1e-6)
+    assert crossfade.current == 1
+    crossfade.close()
+    for file in files:
+        file.close()
+    return crossfade
+
+def main_test_crossfade_append0():
+    files, slices = get_slices((0, 44100), (44100, 3 * 44100))
+    crossfade = CrossfadeAudioSource(slices[:1], 0.25, 'linear')
+    head = crossfade.read(1000, 'int16')
+    crossfade.append(slices[1])
+    rest = crossfade.read(dtype='int16')
+    
+    logger.rule("START crossfade append test")
+    logger.debug(f"Frames: {crossfade.frames}", with_new_line=True)
+    logger.rule("END crossfade append test")
+    
+    assert head.dtype == rest.dtype == np.int16
+    assert len(head) + len(rest) == crossfade.frames == 3 * 44100 - 44100 // 4
+    crossfade.close()
+    for file in files:
+        file.close()
+    return crossfade
+
+def main_test_crossfade_blocks0():
+    regions = [(0, 2 * 44100), (5 * 44100, 8 * 44100), (10 * 44100, 12 * 44100)]
+    tracks = read_regions(*regions)
+    overlap = 22050
+    fade_out, fade_in = get_crossfade_curves(overlap, 'equal-power')
+    expected = np.concatenate([
+        tracks[0][:-overlap],
+        tracks[0][-overlap:] * fade_out + tracks[1][:overlap] * fade_in,
+        tracks[1][overlap:-overlap],
+        tracks[1][-overlap:] * fade_out + tracks[2][:overlap] * fade_in,
+        tracks[2][overlap:]
+    ])
+    results = {}
+    for duration, types in (
+        (0.5, ()),
+        (0.0, ()),
+        (0.5, (UnknownSliceAudioSource, SliceAudioSource, SliceAudioSource)),
+        (0.5, (ShortSliceAudioSource, SliceAudioSource, SliceAudioSource))
+    ):
+        files, slices = get_slices(*regions, types=types)
+        crossfade = CrossfadeAudioSource(slices, duration)
+        data = read_blocks(crossfade)
+        results[(duration, types)] = (data, crossfade.frames, crossfade.tell())
+        crossfade.close()
+        for file in files:
+            file.close()
+    
+    logger.rule("START crossfade blocks test")
+    logger.debug(f"Frames read by the blocks: {[len(data) for data, _, _ in results.values()]}", with_new_line=True)
+    logger.rule("END crossfade blocks test")
+    
+    (faded, frames, position), (joined, _, _), (unknown, unknown_frames, _), (short, _, short_position) = results.values()
+    assert len(faded) == frames == position == len(expected)
+    assert np.allclose(faded, expected, atol=1e-6)
+    assert np.array_equal(joined, np.concatenate(tracks))
+    # * The first source is joined without a fade (its length is unknown or wrong), the ones after it still crossfade.
+    joined_first = np.concatenate([tracks[0], tracks[1][:overlap], expected[len(tracks[0]):]])
+    assert unknown_frames == -1
+    assert np.allclose(unknown, joined_first, atol=1e-6)
+    assert short_position == len(short) == len(joined_first)
+    assert np.allclose(short, joined_first, atol=1e-6)
+    return crossfade
+
+# ! Tests
+def test_crossfade_source0():
+    assert isinstance(main_test_crossfade_source0(), CrossfadeAudioSource)
+
+def test_crossfade_blocks0():
+    assert isinstance(main_test_crossfade_blocks0(), CrossfadeAudioSource)
+
+def test_crossfade_append0():
+    assert isinstance(main_test_crossfade_append0(), CrossfadeAudioSource)
\ No newline at end of file
@@ -0,0 +1,91 @@
+import pytest
+# * Required Imports
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, SliceAudioSource, CueInfo, CuedAudioSource, analyze_cues, get_cues
+from seaplayer_audio.analysis import get_cues_many, load_cues
+
+# ! Methods for Tests
+class CountingAudioSource(SliceAudioSource):
+    def __init__(self, source) -> None:
+        super().__init__(source)
+        self.decoded = 0
+    
+    def _readinto(self, out: np.ndarray) -> int:
+        count = super()._readinto(out)
+        self.decoded += count
+        return count
+
+def make_track(samplerate: int) -> np.ndarray:
+    t = np.arange(60 * samplerate) / samplerate
+    tone = 0.5 * np.sin(2 * np.pi * 440 * t)
+    # * A linear fade of the last 4 seconds: the -9 dBFS tone is at -30 dBFS 0.356 seconds before its end.
+    tone[-4 * samplerate:] *= np.linspace(1.0, 0.0, 4 * samplerate)
+    noise = np.random.default_rng(0).normal(0.0, 1e-4, (1 * samplerate + 60 * samplerate + 3 * samplerate))
+    data = noise.copy()
+    data[samplerate:61 * samplerate] += tone
+    return np.stack([data, data], axis=1).astype(np.float32)
+
+def main_test_cues0():
+    samplerate = 44100
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "track.wav")
+        data = make_track(samplerate)
+        sf.write(filepath, data, samplerate)
+        with FileAudioSource(filepath) as sfile:
+            counting = CountingAudioSource(sfile)
+            with Timer() as timer:
+                info = analyze_cues(counting)
+            decoded = counting.decoded
+        filepaths = [filepath, SAMPLES_FILEPATHS['sample0'], os.path.join(dirpath, "missing.wav")]
+        results = get_cues_many(filepaths, dirpath, workers=2)
+        cached = load_cues(filepath, dirpath)
+        other = load_cues(filepath, dirpath, threshold=-40.0)
+        with FileAudioSource(filepath) as sfile:
+            cued = CuedAudioSource(sfile, cache_dirpath=dirpath)
+            head = cued.read(1000, always_2d=True)
+    
+    logger.rule("START cues test")
+    logger.debug(f"Analyze Time: {timer.timing:.4f} second(s), decoded: {decoded} of {len(data)} frame(s)", with_new_line=True)
+    logger.debug(f"Cues: {info}")
+    logger.debug(f"Sample: {results[filepaths[1]]}")
+    logger.rule("END cues test")
+    
+    window = samplerate // 100
+    assert abs(info.cue_in - samplerate) <= window
+    assert 61 * samplerate - 2 * samplerate // 10 <= info.cue_out <= 61 * samplerate + window
+    assert abs(info.segue - (61 * samplerate - int(0.356 * samplerate))) <= window
+    assert decoded < len(data) // 4
+    assert results[filepath] == info == cached and other is None and isinstance(results[filepaths[2]], Exception)
+    assert cued.frames == info.cue_out - info.cue_in and cued.segue == info.segue - info.cue_in
+    assert np.allclose(head, data[info.cue_in:info.cue_in + 1000], atol=1e-4)
+    return info
+
+def main_test_cues_silence0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "silence.wav")
+        sf.write(filepath, np.zeros((44100 * 3, 1), np.float32), 44100)
+        info = get_cues(filepath, dirpath)
+        with FileAudioSource(filepath) as sfile:
+            cued = CuedAudioSource(sfile, analyze=False, cache_dirpath=dirpath)
+            frames = cued.frames
+    
+    logger.rule("START cues silence test")
+    logger.debug(f"Cues: {info}", with_new_line=True)
+    logger.rule("END cues silence test")
+    
+    assert info.cue_in == info.cue_out == info.segue == 0 and info.duration == 0.0
+    assert frames == 0
+    return info
+
+# ! Tests
+def test_cues0():
+    assert isinstance(main_test_cues0(), CueInfo)
+
+def test_cues_silence0():
+    assert isinstance(main_test_cues_silence0(), CueInfo)
@@ -0,0 +1,144 @@
+import pytest
+# * Required Imports
+import time
+import numpy as np
+from threading import Thread
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import ThreadSoundDeviceStreamer, StreamerState
+from seaplayer_audio.processors import BiquadEQ, EffectChain, EQBand
+
+# ! Constants
+BANDS = [
+    EQBand('lowshelf', 100, 6.0), EQBand('peaking', 1000, -4.0, 1.4),
+    EQBand('highshelf', 8000, 3.0), EQBand('highpass', 30)
+]
+GRAPHIC_BANDS = [EQBand('peaking', frequency, 3.0, 1.0) for frequency in (31, 62, 125, 250, 500, 1000, 2000, 4000, 8000, 16000)]
+
+# ! Methods for Tests
+def direct_biquad_cascade(eq: BiquadEQ, data: np.ndarray) -> np.ndarray:
+    for b0, b1, b2, a1, a2 in eq.prepare(eq.params).coefficients:
+        out = np.zeros_like(data)
+        x1 = x2 = y1 = y2 = np.zeros(data.shape[1])
+        for n in range(len(data)):
+            out[n] = b0 * data[n] + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x1, x2, y1, y2 = data[n], x1, out[n], y1
+        data = out
+    return data
+
+def main_test_biquad_eq0():
+    rng = np.random.default_rng(0)
+    data = rng.random((5000, 2)) * 2 - 1
+    eq = BiquadEQ(44100, 2, BANDS)
+    expected = direct_biquad_cascade(eq, data)
+    
+    blocks, position = data.copy(), 0
+    while position < len(blocks):
+        size = int(rng.integers(1, 700))
+        eq.process(blocks[position:position + size])
+        position += size
+    
+    logger.rule("START biquad eq test")
+    logger.debug(f"Max Error: {np.abs(blocks - expected).max():.2e}", with_new_line=True)
+    logger.debug(f"Response at 100/1000/8000 Hz: {eq.get_response([100, 1000, 8000]).round(2)} dB")
+    logger.rule("END biquad eq test")
+    
+    assert np.allclose(blocks, expected, atol=1e-8)
+    return eq
+
+def main_test_biquad_eq_single_frames0():
+    rng = np.random.default_rng(1)
+    data = rng.random((4000, 2)) * 2 - 1
+    eq = BiquadEQ(44100, 2, [EQBand('highpass', 40)])
+    expected = direct_biquad_cascade(eq, data)
+    
+    blocks, position = data.copy(), 0
+    for size in (1024, 1, 1024, 1, 1, 1, 2, 1, 1024, 1, 1, 919):
+        eq.process(blocks[position:position + size])
+        position += size
+    
+    logger.rule("START biquad eq single frames test")
+    logger.debug(f"Max Error: {np.abs(blocks - expected).max():.2e}", with_new_line=True)
+    logger.rule("END biquad eq single frames test")
+    
+    assert position == len(data)
+    assert np.allclose(blocks, expected, atol=1e-8)
+    return eq
+
+def main_test_streamer_send_copy0():
+    streamer = ThreadSoundDeviceStreamer(44100, 2, 'float32')
+    streamer.state &= ~StreamerState.LOCKED
+    streamer.effects.add(BiquadEQ(44100, 2, BANDS))
+    source = np.random.default_rng(2).random((512, 2)).astype(np.float32) - 0.5
+    data = np.frombuffer(source.tobytes(), np.float32).reshape(512, 2)
+    
+    writable = source.copy()
+    assert streamer.send(writable)
+    queued_writable = streamer.queue.get_nowait()
+    assert streamer.send(data)
+    queued = streamer.queue.get_nowait()
+    streamer.effects.enabled = False
+    assert streamer.send(writable)
+    passed = streamer.queue.get_nowait()
+    
+    logger.rule("START streamer send copy test")
+    logger.debug(f"Max change by the effects: {np.abs(queued - source).max():.2e}", with_new_line=True)
+    logger.rule("END streamer send copy test")
+    
+    assert (not data.flags.writeable) and np.array_equal(data, source)
+    assert queued.flags.writeable and (not np.shares_memory(queued, data))
+    assert not np.allclose(queued, source)
+    assert (not np.shares_memory(queued_writable, writable)) and np.array_equal(writable, source)
+    # * Without effects, a writable block is queued as it is (no copy).
+    assert passed is writable
+    return streamer
+
+def main_test_effect_chain_speed0():
+    rng = np.random.default_rng(0)
+    block = (rng.random((1024, 2)) * 0.1).astype(np.float32)
+    eq = BiquadEQ(44100, 2, GRAPHIC_BANDS)
+    chain = EffectChain(44100, 2, [eq])
+    running = True
+    
+    def tweak() -> None:
+        gain = 0.0
+        while running:
+            gain = (gain + 0.5) % 6.0
+            eq.set_band(5, EQBand('peaking', 1000, gain, 1.0))
+            time.sleep(0.001)
+    
+    tweaker = Thread(target=tweak)
+    tweaker.start()
+    try:
+        with Timer() as timer:
+            for _ in range(count := 500):
+                chain.process(block.copy())
+    finally:
+        running = False
+        tweaker.join()
+    int_block = (block * 32767).astype(np.int16)
+    chain.process(int_block)
+    
+    logger.rule("START effect chain speed test")
+    logger.debug(f"10-band EQ, 1024 x 2 float32 blocks: {count / timer.timing:.0f} blocks/second", with_new_line=True)
+    logger.debug(f"Real-time factor: {timer.timing / (count * 1024 / 44100):.4f}")
+    logger.rule("END effect chain speed test")
+    
+    assert count * 1024 / 44100 > timer.timing
+    assert int_block.dtype == np.int16
+    return chain
+
+# ! Tests
+def test_biquad_eq0():
+    assert isinstance(main_test_biquad_eq0(), BiquadEQ)
+
+def test_biquad_eq_single_frames0():
+    assert isinstance(main_test_biquad_eq_single_frames0(), BiquadEQ)
+
+def test_streamer_send_copy0(monkeypatch):
+    patch_output_stream(monkeypatch)
+    assert isinstance(main_test_streamer_send_copy0(), ThreadSoundDeviceStreamer)
+
+def test_effect_chain_speed0():
+    assert isinstance(main_test_effect_chain_speed0(), EffectChain)
\ No newline at end of file
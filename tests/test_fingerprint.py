@@ -0,0 +1,104 @@
+import pytest
+# * Required Imports
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, Fingerprint, FingerprintIndex, get_fingerprint
+from seaplayer_audio.analysis import extract_fingerprint, get_fingerprints_many
+
+# ! Classes for Tests
+class ChainIndex(FingerprintIndex):
+    """Reports the matches of a chain of recordings, from its end."""
+    
+    MATCHES = {"d": [("e", 1.0)], "c": [("d", 1.0)], "b": [("c", 1.0)], "a": [("b", 1.0)], "e": [], "x": []}
+    
+    def query(self, fingerprint, threshold=0.0, exclude=None):
+        return self.MATCHES[exclude]
+
+# ! Methods for Tests
+def main_test_fingerprint0():
+    with FileAudioSource(SAMPLES_FILEPATHS['sample0']) as sfile:
+        samplerate = sfile.samplerate
+        data = sfile.read(40 * samplerate, always_2d=True)
+        sfile.seek(0)
+        with Timer() as extract_timer:
+            fingerprint = extract_fingerprint(sfile, 40.0)
+    restored = Fingerprint.from_bytes(fingerprint.to_bytes())
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "shifted.ogg")
+        sf.write(filepath, 0.5 * data[samplerate:], samplerate)
+        shifted = get_fingerprint(filepath, dirpath)
+        cached = get_fingerprint(filepath, dirpath)
+    
+    logger.rule("START fingerprint test")
+    logger.debug(f"Extract Time: {extract_timer.timing:.3f} second(s), hashes: {len(fingerprint.hashes)}", with_new_line=True)
+    logger.debug(f"Similarity with the shifted copy: {fingerprint.similarity(shifted):.3f}")
+    logger.rule("END fingerprint test")
+    
+    assert np.array_equal(restored.hashes, fingerprint.hashes) and restored.duration == fingerprint.duration
+    assert np.array_equal(cached.hashes, shifted.hashes)
+    assert fingerprint.similarity(shifted, 200) > 0.9
+    return fingerprint
+
+def main_test_fingerprint_index0():
+    with FileAudioSource(SAMPLES_FILEPATHS['sample0']) as sfile:
+        samplerate = sfile.samplerate
+        data = sfile.read(120 * samplerate, always_2d=True)
+    with tempfile.TemporaryDirectory() as dirpath:
+        segments = {
+            "first.wav": data[:40 * samplerate],
+            "first.ogg": data[int(1.3 * samplerate):40 * samplerate],
+            "second.wav": data[60 * samplerate:100 * samplerate],
+            "second.ogg": 0.7 * data[62 * samplerate:95 * samplerate],
+        }
+        filepaths = []
+        for filename, segment in segments.items():
+            filepaths.append(os.path.join(dirpath, filename))
+            sf.write(filepaths[-1], segment, samplerate)
+        filepaths.append(os.path.join(dirpath, "missing.wav"))
+        with Timer() as batch_timer:
+            results = get_fingerprints_many(filepaths, dirpath, workers=2)
+    index = FingerprintIndex()
+    fingerprints = {os.path.basename(key): value for key, value in results.items() if isinstance(value, Fingerprint)}
+    for key, value in fingerprints.items():
+        index.add(key, value)
+    with Timer() as query_timer:
+        duplicates = index.find_duplicates(fingerprints)
+    matches = index.query(fingerprints["first.wav"], exclude="first.wav")
+    
+    logger.rule("START fingerprint index test")
+    logger.debug(f"Batch Time: {batch_timer.timing:.3f} second(s), duplicates: {query_timer.timing:.4f} second(s)", with_new_line=True)
+    logger.debug(f"Matches of the first segment: {matches}")
+    logger.debug(f"Duplicates: {duplicates}")
+    logger.rule("END fingerprint index test")
+    
+    assert isinstance(results[filepaths[-1]], Exception) and len(index) == 4
+    assert [key for key, _ in matches] == ["first.ogg"]
+    assert sorted(sorted(group) for group in duplicates) == [["first.ogg", "first.wav"], ["second.ogg", "second.wav"]]
+    return index
+
+def main_test_fingerprint_duplicates_chain0():
+    index = ChainIndex()
+    empty = Fingerprint(np.empty(0, np.uint32), 0.0)
+    duplicates = index.find_duplicates({key: empty for key in "dcbaex"})
+    
+    logger.rule("START fingerprint duplicates chain test")
+    logger.debug(f"Duplicates: {duplicates}", with_new_line=True)
+    logger.rule("END fingerprint duplicates chain test")
+    
+    assert [sorted(group) for group in duplicates] == [["a", "b", "c", "d", "e"]]
+    return index
+
+# ! Tests
+def test_fingerprint0():
+    assert isinstance(main_test_fingerprint0(), Fingerprint)
+
+def test_fingerprint_index0():
+    assert isinstance(main_test_fingerprint_index0(), FingerprintIndex)
+
+def test_fingerprint_duplicates_chain0():
+    assert isinstance(main_test_fingerprint_duplicates_chain0(), FingerprintIndex)
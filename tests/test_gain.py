@@ -0,0 +1,113 @@
+import pytest
+# * Required Imports
+import time
+import tracemalloc
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import ThreadSoundDeviceStreamer
+from seaplayer_audio.processors import GainRamp, db_to_gain
+
+# ! Methods for Tests
+def main_test_gain_ramp0():
+    gain = GainRamp(44100)
+    gain.set_volume(0.25, 0.01)
+    ramp = np.ones((2000, 2), np.float32)
+    for position in range(0, 1000, 250):
+        gain.process(ramp[position:position + 250])
+    # * A new ramp in the middle of the current one starts from the gain already reached.
+    gain.set_volume(1.0, 0.05)
+    gain.process(ramp[1000:1100])
+    gain.set_volume(db_to_gain(-12.0), 0.02, 'db')
+    gain.process(ramp[1100:])
+    steps = np.abs(np.diff(ramp[:, 0]))
+    
+    logger.rule("START gain ramp test")
+    logger.debug(f"Max step between the samples: {steps.max():.2e}", with_new_line=True)
+    logger.debug(f"Gain: {gain.gain:.4f} (target: {gain.volume:.4f})")
+    logger.rule("END gain ramp test")
+    
+    assert np.all(ramp[:, 0] == ramp[:, 1])
+    assert np.isclose(ramp[440, 0], 0.25) and np.all(ramp[441:1000, 0] == 0.25)
+    assert steps.max() < 0.75 / 441 + 1e-6
+    assert np.isclose(ramp[-1, 0], db_to_gain(-12.0)) and (not gain.ramping)
+    return gain
+
+def main_test_gain_ramp_int16_0():
+    gain = GainRamp(44100)
+    gain.set_volume(2.0, 0.01)
+    ramped = np.full((882, 2), 20000, np.int16)
+    ramped[:, 1] = -20000
+    gain.process(ramped)
+    steady = np.array([[20000, -20000], [10000, -10000], [100, -100]], np.int16)
+    gain.process(steady)
+    
+    logger.rule("START gain ramp int16 test")
+    logger.debug(f"Ramped end: {ramped[-1].tolist()}, steady: {steady.tolist()}", with_new_line=True)
+    logger.rule("END gain ramp int16 test")
+    
+    assert ramped.dtype == np.int16 and steady.dtype == np.int16
+    assert np.all(ramped[:, 0] >= 20000) and np.all(ramped[:, 1] <= -20000)
+    assert np.all(np.diff(ramped[:, 0].astype(np.int32)) >= 0)
+    assert ramped[-1].tolist() == [32767, -32768]
+    assert steady.tolist() == [[32767, -32768], [20000, -20000], [200, -200]]
+    return gain
+
+def main_test_gain_ramp_streamer0():
+    streamer = ThreadSoundDeviceStreamer(44100, 2, 'float32')
+    streamer.gain.set_volume(0.5, 0.0)
+    streamer.scheduler.schedule(0, np.ones(4, np.float32), 0.25)
+    data = np.frombuffer(np.full((256, 2), 0.5, np.float32).tobytes(), np.float32).reshape(256, 2)
+    streamer.start()
+    try:
+        assert streamer.send(data)
+        timeout = time.monotonic() + 5.0
+        while (len(streamer.stream.written) == 0) and (time.monotonic() < timeout):
+            time.sleep(0.01)
+        alive = streamer.thread.is_alive()
+    finally:
+        streamer.stop()
+    written = streamer.stream.written[0]
+    
+    logger.rule("START gain ramp streamer test")
+    logger.debug(f"Written: {written[:5, 0].tolist()}", with_new_line=True)
+    logger.rule("END gain ramp streamer test")
+    
+    assert alive and (not data.flags.writeable) and np.all(data == 0.5)
+    assert np.allclose(written[:4], 0.375) and np.allclose(written[4:], 0.25)
+    return streamer
+
+def main_test_gain_ramp_allocations0():
+    gain = GainRamp(44100)
+    block = np.ones((512, 2), np.float32)
+    gain.set_volume(0.5, 1.0)
+    gain.process(block)
+    tracemalloc.start()
+    try:
+        for _ in range(20):
+            gain.process(block)
+        allocated = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    
+    logger.rule("START gain ramp allocations test")
+    logger.debug(f"Peak memory allocated while ramping: {allocated} bytes", with_new_line=True)
+    logger.rule("END gain ramp allocations test")
+    
+    assert allocated < 1024
+    return gain
+
+# ! Tests
+def test_gain_ramp0():
+    assert isinstance(main_test_gain_ramp0(), GainRamp)
+
+def test_gain_ramp_int16_0():
+    assert isinstance(main_test_gain_ramp_int16_0(), GainRamp)
+
+def test_gain_ramp_streamer0(monkeypatch):
+    patch_output_stream(monkeypatch)
+    assert isinstance(main_test_gain_ramp_streamer0(), ThreadSoundDeviceStreamer)
+
+def test_gain_ramp_allocations0():
+    assert isinstance(main_test_gain_ramp_allocations0(), GainRamp)
\ No newline at end of file
@@ -0,0 +1,262 @@
+import pytest
+# * Required Imports
+import os
+import random
+import datetime
+import shutil
+import tempfile
+import numpy as np
+import soundfile as sf
+from dataclasses import replace
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, TrackInfo, LibraryScanner, LibraryIndex, TrackCatalog, ProbeInfo, CoverStore, scan_library, probe, probe_many
+from seaplayer_audio.library.covers import get_image_size
+from seaplayer_audio.library.catalog import TrigramIndex
+
+# ! Methods for Tests
+def main_test_library_scan0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        os.makedirs(os.path.join(dirpath, "album", "disc"))
+        shutil.copy(SAMPLES_FILEPATHS['sample0'], os.path.join(dirpath, "album", "sample0.mp3"))
+        for index in range(6):
+            with sf.SoundFile(os.path.join(dirpath, "album", "disc", f"tone{index}.wav"), 'w', 22050, 1) as file:
+                file.title = f"Tone {index}"
+                file.write(np.zeros(22050 * (index + 1), np.float32))
+        with open(os.path.join(dirpath, "broken.flac"), 'wb') as file:
+            file.write(b'not a flac file')
+        with open(os.path.join(dirpath, "notes.txt"), 'w') as file:
+            file.write("not audio")
+        
+        with Timer() as scan_timer:
+            results = scan_library([dirpath], workers=2)
+        scanner = LibraryScanner({path: track for path, track in results.items() if isinstance(track, TrackInfo)}, 2, 2)
+        with Timer() as rescan_timer:
+            rescanned = dict(scanner.scan(dirpath))
+        skipped = scanner.skipped
+        with sf.SoundFile(os.path.join(dirpath, "album", "disc", "tone0.wav"), 'w', 22050, 2) as file:
+            file.write(np.zeros((44100, 2), np.float32))
+        os.remove(os.path.join(dirpath, "album", "disc", "tone1.wav"))
+        changed = dict(scanner.scan(dirpath))
+        with FileAudioSource(SAMPLES_FILEPATHS['sample0']) as sfile:
+            metadata = sfile.metadata
+    
+    track = results[os.path.join(dirpath, "album", "sample0.mp3")]
+    logger.rule("START library scan test")
+    logger.debug(f"Scan Time: {scan_timer.timing:.3f} second(s), rescan: {rescan_timer.timing:.3f} second(s)", with_new_line=True)
+    logger.debug(f"Track: {track}")
+    logger.debug(f"Changed: {list(changed)}, removed: {scanner.removed}")
+    logger.rule("END library scan test")
+    
+    assert len(results) == 8 and isinstance(results[os.path.join(dirpath, "broken.flac")], Exception)
+    assert track.frames == 5345728 and track.samplerate == 44100 and track.channels == 2
+    assert track.metadata.title == metadata.title and track.metadata.icon is None
+    assert (track.cover_hash is None) == (metadata.icon is None)
+    assert results[os.path.join(dirpath, "album", "disc", "tone2.wav")].metadata.title == "Tone 2"
+    assert list(rescanned) == [os.path.join(dirpath, "broken.flac")] and skipped == 7
+    assert sorted(changed) == [os.path.join(dirpath, "album", "disc", "tone0.wav"), os.path.join(dirpath, "broken.flac")]
+    assert scanner.tracks[os.path.join(dirpath, "album", "disc", "tone0.wav")].channels == 2
+    assert scanner.removed == [os.path.join(dirpath, "album", "disc", "tone1.wav")] and len(scanner.tracks) == 6
+    return track
+
+def main_test_library_index0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        os.makedirs(os.path.join(dirpath, "music"))
+        filepath = os.path.join(dirpath, "music", "sample0.mp3")
+        shutil.copy(SAMPLES_FILEPATHS['sample0'], filepath)
+        extra = os.path.join(dirpath, "extra.wav")
+        sf.write(extra, np.zeros((4410, 2), np.float32), 44100)
+        with LibraryIndex(os.path.join(dirpath, "index", "library.db")) as index:
+            scanned = dict(index.scan(os.path.join(dirpath, "music"), workers=1))
+            mode = index.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        with Timer() as plain_timer:
+            plain = FileAudioSource(filepath)
+        with LibraryIndex(os.path.join(dirpath, "index", "library.db")) as index:
+            with Timer() as indexed_timer:
+                indexed = FileAudioSource(filepath, index=index)
+            with FileAudioSource(extra, index=index) as sfile:
+                added = index.lookup(extra)
+            stored = index.get_many([filepath, extra, os.path.join(dirpath, "missing.wav")])
+            count = len(index)
+        with open(filepath, 'ab') as file:
+            file.write(b'\0' * 16)
+        with LibraryIndex(os.path.join(dirpath, "index", "library.db")) as index:
+            stale = index.lookup(filepath)
+            reopened = FileAudioSource(filepath, index=index)
+            refreshed = index.lookup(filepath)
+        for source in (plain, indexed, reopened):
+            source.close()
+    
+    logger.rule("START library index test")
+    logger.debug(f"Open Time: {plain_timer.timing:.4f} second(s), with the index: {indexed_timer.timing:.4f} second(s)", with_new_line=True)
+    logger.debug(f"Stored: {list(stored)}")
+    logger.rule("END library index test")
+    
+    assert mode == 'wal' and count == 2 and len(stored) == 2
+    assert indexed.minfo is None and indexed.track == scanned[filepath]
+    assert indexed.metadata == replace(plain.metadata, icon=None)
+    assert indexed.bitrate == plain.bitrate and indexed.gapless == plain.gapless and indexed.frames == plain.frames
+    assert added is not None and added.frames == 4410
+    assert stale is None and reopened.minfo is not None and refreshed.size == scanned[filepath].size + 16
+    return indexed.track
+
+def main_test_library_catalog0():
+    rng = random.Random(0)
+    syllables = ['ka', 'lo', 'mi', 'ra', 'ne', 'so', 'tu', 'vi', 'ze', 'qua', 'ber', 'lin', 'dor', 'ou']
+    def name(words: int) -> str:
+        return ' '.join(''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize() for _ in range(words))
+    count = 100000
+    artists, albums = [name(2) for _ in range(2000)], [name(3) for _ in range(8000)]
+    titles = [name(rng.randint(1, 3)) for _ in range(count)]
+    artist = [rng.choice(artists) for _ in range(count)]
+    album = [rng.choice(albums) for _ in range(count)]
+    genre = [rng.choice(['Rock', 'Jazz', None]) for _ in range(count)]
+    date = [rng.choice([None, 1990 + rng.randint(0, 30)]) for _ in range(count)]
+    duration = [rng.uniform(60.0, 600.0) for _ in range(count)]
+    tracknumber = [f"{rng.randint(1, 12)}/12" for _ in range(count)]
+    catalog = TrackCatalog([f"/music/{index}.mp3" for index in range(count)], titles, artist, album, genre, date, duration, tracknumber)
+    # * The first queries build the orders and the trigrams of the fields.
+    catalog.search("build mi")
+    catalog.sort(by=('artist', 'album', 'tracknumber'))
+    
+    with Timer() as filter_timer:
+        filtered = catalog.filter(artist=artist[0].upper(), date=(2000, 2010), duration=(120.0, None))
+    with Timer() as search_timer:
+        found = catalog.search("kalo mi")
+    with Timer() as sort_timer:
+        ordered = catalog.sort(catalog.filter(genre='jazz'), ('artist', 'album', 'tracknumber'))
+    prefix = catalog.prefix('album', albums[0][:4].lower())
+    
+    logger.rule("START library catalog test")
+    logger.debug(f"Filter Time: {filter_timer.timing * 1000:.3f} ms, search: {search_timer.timing * 1000:.3f} ms, sort: {sort_timer.timing * 1000:.3f} ms", with_new_line=True)
+    logger.debug(f"Filtered: {len(filtered)}, found: {len(found)}, ordered: {len(ordered)}, prefix: {len(prefix)}")
+    logger.debug(f"First: {catalog.get(int(ordered[0]))}")
+    logger.rule("END library catalog test")
+    
+    def matches(index: int, word: str) -> bool:
+        return any(word in value.casefold() if (len(word) >= 3) else value.casefold().startswith(word) for value in (titles[index], artist[index], album[index]))
+    assert list(filtered) == [
+        index for index in range(count)
+        if (artist[index] == artist[0]) and (date[index] is not None) and (2000 <= date[index] < 2010) and (duration[index] >= 120.0)
+    ]
+    assert list(found) == [index for index in range(count) if matches(index, "kalo") and matches(index, "mi")]
+    expected = sorted((index for index in range(count) if (genre[index] == 'Jazz')), key=lambda index: (artist[index].casefold(), album[index].casefold(), catalog.tracknumber[index]))
+    assert [(artist[index], album[index], catalog.tracknumber[index]) for index in ordered] == [(artist[index], album[index], catalog.tracknumber[index]) for index in expected]
+    assert list(prefix) == [index for index in range(count) if album[index].casefold().startswith(albums[0][:4].lower())]
+    assert catalog.get(0)['date'] == (None if (date[0] is None) else datetime.date(date[0], 1, 1))
+    trigrams = TrigramIndex(['xaaax', 'aaaa', 'xababx', 'ababab'])
+    assert list(trigrams.find('aaaa')) == [1] and list(trigrams.find('aaa')) == [0, 1]
+    assert list(trigrams.find('ababa')) == [3]
+    return catalog
+
+def main_test_library_catalog_index0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        shutil.copy(SAMPLES_FILEPATHS['sample0'], os.path.join(dirpath, "sample0.mp3"))
+        with sf.SoundFile(os.path.join(dirpath, "tone.wav"), 'w', 22050, 1) as file:
+            file.title, file.artist = "Tone", "Generator"
+            file.write(np.zeros(22050, np.float32))
+        with LibraryIndex(os.path.join(dirpath, "library.db")) as index:
+            list(index.scan(dirpath, workers=1))
+            catalog = TrackCatalog.from_index(index)
+            tracks = list(index)
+    
+    logger.rule("START library catalog index test")
+    logger.debug(f"Tracks: {[catalog.get(id) for id in range(len(catalog))]}", with_new_line=True)
+    logger.rule("END library catalog index test")
+    
+    assert len(catalog) == 2 and len(TrackCatalog.from_tracks(tracks)) == 2
+    assert [catalog.filepaths[id] for id in catalog.search("gene")] == [os.path.join(dirpath, "tone.wav")]
+    assert [catalog.filepaths[id] for id in catalog.filter(date=(2024, 2025))] == [os.path.join(dirpath, "sample0.mp3")]
+    return catalog
+
+def main_test_library_probe0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepaths = []
+        for index in range(8):
+            filepaths.append(os.path.join(dirpath, f"copy{index}.mp3"))
+            shutil.copy(SAMPLES_FILEPATHS['sample0'], filepaths[-1])
+        filepaths.append(os.path.join(dirpath, "missing.wav"))
+        with Timer() as source_timer:
+            for filepath in filepaths[:-1]:
+                with FileAudioSource(filepath) as sfile:
+                    frames = sfile.frames
+        with Timer() as probe_timer:
+            for filepath in filepaths[:-1]:
+                info = probe(filepath)
+        with Timer() as many_timer:
+            results = probe_many(filepaths, 4)
+        first = probe(filepaths[0])
+    
+    logger.rule("START library probe test")
+    logger.debug(f"Sources Time: {source_timer.timing:.4f} second(s), probes: {probe_timer.timing:.4f} second(s), in threads: {many_timer.timing:.4f} second(s)", with_new_line=True)
+    logger.debug(f"Probe: {info}")
+    logger.rule("END library probe test")
+    
+    assert info.frames == frames == 5345728 and info.samplerate == 44100 and info.channels == 2
+    assert info.format == 'MP3' and abs(info.duration - frames / 44100) < 1e-9 and not hasattr(info, '__dict__')
+    assert results[filepaths[0]] == first and isinstance(results[filepaths[-1]], Exception)
+    assert probe_timer.timing < source_timer.timing
+    return info
+
+def main_test_library_covers0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepaths = []
+        for index in range(4):
+            filepaths.append(os.path.join(dirpath, "album", f"track{index}.mp3"))
+            os.makedirs(os.path.dirname(filepaths[-1]), exist_ok=True)
+            shutil.copy(SAMPLES_FILEPATHS['sample0'], filepaths[-1])
+        covers = CoverStore(os.path.join(dirpath, "covers"), (32, 128))
+        with FileAudioSource(filepaths[0]) as sfile:
+            plain = sfile.metadata
+        with Timer() as store_timer:
+            sources = [FileAudioSource(filepath, covers=covers) for filepath in filepaths]
+        handles = {source.metadata.cover for source in sources}
+        handle = sources[0].metadata.cover
+        stored = sorted(os.listdir(os.path.join(dirpath, "covers", handle[:2])))
+        image = covers.get(handle)
+        thumbnail = covers.thumbnail(handle, 128)
+        extra = covers.thumbnail(handle, 48)
+        cached = covers.get(handle) is image
+        small = CoverStore(os.path.join(dirpath, "covers"), (32, 128), memory=get_image_size(thumbnail) + 1)
+        small.get(handle)
+        small.thumbnail(handle, 128)
+        evicted = len(small)
+        
+        scanned = CoverStore(os.path.join(dirpath, "scanned"), (64,))
+        tracks = scan_library([os.path.join(dirpath, "album")], workers=1, covers=scanned)
+        scanned_thumbnail = scanned.thumbnail(handle, 64)
+        for source in sources:
+            source.close()
+    
+    logger.rule("START library covers test")
+    logger.debug(f"Store Time: {store_timer.timing:.4f} second(s), files: {stored}", with_new_line=True)
+    logger.debug(f"Cover: {image.size}, thumbnails: {thumbnail.size}, {extra.size}, {scanned_thumbnail.size}")
+    logger.rule("END library covers test")
+    
+    assert handles == {plain.cover} and plain.icon is not None and all(source.metadata.icon is None for source in sources)
+    assert stored == [handle, f"{handle}.128.png", f"{handle}.32.png"]
+    assert image.size == plain.icon.size and cached
+    assert max(thumbnail.size) == 128 and max(extra.size) == 48 and max(scanned_thumbnail.size) == 64
+    assert evicted == 1 and all(track.cover_hash == handle for track in tracks.values())
+    return covers
+
+# ! Tests
+def test_library_scan0():
+    assert isinstance(main_test_library_scan0(), TrackInfo)
+
+
+def test_library_index0():
+    assert isinstance(main_test_library_index0(), TrackInfo)
+
+def test_library_catalog0():
+    assert isinstance(main_test_library_catalog0(), TrackCatalog)
+
+def test_library_catalog_index0():
+    assert isinstance(main_test_library_catalog_index0(), TrackCatalog)
+
+def test_library_probe0():
+    assert isinstance(main_test_library_probe0(), ProbeInfo)
+
+def test_library_covers0():
+    assert isinstance(main_test_library_covers0(), CoverStore)
\ No newline at end of file
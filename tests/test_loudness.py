@@ -0,0 +1,76 @@
+import pytest
+# * Required Imports
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, LoudnessInfo, NormalizedAudioSource, get_loudness
+from seaplayer_audio.analysis import LoudnessMeter, get_loudness_many, load_loudness
+
+# ! Methods for Tests
+def measure(data: np.ndarray, samplerate: int) -> LoudnessInfo:
+    meter = LoudnessMeter(samplerate, data.shape[1])
+    for start in range(0, len(data), 10000):
+        meter.process(data[start:start + 10000])
+    return meter.get_info()
+
+def main_test_loudness_meter0():
+    results = []
+    for samplerate in (44100, 48000):
+        t = np.arange(20 * samplerate) / samplerate
+        tone = (0.1 * np.sin(2 * np.pi * 997 * t)).astype(np.float32)
+        stereo = np.stack([tone, tone], axis=1)
+        gated = np.concatenate([stereo, np.zeros_like(stereo)])
+        results.append((measure(stereo, samplerate), measure(gated, samplerate)))
+    # * A quarter of the samplerate shifted by 45 degrees: the samples miss the peaks by 3 dB.
+    t = np.arange(48000) / 48000
+    info = measure(np.sin(2 * np.pi * 12000 * t + np.pi / 4).astype(np.float32)[:, None], 48000)
+    
+    logger.rule("START loudness meter test")
+    for tone, gated in results:
+        logger.debug(f"Tone: {tone.integrated:.3f} LUFS, with the silence: {gated.integrated:.3f} LUFS")
+    logger.debug(f"Sample peak: {info.sample_peak:.3f}, true peak: {info.true_peak:.3f}")
+    logger.rule("END loudness meter test")
+    
+    for tone, gated in results:
+        assert abs(tone.integrated + 20.0) < 0.05 and abs(gated.integrated + 20.0) < 0.05
+    assert abs(info.sample_peak - 0.7071) < 1e-3 and info.true_peak > 0.95
+    assert abs(results[0][0].get_gain_db(-23.0) + 3.0) < 0.05
+    return info
+
+def main_test_loudness_batch0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "quiet.wav")
+        t = np.arange(5 * 44100) / 44100
+        sf.write(filepath, (0.05 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), 44100, subtype='FLOAT')
+        filepaths = [SAMPLES_FILEPATHS['sample0'], filepath, os.path.join(dirpath, "missing.wav")]
+        with Timer() as batch_timer:
+            results = get_loudness_many(filepaths, dirpath, workers=2)
+        with Timer() as cache_timer:
+            cached = get_loudness(filepath, dirpath)
+        with FileAudioSource(filepath) as sfile:
+            normalized = NormalizedAudioSource(sfile, -18.0, cache_dirpath=dirpath)
+            data = normalized.read(always_2d=True)
+        stored = load_loudness(SAMPLES_FILEPATHS['sample0'], dirpath)
+    
+    logger.rule("START loudness batch test")
+    logger.debug(f"Batch Time: {batch_timer.timing:.3f} second(s), from the cache: {cache_timer.timing:.4f} second(s)", with_new_line=True)
+    for key, value in results.items():
+        logger.debug(f"{os.path.basename(key)}: {value}")
+    logger.debug(f"Normalized gain: {normalized.gain:.3f}")
+    logger.rule("END loudness batch test")
+    
+    assert isinstance(results[filepaths[2]], Exception)
+    assert cached == results[filepath] and stored == results[filepaths[0]]
+    assert abs(measure(data, 44100).integrated - min(-18.0, results[filepath].integrated - results[filepath].true_peak_db)) < 0.05
+    return cached
+
+# ! Tests
+def test_loudness_meter0():
+    assert isinstance(main_test_loudness_meter0(), LoudnessInfo)
+
+def test_loudness_batch0():
+    assert isinstance(main_test_loudness_batch0(), LoudnessInfo)
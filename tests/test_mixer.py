@@ -0,0 +1,88 @@
+import pytest
+# * Required Imports
+import tracemalloc
+import numpy as np
+from threading import Thread
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, Mixer
+
+# ! Methods for Tests
+def main_test_mixer_streams0():
+    rng = np.random.default_rng(0)
+    mixer = Mixer(44100, 2, block_size=256)
+    music = (rng.random((1000, 2)) - 0.5).astype(np.float32)
+    voice = (rng.random(1000) - 0.5).astype(np.float32)
+    music_input = mixer.add_stream(2, gain=0.5)
+    voice_input = mixer.add_stream(1, pan=-0.5)
+    music_input.send(music)
+    voice_input.send(voice)
+    music_input.close()
+    voice_input.close()
+    
+    blocks = [mixer.mix().copy() for _ in range(4)]
+    voice_input.pan = 1.0
+    music_input.gain = 1.0
+    tail = mixer.mix().copy()
+    mixed = np.concatenate(blocks)
+    expected = music[:1000] * 0.5 + voice[:1000, None] * np.array([1.0, 0.5], np.float32)
+    
+    logger.rule("START mixer streams test")
+    logger.debug(f"Max Error: {np.abs(mixed[:1000] - expected).max():.2e}", with_new_line=True)
+    logger.debug(f"Ended inputs: {len(mixer.prune())}")
+    logger.rule("END mixer streams test")
+    
+    assert np.allclose(mixed[:1000], expected, atol=1e-6)
+    assert np.all(mixed[1000:] == 0) and np.all(tail == 0)
+    assert len(mixer) == 0
+    return mixer
+
+def main_test_mixer_voices0():
+    mixer = Mixer(44100, 2, 'int16')
+    sources = [FileAudioSource(SAMPLES_FILEPATHS['sample0']) for _ in range(32)]
+    for index, source in enumerate(sources):
+        mixer.add(source, gain=1 / 32, pan=(index % 5 - 2) / 2)
+    running = True
+    
+    def change() -> None:
+        while running:
+            stream = mixer.add_stream()
+            stream.gain = 0.5
+            mixer.remove(stream)
+    
+    changer = Thread(target=change)
+    changer.start()
+    try:
+        with Timer() as timer:
+            for _ in range(count := 50):
+                block = mixer.mix()
+    finally:
+        running = False
+        changer.join()
+    tracemalloc.start()
+    try:
+        for _ in range(20):
+            mixer.mix()
+        allocated = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    
+    logger.rule("START mixer voices test")
+    logger.debug(f"32 voices: {count / timer.timing:.0f} blocks/second (real-time factor {timer.timing / (count * 1024 / 44100):.4f})", with_new_line=True)
+    logger.debug(f"Peak memory allocated while mixing: {allocated} bytes")
+    logger.rule("END mixer voices test")
+    
+    assert block.dtype == np.int16 and block.shape == (1024, 2)
+    assert count * 1024 / 44100 > timer.timing
+    assert allocated < 16384
+    for source in sources:
+        source.close()
+    return mixer
+
+# ! Tests
+def test_mixer_streams0():
+    assert isinstance(main_test_mixer_streams0(), Mixer)
+
+def test_mixer_voices0():
+    assert isinstance(main_test_mixer_voices0(), Mixer)
\ No newline at end of file
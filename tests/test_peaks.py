@@ -0,0 +1,66 @@
+import pytest
+# * Required Imports
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import WaveformPeaks, extract_peaks, get_peaks
+from seaplayer_audio.analysis import get_peaks_many, get_cache_filepath
+
+# ! Methods for Tests
+def main_test_peaks_pyramid0():
+    rng = np.random.default_rng(0)
+    data = (rng.random((256 * 1000 + 100, 2)) - 0.5).astype(np.float32) * np.linspace(0, 1.8, 256 * 1000 + 100, dtype=np.float32)[:, None]
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "noise.wav")
+        sf.write(filepath, data, 44100, subtype='FLOAT')
+        with Timer() as build_timer:
+            peaks = get_peaks(filepath, dirpath)
+        with Timer() as cache_timer:
+            cached = get_peaks(filepath, dirpath)
+        cache_size = os.path.getsize(get_cache_filepath(filepath, 'peaks', '.256.peaks', dirpath))
+    aligned = data[:256 * 1000].reshape(250, 1024, 2)
+    view = peaks.get(250, 0, 256 * 1000)
+    
+    logger.rule("START peaks pyramid test")
+    logger.debug(f"Peaks: {peaks}, cache {cache_size} bytes", with_new_line=True)
+    logger.debug(f"Build Time: {build_timer.timing:.3f} second(s), from the cache: {cache_timer.timing:.3f} second(s)")
+    logger.rule("END peaks pyramid test")
+    
+    assert [len(level) for level in peaks.levels[:3]] == [1001, 501, 251] and len(peaks.levels[-1]) == 1
+    assert peaks.get_level(1024) == 2
+    assert np.abs(view[:, :, 0] - aligned.min(axis=1)).max() < 1e-4
+    assert np.abs(view[:, :, 1] - aligned.max(axis=1)).max() < 1e-4
+    assert np.abs(view[:, :, 2] - np.sqrt(np.square(aligned).mean(axis=1))).max() < 1e-4
+    assert all(np.array_equal(a, b) for a, b in zip(peaks.levels, cached.levels)) and (cached.frames == len(data))
+    assert cache_size < data.nbytes // 50
+    return peaks
+
+def main_test_peaks_many0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepaths = [SAMPLES_FILEPATHS['sample0'], os.path.join(dirpath, "missing.wav")]
+        with Timer() as many_timer:
+            results = get_peaks_many(filepaths, dirpath)
+    peaks = results[SAMPLES_FILEPATHS['sample0']]
+    with Timer() as view_timer:
+        for start in range(0, peaks.frames - 44100 * 10, 44100):
+            view = peaks.get(1000, start, start + 44100 * 10)
+    
+    logger.rule("START peaks many test")
+    logger.debug(f"Build Time: {many_timer.timing:.3f} second(s), results: {results}", with_new_line=True)
+    logger.debug(f"{peaks.frames // 44100 - 10} views of 1000 pixels: {view_timer.timing:.3f} second(s)")
+    logger.rule("END peaks many test")
+    
+    assert isinstance(results[filepaths[1]], Exception)
+    assert view.shape == (1000, 2, 3) and np.all(view[:, :, 0] <= view[:, :, 1])
+    return peaks
+
+# ! Tests
+def test_peaks_pyramid0():
+    assert isinstance(main_test_peaks_pyramid0(), WaveformPeaks)
+
+def test_peaks_many0():
+    assert isinstance(main_test_peaks_many0(), WaveformPeaks)
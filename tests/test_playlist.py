@@ -0,0 +1,76 @@
+import pytest
+# * Required Imports
+import os
+import time
+import tempfile
+import numpy as np
+import soundfile as sf
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import PlaylistAudioSource, FileAudioSource
+
+# ! Methods for Tests
+def main_test_playlist_gapless0():
+    t = np.arange(6 * 44100) / 44100
+    data = (np.stack([np.sin(2 * np.pi * 440 * t), np.sin(2 * np.pi * 550 * t)], axis=1) * 0.5).astype(np.float32)
+    bounds = [0, 2 * 44100 + 123, 4 * 44100 - 77, len(data)]
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepaths = []
+        for index, (start, stop) in enumerate(zip(bounds, bounds[1:])):
+            filepaths.append(os.path.join(dirpath, f"track{index}.flac"))
+            sf.write(filepaths[-1], data[start:stop], 44100, subtype='PCM_24')
+        filepaths.insert(2, os.path.join(dirpath, "missing.flac"))
+        playlist = PlaylistAudioSource(filepaths, preload=2.0)
+        head = playlist.read(44100)
+        time.sleep(0.2)
+        preloaded = playlist.preloaded
+        parts, tracks = [head], [playlist.current]
+        with Timer() as read_timer:
+            while len(part := playlist.read(1000)) > 0:
+                parts.append(part)
+                tracks.append(playlist.current)
+        played = np.concatenate(parts)
+        playlist.close()
+    
+    logger.rule("START playlist gapless test")
+    logger.debug(f"Preloaded frames of the next track: {preloaded}", with_new_line=True)
+    logger.debug(f"Read Time: {read_timer.timing:.3f} second(s)")
+    logger.debug(f"Max Error: {np.abs(played - data).max():.2e}, errors: {playlist.errors}")
+    logger.rule("END playlist gapless test")
+    
+    assert preloaded >= 44100
+    assert len(played) == len(data)
+    assert np.abs(played - data).max() < 1e-6
+    assert sorted(set(tracks)) == [0, 1, 3] and [index for index, _ in playlist.errors] == [2]
+    return playlist
+
+def main_test_playlist_formats0():
+    t = np.arange(44100) / 48000
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "mono48k.wav")
+        sf.write(filepath, (np.sin(2 * np.pi * 440 * t) * 0.5).astype(np.float32), 48000)
+        source = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+        playlist = PlaylistAudioSource([filepath, source])
+        first = playlist.read(playlist.frames, 'int16')
+        switched = playlist.skip()
+        second = playlist.readline(1, 'int16')
+        playlist.close()
+        source.close()
+    
+    logger.rule("START playlist formats test")
+    logger.debug(f"Gapless trim of the MP3 left by the decoder: {source.gapless}", with_new_line=True)
+    logger.debug(f"Object: {playlist}")
+    logger.rule("END playlist formats test")
+    
+    assert (playlist.samplerate, playlist.channels) == (48000, 1)
+    assert len(first) == 44100 and first.dtype == np.int16
+    assert switched and (len(second) == 48000) and (playlist.current == 1)
+    return playlist
+
+# ! Tests
+def test_playlist_gapless0():
+    assert isinstance(main_test_playlist_gapless0(), PlaylistAudioSource)
+
+def test_playlist_formats0():
+    assert isinstance(main_test_playlist_formats0(), PlaylistAudioSource)
@@ -0,0 +1,83 @@
+import pytest
+# * Required Imports
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, ResampledAudioSource, Resampler
+from seaplayer_audio.processors import RESAMPLER_QUALITIES
+
+# ! Methods for Tests
+def main_test_resampler_blocks0():
+    rng = np.random.default_rng(0)
+    t = np.arange(2 * 44100) / 44100
+    data = np.stack([np.sin(2 * np.pi * 1000 * t), 0.5 * np.sin(2 * np.pi * 3000 * t)], axis=1).astype(np.float32)
+    
+    resampler = Resampler(44100, 48000, 2, 'high')
+    whole = np.concatenate([resampler.process(data), resampler.flush()])
+    parts, position = [], 0
+    while position < len(data):
+        size = int(rng.integers(1, 5000))
+        parts.append(resampler.process(data[position:position + size]))
+        position += size
+    blocks = np.concatenate(parts + [resampler.flush()])
+    
+    t = np.arange(len(whole)) / 48000
+    reference = np.stack([np.sin(2 * np.pi * 1000 * t), 0.5 * np.sin(2 * np.pi * 3000 * t)], axis=1)
+    error = np.abs(whole - reference)[resampler.taps:-resampler.taps].max()
+    
+    logger.rule("START resampler blocks test")
+    logger.debug(f"Max Error: {error:.2e}", with_new_line=True)
+    logger.rule("END resampler blocks test")
+    
+    assert len(whole) == resampler.output_frames(len(data)) == 96000
+    assert np.allclose(whole, blocks, atol=1e-5)
+    assert error < 1e-3
+    return resampler
+
+def main_test_resampler_speed0():
+    data = (np.random.default_rng(0).random((44100 * 10, 2)) - 0.5).astype(np.float32)
+    logger.rule("START resampler speed test")
+    for quality in RESAMPLER_QUALITIES:
+        resampler = Resampler(44100, 48000, 2, quality)
+        with Timer() as timer:
+            for position in range(0, len(data), 4096):
+                resampler.process(data[position:position + 4096])
+        logger.debug(f"Quality {quality!r} ({resampler.taps} taps): real-time factor {timer.timing / 10:.4f} per core")
+        assert timer.timing < 10
+    logger.rule("END resampler speed test")
+    return resampler
+
+def main_test_resampled_source0():
+    source = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+    resampled = ResampledAudioSource(source, 48000)
+    
+    with Timer() as s1_read_timer:
+        s1data = resampled.readline(1)
+    with Timer() as read_timer:
+        other = resampled.read()
+    resampled.seek(resampled.frames // 2)
+    middle = resampled.read(48000, 'int16')
+    
+    logger.rule("START resampled source test")
+    logger.debug(f"1S Read Time: {s1_read_timer.timing:.3f} second(s)", with_new_line=True)
+    logger.debug(f"Read Time: {read_timer.timing:.3f} second(s)")
+    logger.debug(f"Object: {resampled}")
+    logger.rule("END resampled source test")
+    
+    assert resampled.samplerate == len(s1data) == 48000
+    assert len(s1data) + len(other) == resampled.frames
+    assert abs(resampled.duration - source.duration) < 1 / 44100
+    assert middle.dtype == np.int16 and len(middle) == 48000
+    source.close()
+    return resampled
+
+# ! Tests
+def test_resampler_blocks0():
+    assert isinstance(main_test_resampler_blocks0(), Resampler)
+
+def test_resampler_speed0():
+    assert isinstance(main_test_resampler_speed0(), Resampler)
+
+def test_resampled_source0():
+    assert isinstance(main_test_resampled_source0(), ResampledAudioSource)
\ No newline at end of file
@@ -0,0 +1,68 @@
+import pytest
+# * Required Imports
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, SliceAudioSource, EventScheduler
+
+# ! Methods for Tests
+def main_test_scheduler_offsets0():
+    rng = np.random.default_rng(0)
+    scheduler = EventScheduler(44100, 2)
+    click = np.array([1.0, -0.5, 0.25], np.float32)
+    starts = rng.choice(60 * 44100, 5000, replace=False)
+    with Timer() as schedule_timer:
+        for start in starts:
+            scheduler.schedule(int(start), click, 0.5)
+    blocks = []
+    with Timer() as process_timer:
+        while scheduler.position < 60 * 44100 + 10:
+            blocks.append(scheduler.process(np.zeros((int(rng.integers(64, 1500)), 2), np.float32)))
+    played = np.concatenate(blocks)[:, 0]
+    expected = np.zeros(len(played), np.float32)
+    for start in starts:
+        expected[start:start + 3] += click * 0.5
+    
+    logger.rule("START scheduler offsets test")
+    logger.debug(f"Scheduled 5000 events in {schedule_timer.timing:.3f} second(s)", with_new_line=True)
+    logger.debug(f"Mixed {len(blocks)} blocks in {process_timer.timing:.3f} second(s)")
+    logger.rule("END scheduler offsets test")
+    
+    assert np.allclose(played, expected, atol=1e-6)
+    assert (len(scheduler) == 0) and (scheduler.late == 0)
+    return scheduler
+
+def main_test_scheduler_sources0():
+    file = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+    clip = SliceAudioSource(file, 44100, 2 * 44100)
+    expected = clip.read(dtype='int16', always_2d=True)
+    clip.seek(0)
+    scheduler = EventScheduler(44100, 2)
+    scheduler.process(np.zeros((512, 2), np.int16), time=10.0)
+    event = scheduler.schedule_time(10.1, clip)
+    cancelled = scheduler.schedule(1000, np.ones(100, np.float32))
+    cancelled.cancel()
+    late = scheduler.schedule(400, np.arange(1000, dtype=np.float32) / 1000)
+    blocks = [scheduler.process(np.zeros((512, 2), np.int16), time=10.0 + (index + 1) * 512 / 44100) for index in range(200)]
+    played = np.concatenate([np.zeros((512, 2), np.int16)] + blocks)
+    start = scheduler.time_to_frame(10.1)
+    
+    logger.rule("START scheduler sources test")
+    logger.debug(f"Event: {event}, late events: {scheduler.late}", with_new_line=True)
+    logger.rule("END scheduler sources test")
+    
+    assert start == 4410
+    assert np.abs(played[start:start + 44100].astype(np.int32) - expected).max() <= 1
+    assert np.all(played[start + 44100:] == 0)
+    assert (scheduler.late == 1) and (played[512, 0] == round(112 / 1000 * 32768)) and np.all(played[:512] == 0) and (played[1000, 0] == round(600 / 1000 * 32768))
+    assert event.ended and late.ended and (len(scheduler) == 0)
+    file.close()
+    return scheduler
+
+# ! Tests
+def test_scheduler_offsets0():
+    assert isinstance(main_test_scheduler_offsets0(), EventScheduler)
+
+def test_scheduler_sources0():
+    assert isinstance(main_test_scheduler_sources0(), EventScheduler)
@@ -0,0 +1,77 @@
+import pytest
+# * Required Imports
+import time
+import tracemalloc
+import numpy as np
+from threading import Event
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import CallbackSoundDeviceStreamer, SpectrumTap, SpectrumFrame
+from seaplayer_audio.processors import HistoryRing
+
+# ! Methods for Tests
+def main_test_spectrum_tap0():
+    tap = SpectrumTap(44100, 2, 2048, bands=16)
+    t = np.arange(44100) / 44100
+    tone = np.stack([np.sin(2 * np.pi * 1000 * t), 0.5 * np.sin(2 * np.pi * 1000 * t)], axis=1).astype(np.float32)
+    block = tone[:512].copy()
+    tracemalloc.start()
+    try:
+        for _ in range(20):
+            tap.push(block)
+        allocated = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    for start in range(0, 44100, 512):
+        tap.push(tone[start:start + 512])
+    frame = tap.compute()
+    
+    logger.rule("START spectrum tap test")
+    logger.debug(f"Peak memory allocated by the pushes: {allocated} bytes", with_new_line=True)
+    logger.debug(f"Peak: {tap.frequencies[np.argmax(frame.spectrum)]:.1f} Hz, {frame.spectrum.max():.2f} dB, bands: {frame.bands.round(1)}")
+    logger.rule("END spectrum tap test")
+    
+    assert allocated < 1024
+    assert frame.position == 44100 + 20 * 512 and tap.compute() is None
+    assert abs(tap.frequencies[np.argmax(frame.spectrum)] - 1000) < 44100 / 2048
+    assert abs(frame.spectrum.max() - 20 * np.log10(0.75)) < 1.5
+    assert np.argmax(frame.bands) == np.searchsorted(tap.edges, 1000 * 2048 / 44100, 'right') - 1
+    return tap
+
+def main_test_spectrum_streamer0():
+    streamer = CallbackSoundDeviceStreamer(44100, 2, 'int16')
+    received = Event()
+    frames = []
+    tap = streamer.enable_spectrum(1024, rate=100.0)
+    tap.subscribe(lambda frame: (frames.append(frame), received.set()))
+    ring = HistoryRing(2, 8)
+    ring.write(np.arange(12, dtype=np.float32).reshape(6, 2))
+    out = np.empty((4, 2), np.float32)
+    stale = ring.read(out, 1)
+    ring.read(out)
+    
+    class Time:
+        outputBufferDacTime = 0.0
+    
+    streamer.queue.put((np.random.default_rng(0).random((2048, 2)) * 10000).astype(np.int16))
+    streamer.__callback__(np.zeros((2048, 2), np.int16), 2048, Time(), None)
+    got = received.wait(2.0)
+    streamer.disable_spectrum()
+    
+    logger.rule("START spectrum streamer test")
+    logger.debug(f"Frames received: {len(frames)}, latest: {tap.latest.position if tap.latest else None}", with_new_line=True)
+    logger.rule("END spectrum streamer test")
+    
+    assert got and (frames[0].position == 2048) and (tap.latest is frames[-1])
+    assert (stale is None) and np.array_equal(out, np.arange(4, 12, dtype=np.float32).reshape(4, 2))
+    assert (streamer.spectrum is None) and (tap.thread is None)
+    return tap
+
+# ! Tests
+def test_spectrum_tap0():
+    assert isinstance(main_test_spectrum_tap0(), SpectrumTap)
+
+def test_spectrum_streamer0(monkeypatch):
+    patch_output_stream(monkeypatch)
+    assert isinstance(main_test_spectrum_streamer0(), SpectrumTap)
@@ -1,10 +1,18 @@
 import pytest
 # * Required Imports
+import os
 import asyncio
+import tempfile
+import tracemalloc
+import numpy as np
+import soundfile as sf
 # * Local Imports (for tests)
 from .libs import *
 # * Main Imports (tested)
-from seaplayer_audio import FileAudioSource, AsyncFileAudioSource
+from seaplayer_audio import (
+    FileAudioSource, AsyncFileAudioSource, ThreadSoundDeviceStreamer, ConvertedAudioSource,
+    negotiate_source
+)
 
 # ! Methods for Tests
 async def main_test_async_speed0():
@@ -47,9 +55,71 @@ def main_test_sync_speed0():
     
     return sfile
 
+def read_blocks(source, dtype: str):
+    nbytes = 0
+    tracemalloc.start()
+    try:
+        with Timer() as timer:
+            while len(block := source.read(4096, dtype, True)) > 0:
+                nbytes = max(nbytes, block.nbytes)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return timer.timing, peak, nbytes
+
+def main_test_native_speed0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "pcm16.flac")
+        with FileAudioSource(SAMPLES_FILEPATHS['sample0']) as sfile:
+            sf.write(filepath, sfile.readline(30, 'int16'), 44100, subtype='PCM_16')
+        streamer = ThreadSoundDeviceStreamer(44100, 2)
+        with FileAudioSource(filepath) as sfile:
+            float_time, float_peak, float_bytes = read_blocks(sfile, 'float32')
+            sfile.seek(0)
+            source = negotiate_source(sfile, streamer, native=True)
+            native_time, native_peak, native_bytes = read_blocks(source, streamer.dtype)
+    
+    logger.rule("START native speed test")
+    logger.debug(f"Negotiated dtype: {streamer.dtype}, source: {source}", with_new_line=True)
+    logger.debug(f"Read Time (float32): {float_time:.3f} second(s), block {float_bytes} bytes, peak {float_peak} bytes")
+    logger.debug(f"Read Time (native): {native_time:.3f} second(s), block {native_bytes} bytes, peak {native_peak} bytes")
+    logger.rule("END native speed test")
+    
+    assert (streamer.dtype == 'int16') and (source is sfile)
+    assert native_bytes * 2 == float_bytes
+    assert native_peak < float_peak
+    return streamer
+
+def main_test_native_dither0():
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = os.path.join(dirpath, "pcm24.wav")
+        sf.write(filepath, np.zeros((1000, 2), np.int32), 44100, subtype='PCM_24')
+        streamer = ThreadSoundDeviceStreamer(44100, 2)
+        streamer.supports_dtype = lambda dtype: dtype == 'int16'
+        with FileAudioSource(filepath) as sfile:
+            source = negotiate_source(sfile, streamer, native=True)
+            data = source.read(dtype=streamer.dtype)
+    
+    logger.rule("START native dither test")
+    logger.debug(f"Negotiated dtype: {streamer.dtype}, source: {source}", with_new_line=True)
+    logger.rule("END native dither test")
+    
+    assert streamer.dtype == 'int16'
+    assert isinstance(source, ConvertedAudioSource) and source.dither
+    assert data.dtype == np.int16 and len(data) == 1000
+    return streamer
+
 # ! Tests
 def test_async_speed0():
     assert isinstance(asyncio.run(main_test_async_speed0()), AsyncFileAudioSource)
 
 def test_sync_speed0():
-    assert isinstance(main_test_sync_speed0(), FileAudioSource)
\ No newline at end of file
+    assert isinstance(main_test_sync_speed0(), FileAudioSource)
+
+def test_native_speed0(monkeypatch):
+    patch_output_stream(monkeypatch)
+    assert isinstance(main_test_native_speed0(), ThreadSoundDeviceStreamer)
+
+def test_native_dither0(monkeypatch):
+    patch_output_stream(monkeypatch)
+    assert isinstance(main_test_native_dither0(), ThreadSoundDeviceStreamer)
\ No newline at end of file
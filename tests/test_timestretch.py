@@ -0,0 +1,84 @@
+import pytest
+# * Required Imports
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, TimeStretchedAudioSource, TimeStretcher
+
+# ! Methods for Tests
+def get_dominant_frequency(data: np.ndarray, samplerate: int) -> float:
+    spectrum = np.abs(np.fft.rfft(data * np.hanning(len(data))))
+    return np.argmax(spectrum) * samplerate / len(data)
+
+def main_test_time_stretcher0():
+    rng = np.random.default_rng(0)
+    t = np.arange(3 * 48000) / 48000
+    data = np.stack([np.sin(2 * np.pi * 440 * t), 0.5 * np.sin(2 * np.pi * 660 * t)], axis=1).astype(np.float32)
+    
+    logger.rule("START time stretcher test")
+    for speed in (0.5, 1.0, 1.5, 2.0):
+        stretcher = TimeStretcher(48000, 2, speed)
+        whole = np.concatenate([stretcher.process(data), stretcher.flush()])
+        parts, position = [], 0
+        while position < len(data):
+            size = int(rng.integers(1, 5000))
+            parts.append(stretcher.process(data[position:position + size]))
+            position += size
+        blocks = np.concatenate(parts + [stretcher.flush()])
+        frequencies = get_dominant_frequency(whole[:48000, 0], 48000), get_dominant_frequency(whole[:48000, 1], 48000)
+        logger.debug(f"Speed {speed}: {len(whole)} frames, frequencies {frequencies} Hz")
+        
+        assert len(whole) == len(blocks) == round(len(data) / speed)
+        assert np.allclose(whole, blocks, atol=1e-6)
+        assert abs(frequencies[0] - 440) <= 1 and abs(frequencies[1] - 660) <= 1
+        if speed == 1.0:
+            assert np.allclose(whole, data, atol=1e-6)
+    logger.rule("END time stretcher test")
+    return stretcher
+
+def main_test_time_stretcher_speed0():
+    data = (np.random.default_rng(0).random((48000 * 10, 2)) - 0.5).astype(np.float32)
+    logger.rule("START time stretcher speed test")
+    for speed in (0.5, 0.8, 1.25, 2.0):
+        stretcher = TimeStretcher(48000, 2, speed)
+        with Timer() as timer:
+            for position in range(0, len(data), 4096):
+                stretcher.process(data[position:position + 4096])
+        logger.debug(f"Speed {speed}: real-time factor {timer.timing / (10 / speed):.4f} per core (stereo 48 kHz)")
+        assert timer.timing < 10 / speed
+    logger.rule("END time stretcher speed test")
+    return stretcher
+
+def main_test_time_stretched_source0():
+    source = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+    stretched = TimeStretchedAudioSource(source, 0.5)
+    
+    s1data = stretched.readline(1)
+    stretched.speed = 2.0
+    position = stretched.tell()
+    s2data = stretched.readline(1)
+    stretched.seek(stretched.frames // 2)
+    middle = stretched.read(source.samplerate, 'int16')
+    
+    logger.rule("START time stretched source test")
+    logger.debug(f"Frames: {stretched.frames} (source: {source.frames})", with_new_line=True)
+    logger.debug(f"Object: {stretched}")
+    logger.rule("END time stretched source test")
+    
+    assert len(s1data) == len(s2data) == source.samplerate
+    assert position == round(source.samplerate * 0.5 / 2.0)
+    assert abs(stretched.frames - source.frames / 2.0) <= 1
+    assert middle.dtype == np.int16 and len(middle) == source.samplerate
+    source.close()
+    return stretched
+
+# ! Tests
+def test_time_stretcher0():
+    assert isinstance(main_test_time_stretcher0(), TimeStretcher)
+
+def test_time_stretcher_speed0():
+    assert isinstance(main_test_time_stretcher_speed0(), TimeStretcher)
+
+def test_time_stretched_source0():
+    assert isinstance(main_test_time_stretched_source0(), TimeStretchedAudioSource)
\ No newline at end of file
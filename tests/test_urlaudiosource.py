@@ -0,0 +1,179 @@
+import pytest
+# * Required Imports
+import asyncio
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, URLAudioSource, AsyncURLAudioSource
+from seaplayer_audio.audiosources import URLIO, AsyncURLIO
+
+# ! Methods for Tests
+async def main_test_async_url_read0():
+    with LocalHTTPServer(SAMPLES_DIRPATH) as server:
+        loop = asyncio.get_running_loop()
+        with Timer() as init_timer:
+            sfile = await AsyncURLAudioSource(server.url('sample0.mp3'), loop=loop).open()
+        
+        with Timer() as s1_read_timer:
+            s1data = await sfile.readline(1)
+        
+        with Timer() as read_timer:
+            other = await sfile.read(always_2d=True)
+        
+        logger.rule("START url read test (async)")
+        logger.debug(f"Open Time (async): {init_timer.timing:.3f} second(s)", with_new_line=True)
+        logger.debug(f"Read Time (async): {read_timer.timing:.3f} second(s)")
+        logger.debug(f"1S Read Time (async): {s1_read_timer.timing:.3f} second(s)")
+        logger.debug(f"Frames Count: {len(s1data)+len(other)} frames")
+        logger.debug(f"Downloaded: {sfile.urlio.downloaded} byte(s)")
+        logger.debug(f"Object: {sfile}")
+        logger.rule("END url read test (async)")
+        
+        assert len(s1data) == sfile.samplerate
+        assert len(s1data) + len(other) == sfile.frames
+        await sfile.close()
+        return sfile
+
+async def main_test_async_url_loop_read0():
+    with LocalHTTPServer(SAMPLES_DIRPATH) as server:
+        loop = asyncio.get_running_loop()
+        urlio = AsyncURLIO(server.url('sample0.mp3'), 'mem', loop=loop)
+        head = await urlio.head(4096)
+        try:
+            urlio.read()
+        except RuntimeError as e:
+            error = e
+        else:
+            error = None
+        assert urlio.tell() == 0
+        data = await loop.run_in_executor(None, urlio.read)
+        
+        logger.rule("START url loop read test (async)")
+        logger.debug(f"Error on the loop thread: {error}", with_new_line=True)
+        logger.debug(f"Read from the executor: {len(data)} byte(s)")
+        logger.rule("END url loop read test (async)")
+        
+        assert isinstance(error, RuntimeError)
+        assert data[:4096] == head and urlio.full and (len(data) == urlio.length)
+        urlio.close()
+        return urlio
+
+def main_test_sync_url_metadata0():
+    with LocalHTTPServer(SAMPLES_DIRPATH) as server:
+        with Timer() as init_timer:
+            sfile = URLAudioSource(server.url('sample0.mp3'))
+        lfile = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+        
+        logger.rule("START url metadata test (sync)")
+        logger.debug(f"Init Time (sync): {init_timer.timing:.3f} second(s)", with_new_line=True)
+        logger.debug(f"Downloaded: {sfile.urlio.downloaded} of {sfile.urlio.length} byte(s)")
+        logger.debug(f"Object: {sfile}")
+        logger.rule("END url metadata test (sync)")
+        
+        assert sfile.metadata == lfile.metadata
+        assert sfile.bitrate == lfile.bitrate
+        assert sfile.urlio.downloaded < sfile.urlio.length
+        sfile.close()
+        return sfile
+
+def main_test_sync_url_live0():
+    with LocalHTTPServer(SAMPLES_DIRPATH, ICYHTTPRequestHandler) as server:
+        titles = []
+        with Timer() as init_timer:
+            sfile = URLAudioSource(server.url('sample0.mp3'), live=True)
+        sfile.urlio.add_listener(lambda metadata: titles.append(metadata.title))
+        
+        with Timer() as read_timer:
+            frames = sum(len(sfile.readline(1)) for _ in range(20))
+        
+        logger.rule("START url live test (sync)")
+        logger.debug(f"Init Time (sync): {init_timer.timing:.3f} second(s)", with_new_line=True)
+        logger.debug(f"Read Time (sync): {read_timer.timing:.3f} second(s)")
+        logger.debug(f"Downloaded: {sfile.urlio.downloaded} byte(s), Buffer: {sfile.urlio.buffer_size} byte(s)")
+        logger.debug(f"Reconnects: {sfile.urlio.reconnects}, Last Title: {sfile.urlio.metadata.title!r}")
+        logger.rule("END url live test (sync)")
+        
+        assert frames == 20 * sfile.samplerate
+        assert not sfile.seekable()
+        assert (sfile.frames == -1) and (sfile.duration == float('inf'))
+        with pytest.raises(ValueError):
+            sfile.read()
+        assert sfile.urlio.reconnects > 0
+        assert len(titles) > 0
+        sfile.close()
+        return sfile
+
+def main_test_sync_url_segmented0():
+    with open(SAMPLES_FILEPATHS['sample0'], 'rb') as file:
+        data = file.read()
+    with LocalHTTPServer(SAMPLES_DIRPATH) as server:
+        urlio = URLIO(server.url('sample0.mp3'), connections=4, segment_size=256 * 1024)
+        
+        with Timer() as seek_timer:
+            urlio.seek(len(data) // 2)
+            middle = urlio.read(4096)
+        
+        with Timer() as full_timer:
+            urlio.fulling()
+        urlio.seek(0)
+        
+        logger.rule("START url segmented download test (sync)")
+        logger.debug(f"Middle Read Time (sync): {seek_timer.timing:.3f} second(s)", with_new_line=True)
+        logger.debug(f"Full Download Time (sync): {full_timer.timing:.3f} second(s)")
+        logger.debug(f"Connections: {urlio.connections}, Downloaded: {urlio.downloaded} byte(s)")
+        logger.rule("END url segmented download test (sync)")
+        
+        assert urlio.segmented
+        assert middle == data[len(data) // 2:len(data) // 2 + 4096]
+        assert urlio.read() == data
+        assert urlio.full
+        urlio.close()
+        return urlio
+
+def main_test_sync_url_segment_retry0():
+    with open(SAMPLES_FILEPATHS['sample0'], 'rb') as file:
+        data = file.read()
+    segment_size = 64 * 1024
+    FlakyRangeHTTPRequestHandler.failing = {2 * segment_size}
+    with LocalHTTPServer(SAMPLES_DIRPATH, FlakyRangeHTTPRequestHandler) as server:
+        urlio = URLIO(server.url('sample0.mp3'), connections=2, segment_size=segment_size)
+        urlio.seek(2 * segment_size + 100)
+        try:
+            urlio.read(4096)
+        except OSError as e:
+            error = e
+        else:
+            error = None
+        FlakyRangeHTTPRequestHandler.failing = set()
+        urlio.seek(2 * segment_size + 100)
+        retried = urlio.read(4096)
+        urlio.seek(0)
+        
+        logger.rule("START url segment retry test (sync)")
+        logger.debug(f"Error of the failed segment: {error}", with_new_line=True)
+        logger.rule("END url segment retry test (sync)")
+        
+        assert urlio.segmented and isinstance(error, OSError) and ("segment 2 " in str(error))
+        assert retried == data[2 * segment_size + 100:2 * segment_size + 4196]
+        assert urlio.read() == data
+        urlio.close()
+        return urlio
+
+# ! Tests
+def test_async_url_read0():
+    assert isinstance(asyncio.run(main_test_async_url_read0()), AsyncURLAudioSource)
+
+def test_async_url_loop_read0():
+    assert isinstance(asyncio.run(main_test_async_url_loop_read0()), AsyncURLIO)
+
+def test_sync_url_metadata0():
+    assert isinstance(main_test_sync_url_metadata0(), URLAudioSource)
+
+def test_sync_url_live0():
+    assert isinstance(main_test_sync_url_live0(), URLAudioSource)
+
+def test_sync_url_segmented0():
+    assert isinstance(main_test_sync_url_segmented0(), URLIO)
+
+def test_sync_url_segment_retry0():
+    assert isinstance(main_test_sync_url_segment_retry0(), URLIO)
\ No newline at end of file
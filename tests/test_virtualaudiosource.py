@@ -0,0 +1,55 @@
+import pytest
+# * Required Imports
+import numpy as np
+# * Local Imports (for tests)
+from .libs import *
+# * Main Imports (tested)
+from seaplayer_audio import FileAudioSource, SliceAudioSource, ConcatAudioSource, LoopAudioSource
+
+# ! Methods for Tests
+def main_test_virtual_sources0():
+    source = FileAudioSource(SAMPLES_FILEPATHS['sample0'])
+    data = source.read(always_2d=True)
+    rate = source.samplerate
+    
+    with Timer() as slice_timer:
+        first = SliceAudioSource(source, 1 * rate, 3 * rate)
+        second = SliceAudioSource(source, 10 * rate, 11 * rate)
+        sliced = first.read()
+    
+    with Timer() as concat_timer:
+        concat = ConcatAudioSource([first, second, first])
+        concat.seek(first.frames - 100)
+        joined = concat.read(200)
+        concat.seek(0)
+        whole = concat.read()
+    
+    with Timer() as loop_timer:
+        loop = LoopAudioSource(second, count=3)
+        looped = loop.read()
+        endless = LoopAudioSource(source, 0, rate)
+        endless.seek(5 * rate + 10)
+        tail = endless.read(rate)
+    
+    logger.rule("START virtual sources test (sync)")
+    logger.debug(f"Slice Read Time (sync): {slice_timer.timing:.3f} second(s)", with_new_line=True)
+    logger.debug(f"Concat Read Time (sync): {concat_timer.timing:.3f} second(s)")
+    logger.debug(f"Loop Read Time (sync): {loop_timer.timing:.3f} second(s)")
+    logger.debug(f"Object: {concat}")
+    logger.rule("END virtual sources test (sync)")
+    
+    assert (first.frames, first.duration) == (2 * rate, 2.0)
+    assert np.array_equal(sliced, data[1 * rate:3 * rate])
+    assert concat.frames == first.frames * 2 + second.frames
+    assert np.array_equal(joined, np.concatenate([data[3 * rate - 100:3 * rate], data[10 * rate:10 * rate + 100]]))
+    assert np.array_equal(whole, np.concatenate([data[rate:3 * rate], data[10 * rate:11 * rate], data[rate:3 * rate]]))
+    assert (loop.frames, loop.duration) == (3 * rate, 3.0)
+    assert np.array_equal(looped, np.concatenate([data[10 * rate:11 * rate]] * 3))
+    assert (endless.frames, endless.iteration) == (-1, 6)
+    assert np.array_equal(tail, np.concatenate([data[10:rate], data[:10]]))
+    source.close()
+    return concat
+
+# ! Tests
+def test_virtual_sources0():
+    assert isinstance(main_test_virtual_sources0(), ConcatAudioSource)
\ No newline at end of file